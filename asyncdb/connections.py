@@ -1,8 +1,9 @@
 from typing import TypeVar, Type
+from functools import partial
 import logging
 from .exceptions import DriverError
 from .interfaces.abstract import AbstractDriver
-from .utils.modules import module_exists
+from .utils.modules import load_driver
 from .utils import install_uvloop
 
 
@@ -15,13 +16,18 @@ class AsyncPool:
     AsyncPool.
     Base class for Asyncio-based DB Pools.
     Factory interface for Pool-based connectors.
+    Drivers without a native pool use the generic DriverPool.
     """
 
     def __new__(cls: Type[T_aobj], driver: str = "dummy", **kwargs) -> AbstractDriver:
-        classpath = f"asyncdb.drivers.{driver}"
         pool = f"{driver}Pool"
         try:
-            mdl = module_exists(pool, classpath)
+            try:
+                mdl = load_driver(driver, "Pool")
+            except AttributeError:
+                # no native pool: generic pool of driver connections.
+                from .drivers.pool import DriverPool  # pylint: disable=C0415
+                mdl = partial(DriverPool, driver)
             return mdl(**kwargs)
         except Exception as err:
             logging.exception(err)
@@ -35,9 +41,8 @@ class AsyncDB:
     """
 
     def __new__(cls: Type[T_aobj], driver: str = "dummy", **kwargs) -> AbstractDriver:
-        classpath = f"asyncdb.drivers.{driver}"
         try:
-            mdl = module_exists(driver, classpath)
+            mdl = load_driver(driver)
             return mdl(**kwargs)
         except Exception as err:
             logging.exception(err)
@@ -53,8 +58,7 @@ def asyncdb(driver: str = "pg", *args, **kwargs) -> T_aobj:
     if credentials:
         kwargs["params"] = credentials
     # Create the Driver Instance
-    clspath = f"asyncdb.drivers.{driver}"
-    mdl = module_exists(driver, clspath)
+    mdl = load_driver(driver)
     factory = mdl(*args, **kwargs)
     # Get the connection
     return factory.connection_context()
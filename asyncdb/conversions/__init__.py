@@ -0,0 +1,50 @@
+from typing import Any, List
+from pyarrow import Table
+from .pgrecords import to_arrow as records_to_arrow, to_record_batch
+try:
+    import rst_convert
+except ImportError:
+    rst_convert = None
+
+
+def to_dict(records: List[Any]) -> List[dict]:
+    """
+    Convert asyncpg.Record to a list of dictionaries.
+
+    Args:
+
+    records: List[Record] - List of asyncpg.Record objects.
+
+    Returns:
+
+    dict - List of dictionaries.
+    """
+    if rst_convert is None:
+        return [dict(record) for record in records]
+    return rst_convert.todict(records)
+
+
+def to_arrow(records: List[Any], attributes: list = None) -> Table:
+    """
+    Convert asyncpg.Record to an Arrow Table.
+
+    Columns are built directly from the records (no intermediate dict per row),
+    typed using the type OIDs of the prepared statement attributes if provided.
+
+    Args:
+
+    records: List[Record] - List of asyncpg.Record objects.
+    attributes: list - Optional, result of PreparedStatement.get_attributes().
+
+    Returns:
+
+    Table - Arrow Table.
+    """
+    return records_to_arrow(records, attributes)
+
+
+__all__ = (
+    "to_dict",
+    "to_arrow",
+    "to_record_batch",
+)
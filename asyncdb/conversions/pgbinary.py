@@ -0,0 +1,362 @@
+"""
+PostgreSQL Binary COPY.
+
+Incremental decoder for the output of ``COPY ... TO STDOUT (FORMAT binary)``,
+building fixed-schema Arrow RecordBatches without any text round-trip.
+"""
+from typing import Any, Optional
+from collections.abc import Callable, Sequence
+import struct
+import uuid
+import decimal
+import pyarrow as pa
+from .pgrecords import PG_ARROW_TYPES
+
+
+COPY_SIGNATURE = b"PGCOPY\n\377\r\n\0"
+# signature + flags (int32) + header extension length (int32)
+COPY_HEADER_SIZE = len(COPY_SIGNATURE) + 8
+
+# PostgreSQL epoch (2000-01-01) expressed in Unix epoch units.
+PG_EPOCH_DAYS = 10957
+PG_EPOCH_MICROSECONDS = PG_EPOCH_DAYS * 86400 * 1000000
+DAY_MICROSECONDS = 86400 * 1000000
+
+_int16 = struct.Struct("!h")
+_int32 = struct.Struct("!i")
+_uint32 = struct.Struct("!I")
+_int64 = struct.Struct("!q")
+_float4 = struct.Struct("!f")
+_float8 = struct.Struct("!d")
+_interval = struct.Struct("!qii")
+_numeric_header = struct.Struct("!hhhh")
+
+_decimal_context = decimal.Context(prec=1000)
+
+NUMERIC_NEGATIVE = 0x4000
+NUMERIC_NAN = 0xC000
+NUMERIC_PINF = 0xD000
+NUMERIC_NINF = 0xF000
+
+TEXT_OID = 25
+NUMERIC_OID = 1700
+# numeric typmod: ((precision << 16) | scale) + VARHDRSZ
+NUMERIC_TYPMOD_OFFSET = 4
+
+
+def _text(buf, pos: int, size: int) -> str:
+    return buf[pos:pos + size].decode("utf-8")
+
+
+def _bytea(buf, pos: int, size: int) -> bytes:
+    return bytes(buf[pos:pos + size])
+
+
+def _bool(buf, pos: int, size: int) -> bool:
+    return buf[pos] != 0
+
+
+def _int2(buf, pos: int, size: int) -> int:
+    return _int16.unpack_from(buf, pos)[0]
+
+
+def _int4(buf, pos: int, size: int) -> int:
+    return _int32.unpack_from(buf, pos)[0]
+
+
+def _int8(buf, pos: int, size: int) -> int:
+    return _int64.unpack_from(buf, pos)[0]
+
+
+def _oid(buf, pos: int, size: int) -> int:
+    return _uint32.unpack_from(buf, pos)[0]
+
+
+def _float4_(buf, pos: int, size: int) -> float:
+    return _float4.unpack_from(buf, pos)[0]
+
+
+def _float8_(buf, pos: int, size: int) -> float:
+    return _float8.unpack_from(buf, pos)[0]
+
+
+def _date(buf, pos: int, size: int) -> int:
+    # days since Unix epoch (date32)
+    return _int32.unpack_from(buf, pos)[0] + PG_EPOCH_DAYS
+
+
+def _timestamp(buf, pos: int, size: int) -> int:
+    # microseconds since Unix epoch
+    return _int64.unpack_from(buf, pos)[0] + PG_EPOCH_MICROSECONDS
+
+
+def _interval_(buf, pos: int, size: int) -> int:
+    microseconds, days, months = _interval.unpack_from(buf, pos)
+    return microseconds + (days + months * 30) * DAY_MICROSECONDS
+
+
+def _uuid(buf, pos: int, size: int) -> str:
+    return str(uuid.UUID(bytes=bytes(buf[pos:pos + 16])))
+
+
+def _jsonb(buf, pos: int, size: int) -> str:
+    # first byte is the jsonb format version.
+    return buf[pos + 1:pos + size].decode("utf-8")
+
+
+def _numeric(buf, pos: int, size: int) -> decimal.Decimal:
+    ndigits, weight, sign, dscale = _numeric_header.unpack_from(buf, pos)
+    sign &= 0xFFFF
+    if sign == NUMERIC_NAN:
+        return decimal.Decimal("NaN")
+    elif sign == NUMERIC_PINF:
+        return decimal.Decimal("Infinity")
+    elif sign == NUMERIC_NINF:
+        return decimal.Decimal("-Infinity")
+    digits = struct.unpack_from(f"!{ndigits}h", buf, pos + 8) if ndigits else ()
+    unscaled = 0
+    for digit in digits:
+        unscaled = unscaled * 10000 + digit
+    value = decimal.Decimal(unscaled).scaleb((weight - ndigits + 1) * 4, context=_decimal_context)
+    if sign == NUMERIC_NEGATIVE:
+        value = -value
+    return value.quantize(decimal.Decimal(1).scaleb(-dscale), context=_decimal_context)
+
+
+def _numeric_float(buf, pos: int, size: int) -> float:
+    return float(_numeric(buf, pos, size))
+
+
+def _numeric_text(buf, pos: int, size: int) -> str:
+    return str(_numeric(buf, pos, size))
+
+
+def _numeric_decimal(buf, pos: int, size: int) -> Optional[decimal.Decimal]:
+    # Arrow decimals have no NaN: stored as null.
+    value = _numeric(buf, pos, size)
+    return None if value.is_nan() else value
+
+
+def numeric_type(typmod: int) -> Optional[pa.DataType]:
+    """numeric_type.
+
+    Arrow decimal type of a numeric(precision, scale) type modifier,
+    None for an unconstrained numeric (typmod -1).
+    """
+    if typmod is None or typmod < NUMERIC_TYPMOD_OFFSET:
+        return None
+    typmod -= NUMERIC_TYPMOD_OFFSET
+    precision = (typmod >> 16) & 0xFFFF
+    scale = typmod & 0xFFFF
+    if scale > precision:
+        # negative scales (PostgreSQL 15+) are not supported by Arrow.
+        return None
+    if precision <= 38:
+        return pa.decimal128(precision, scale)
+    return pa.decimal256(precision, scale)
+
+
+# type OID -> (decoder, arrow type).
+BINARY_DECODERS: dict[int, tuple[Callable, Optional[pa.DataType]]] = {
+    16: (_bool, pa.bool_()),
+    17: (_bytea, pa.binary()),
+    18: (_text, pa.string()),
+    19: (_text, pa.string()),
+    20: (_int8, pa.int64()),
+    21: (_int2, pa.int16()),
+    23: (_int4, pa.int32()),
+    25: (_text, pa.string()),
+    26: (_oid, pa.int64()),
+    114: (_text, pa.string()),
+    700: (_float4_, pa.float32()),
+    701: (_float8_, pa.float64()),
+    1042: (_text, pa.string()),
+    1043: (_text, pa.string()),
+    1082: (_date, PG_ARROW_TYPES[1082]),
+    1083: (_int8, PG_ARROW_TYPES[1083]),
+    1114: (_timestamp, PG_ARROW_TYPES[1114]),
+    1184: (_timestamp, PG_ARROW_TYPES[1184]),
+    1186: (_interval_, PG_ARROW_TYPES[1186]),
+    1700: (_numeric_text, pa.string()),
+    2950: (_uuid, pa.string()),
+    3802: (_jsonb, pa.string()),
+}
+
+
+def quote_ident(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def binary_copy_query(query: str, attributes: Sequence) -> tuple[str, list[tuple[str, int]]]:
+    """binary_copy_query.
+
+    Returns the query to be used on a binary COPY and its columns (name, type OID).
+    Columns without a binary decoder (arrays, enums, network types, ...)
+    are cast to text by wrapping the original query.
+    """
+    columns = []
+    casts = []
+    for attr in attributes:
+        oid = attr.type.oid
+        if oid in BINARY_DECODERS:
+            columns.append((attr.name, oid))
+            casts.append(quote_ident(attr.name))
+        else:
+            columns.append((attr.name, TEXT_OID))
+            casts.append(f"{quote_ident(attr.name)}::text")
+    if all(oid == attr.type.oid for (_, oid), attr in zip(columns, attributes)):
+        return query, columns
+    names = [name for name, _ in columns]
+    if len(set(names)) != len(names):
+        raise ValueError(
+            "Binary COPY: columns without a binary decoder require unique column names"
+        )
+    query = query.strip().rstrip(";")
+    return f"SELECT {', '.join(casts)} FROM ({query}) AS _binary_copy", columns
+
+
+class BinaryCopyDecoder:
+    """BinaryCopyDecoder.
+
+    Decodes chunks of a PostgreSQL binary COPY stream (as received from
+    ``copy_from_query(..., format='binary')``) into Arrow RecordBatches
+    of ``batch_size`` rows with a fixed schema.
+
+    Columns are (name, type OID) or (name, type OID, typmod) tuples. The
+    schema is known before the first row: a numeric with a typmod is a
+    decimal of its precision and scale (NaN as null), an unconstrained
+    numeric is decoded as exact text (NaN and Infinity included),
+    or as float64 with ``numeric_as_float``.
+
+    Usage:
+        decoder = BinaryCopyDecoder(columns, batch_size=10000)
+        for batch in decoder.feed(chunk): ...
+        last = decoder.flush()
+    """
+
+    def __init__(
+        self,
+        columns: Sequence[tuple[str, int]],
+        batch_size: int = 10000,
+        numeric_as_float: bool = False
+    ):
+        self.batch_size = batch_size
+        self._names = [column[0] for column in columns]
+        self._decoders = []
+        self._types = []
+        for column in columns:
+            oid = column[1]
+            try:
+                decoder, datatype = BINARY_DECODERS[oid]
+            except KeyError as e:
+                raise ValueError(f"Binary COPY: no decoder for type OID {oid}") from e
+            if oid == NUMERIC_OID:
+                if numeric_as_float:
+                    decoder, datatype = _numeric_float, pa.float64()
+                elif len(column) > 2 and (dectype := numeric_type(column[2])) is not None:
+                    decoder, datatype = _numeric_decimal, dectype
+            self._decoders.append(decoder)
+            self._types.append(datatype)
+        self._ncols = len(columns)
+        self._buffer = bytearray()
+        self._header = False
+        self._values: list[list[Any]] = [[] for _ in range(self._ncols)]
+        self._rows: int = 0
+        self.finished: bool = False
+        self.total_rows: int = 0
+
+    @property
+    def schema(self) -> pa.Schema:
+        return pa.schema(
+            [pa.field(name, dtype) for name, dtype in zip(self._names, self._types)]
+        )
+
+    def _read_header(self) -> bool:
+        buf = self._buffer
+        if len(buf) < COPY_HEADER_SIZE:
+            return False
+        if bytes(buf[:len(COPY_SIGNATURE)]) != COPY_SIGNATURE:
+            raise ValueError("Binary COPY: invalid stream signature")
+        extension = _int32.unpack_from(buf, len(COPY_SIGNATURE) + 4)[0]
+        if len(buf) < COPY_HEADER_SIZE + extension:
+            return False
+        del buf[:COPY_HEADER_SIZE + extension]
+        self._header = True
+        return True
+
+    def feed(self, chunk: bytes) -> list[pa.RecordBatch]:
+        """feed.
+
+        Consume a chunk of the COPY stream, returning the completed batches.
+        Incomplete tuples are kept until the next chunk.
+        """
+        batches = []
+        buf = self._buffer
+        buf.extend(chunk)
+        if not self._header and not self._read_header():
+            return batches
+        values = self._values
+        decoders = self._decoders
+        ncols = self._ncols
+        size = len(buf)
+        pos = 0
+        while pos + 2 <= size:
+            nfields = _int16.unpack_from(buf, pos)[0]
+            if nfields == -1:
+                # file trailer
+                self.finished = True
+                pos += 2
+                break
+            if nfields != ncols:
+                raise ValueError(
+                    f"Binary COPY: expected {ncols} fields, got {nfields}"
+                )
+            field = pos + 2
+            row = []
+            complete = True
+            for decoder in decoders:
+                if field + 4 > size:
+                    complete = False
+                    break
+                length = _int32.unpack_from(buf, field)[0]
+                field += 4
+                if length == -1:
+                    row.append(None)
+                    continue
+                if field + length > size:
+                    complete = False
+                    break
+                row.append(decoder(buf, field, length))
+                field += length
+            if not complete:
+                # wait for the rest of the tuple.
+                break
+            for column, value in zip(values, row):
+                column.append(value)
+            pos = field
+            self._rows += 1
+            if self._rows >= self.batch_size:
+                batches.append(self._build())
+                values = self._values
+        if pos:
+            del buf[:pos]
+        return batches
+
+    def _build(self) -> pa.RecordBatch:
+        arrays = [
+            pa.array(column, type=datatype) for column, datatype in zip(self._values, self._types)
+        ]
+        batch = pa.RecordBatch.from_arrays(arrays, schema=self.schema)
+        self.total_rows += self._rows
+        self._values = [[] for _ in range(self._ncols)]
+        self._rows = 0
+        return batch
+
+    def flush(self) -> Optional[pa.RecordBatch]:
+        """flush.
+
+        Returns the last (incomplete) batch, if any rows are pending.
+        """
+        if self._rows == 0:
+            return None
+        return self._build()
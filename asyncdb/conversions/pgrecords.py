@@ -1,36 +1,169 @@
-from typing import List
-from asyncpg import Record
-from pyarrow import Table
-import rst_convert
-# from .rst_convert import todict, toarrow
+"""
+PostgreSQL Records.
 
-def to_dict(records: List[Record]) -> List[dict]:
-    """
-    Convert asyncpg.Record to a list of dictionaries.
+Columnar conversion of asyncpg Records into Apache Arrow,
+using the type OIDs from a prepared statement (``stmt.get_attributes()``).
+"""
+from typing import Any, Optional
+from collections.abc import Sequence
+import pyarrow as pa
+from ..utils.encoders import json_encoder
+from ..drivers.outputs.base import column_names
 
-    Args:
 
-    records: List[Record] - List of asyncpg.Record objects.
+# PostgreSQL type OID -> Arrow type.
+PG_ARROW_TYPES: dict = {
+    16: pa.bool_(),  # bool
+    17: pa.binary(),  # bytea
+    18: pa.string(),  # char
+    19: pa.string(),  # name
+    20: pa.int64(),  # int8
+    21: pa.int16(),  # int2
+    23: pa.int32(),  # int4
+    25: pa.string(),  # text
+    26: pa.int64(),  # oid
+    700: pa.float32(),  # float4
+    701: pa.float64(),  # float8
+    1042: pa.string(),  # bpchar
+    1043: pa.string(),  # varchar
+    1082: pa.date32(),  # date
+    1083: pa.time64("us"),  # time
+    1114: pa.timestamp("us"),  # timestamp
+    1184: pa.timestamp("us", tz="UTC"),  # timestamptz
+    1186: pa.duration("us"),  # interval
+}
 
-    Returns:
+# Types with no Arrow counterpart, stored as text.
+PG_TEXT_TYPES: set = {
+    114,  # json
+    3802,  # jsonb
+    2950,  # uuid
+    869,  # inet
+    650,  # cidr
+    790,  # money
+}
+
+PG_JSON_TYPES: set = {114, 3802}
+
+
+def arrow_type(attribute: Any) -> Optional[pa.DataType]:
+    """arrow_type.
 
-    dict - List of dictionaries.
+    Returns the Arrow type for an asyncpg Attribute,
+    None when the type must be inferred from values (numeric, arrays, ...).
     """
-    return rst_convert.todict(records)
+    oid = attribute.type.oid
+    if oid in PG_TEXT_TYPES:
+        return pa.string()
+    return PG_ARROW_TYPES.get(oid, None)
 
 
-def to_arrow(records: List[Record]) -> Table:
+def arrow_schema(attributes: Sequence) -> pa.Schema:
+    """arrow_schema.
+
+    Build an Arrow Schema from asyncpg Attributes,
+    inferred types (numeric, arrays) are declared as strings.
     """
-    Convert asyncpg.Record to Arrow IPC format.
+    return pa.schema(
+        [pa.field(a.name, arrow_type(a) or pa.string()) for a in attributes]
+    )
 
-    This function converts the asyncpg.Record to a list of dictionaries and then to Arrow IPC format.
 
-    Args:
+def _to_text(values: Sequence, oid: int = None) -> list:
+    if oid in PG_JSON_TYPES:
+        return [None if v is None else json_encoder(v) for v in values]
+    return [None if v is None else str(v) for v in values]
+
 
-    records: List[Record] - List of asyncpg.Record objects.
+def to_array(values: Sequence, attribute: Any = None) -> pa.Array:
+    """to_array.
+
+    Convert a column of values into a typed Arrow Array.
+    Falls back to type inference, then to text, if values don't match.
+    """
+    datatype = None
+    oid = None
+    if attribute is not None and hasattr(attribute, "type"):
+        oid = attribute.type.oid
+        datatype = arrow_type(attribute)
+        if oid in PG_TEXT_TYPES:
+            return pa.array(_to_text(values, oid), type=datatype)
+    try:
+        return pa.array(values, type=datatype)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError, ValueError, OverflowError):
+        pass
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError, ValueError, OverflowError):
+        return pa.array(_to_text(values, oid), type=pa.string())
 
+
+def to_record_batch(
+    records: Sequence,
+    attributes: Optional[Sequence] = None,
+    schema: Optional[pa.Schema] = None
+) -> pa.RecordBatch:
+    """to_record_batch.
+
+    Convert a list of asyncpg Records (or any sequence of rows: dicts,
+    sqlite Rows, tuples) into an Arrow RecordBatch, building one typed
+    column at a time (no intermediate dict per row).
+
+    Args:
+        records: list of asyncpg.Record objects.
+        attributes: optional list of asyncpg Attributes (stmt.get_attributes()),
+            used to choose the Arrow type of every column, or a DB-API
+            cursor description (column names only).
+        schema: optional Arrow Schema of the batch (ex: the schema of a file
+            already written), its text columns take the text of the values.
     Returns:
+        pa.RecordBatch
+    """
+    # asyncpg Attributes are typed, a DB-API description gives the names only.
+    typed = bool(attributes) and all(hasattr(a, "type") for a in attributes)
+    if not records:
+        if typed:
+            return pa.RecordBatch.from_pylist([], schema=arrow_schema(attributes))
+        names = column_names(records, attributes)
+        return pa.RecordBatch.from_arrays([pa.array([], type=pa.null()) for _ in names], names=names)
+    if attributes and len(attributes) != len(records[0]):
+        # attributes belong to another statement.
+        attributes = None
+        typed = False
+    names = column_names(records, attributes)
+    if isinstance(records[0], dict):
+        columns = [[row[name] for row in records] for name in names]
+    else:
+        # transpose rows into columns (Records iterate over their values).
+        columns = list(zip(*records))
+    if not typed:
+        attributes = [None] * len(columns)
+    if schema is not None:
+        arrays = [
+            pa.array(_to_text(col, attr.type.oid if attr is not None else None), type=pa.string())
+            if pa.types.is_string(field.type) else to_array(col, attr)
+            for col, attr, field in zip(columns, attributes, schema)
+        ]
+    else:
+        arrays = [to_array(col, attr) for col, attr in zip(columns, attributes)]
+    return pa.RecordBatch.from_arrays(arrays, names=names)
 
-    Arrow - Arrow IPC format.
+
+def to_arrow(
+    records: Sequence,
+    attributes: Optional[Sequence] = None,
+    schema: Optional[pa.Schema] = None
+) -> pa.Table:
+    """to_arrow.
+
+    Convert a list of asyncpg.Record (or any rows, see to_record_batch) into an Arrow Table.
+
+    Args:
+        records: list of asyncpg.Record objects.
+        attributes: optional list of asyncpg Attributes (stmt.get_attributes())
+            or DB-API cursor description.
+        schema: optional Arrow Schema of the table (see to_record_batch).
+    Returns:
+        pa.Table
     """
-    return rst_convert.toarrow(records)
+    return pa.Table.from_batches([to_record_batch(records, attributes, schema)])
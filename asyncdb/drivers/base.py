@@ -6,11 +6,12 @@ from abc import (
     ABC,
     abstractmethod,
 )
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 import traceback
 import contextlib
 from ..exceptions import EmptyStatement
 from ..interfaces import PoolBackend, ConnectionDSNBackend, ConnectionBackend, DatabaseBackend
+from ..utils.tracing import get_tracer
 from .outputs import OutputFactory
 
 
@@ -43,15 +44,27 @@ class InitDriver(ConnectionBackend, DatabaseBackend, ABC):
     def __init__(self, loop: Union[asyncio.AbstractEventLoop, None] = None, params: Union[dict, None] = None, **kwargs):
         if params is None:
             params = kwargs.get("credentials", {})
+        # opt-in result cache (asyncdb.utils.cache.QueryCache)
+        cache = kwargs.pop("cache", None)
+        # opt-in tracing (asyncdb.utils.tracing.Tracer)
+        tracer = kwargs.pop("tracer", None) or get_tracer()
         self._max_connections = 4
         self._parameters = ()
         # noinspection PyTypeChecker
         self._serializer: OutputFactory = None
+        # plain function called instead of the serializer (OutputFactory.fast_path)
+        self._output_sync: Optional[Callable] = None
         self._row_format = "native"
         super().__init__(loop=loop, params=params, **kwargs)
         self._initialized_on = None
         # always starts output format to native:
         self.output_format("native")
+        self._query_cache = cache
+        if cache is not None:
+            cache.bind(self)
+        self._tracer = None
+        if tracer is not None:
+            tracer.bind(self)
         if self._loop.get_debug():
             self._source_traceback = traceback.extract_stack(sys._getframe(1))
 
@@ -85,8 +98,26 @@ class InitDriver(ConnectionBackend, DatabaseBackend, ABC):
         self._result = result
         return [result, error]
 
+    # native output: drivers return [result, error] without calling it.
+    output.identity = True
+
     def output_format(self, frmt: str = "native", *args, **kwargs):  # pylint: disable=W1113
         self._serializer = OutputFactory(self, frmt=frmt, *args, **kwargs)
+        self._output_sync = OutputFactory.fast_path(self._serializer)
+
+    def _output_for(self, frmt: Optional[str] = None) -> tuple:
+        """_output_for.
+
+        (serializer, fast path) of a call: the driver's output format, or the
+        ``format`` of the call, without changing the driver (a pooled
+        connection can serve concurrent callers expecting different formats).
+        """
+        if frmt is None:
+            return self._serializer, self._output_sync
+        serializer, output = OutputFactory.shared(self, frmt)
+        if self._tracer is not None:
+            return self._tracer.timed(serializer, output)
+        return serializer, output
 
     async def valid_operation(self, sentence: Any):
         """
@@ -124,6 +155,9 @@ class BaseDriver(InitDriver, ConnectionDSNBackend, ABC):
         if pool:
             self._pool = pool
             self._loop = self._pool.get_loop()
+            # connections of a traced pool:
+            if self._tracer is None and (tracer := getattr(pool, "_tracer", None)) is not None:
+                tracer.bind(self)
 
 
 class BaseDBDriver(BaseDriver):
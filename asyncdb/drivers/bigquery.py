@@ -7,6 +7,7 @@ import re
 from pathlib import Path, PurePath
 from dataclasses import is_dataclass
 import asyncio
+from functools import partial
 import aiofiles
 import pandas_gbq
 import pandas as pd
@@ -17,14 +18,71 @@ from google.cloud import bigquery as bq
 from google.cloud.exceptions import Conflict, NotFound
 from google.cloud.bigquery import LoadJobConfig, SourceFormat
 from google.oauth2 import service_account
-from .sql import SQLDriver
+from .sql import SQLCursor, SQLDriver
 from ..exceptions import DriverError
+from ..interfaces.cursors import DBCursorBackend
 from ..interfaces.model import ModelBackend
 from ..models import Model
 from ..utils.types import Entity
+from ..utils.executors import run_blocking
 
 
-class bigquery(SQLDriver, ModelBackend):
+class bigqueryCursor(SQLCursor):
+    """
+    Cursor over the result pages of a BigQuery query job.
+    """
+
+    _provider: "bigquery"
+
+    async def __aenter__(self) -> "bigqueryCursor":
+        self._cursor = self._provider._fetch_batches(
+            self._sentence, self._params, self._kwargs.get("page_size", 1000)
+        )
+        self._rows = iter(())
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self._cursor.aclose()
+        return await super().__aexit__(exc_type, exc_val, exc_tb)
+
+    async def __anext__(self):
+        row = await self.fetch_one()
+        if row is not None:
+            return row
+        else:
+            raise StopAsyncIteration
+
+    ### Cursor Methods.
+    async def fetch_one(self) -> Optional[Any]:
+        while (row := next(self._rows, None)) is None:
+            try:
+                self._rows = iter(await self._cursor.__anext__())
+            except StopAsyncIteration:
+                return None
+        return row
+
+    async def fetch_many(self, size: int = None) -> Iterable[Any]:
+        rows = []
+        while (size is None or len(rows) < size) and (row := await self.fetch_one()) is not None:
+            rows.append(row)
+        return rows
+
+    async def fetch_all(self) -> Iterable[Any]:
+        return await self.fetch_many()
+
+
+class bigquery(SQLDriver, ModelBackend, DBCursorBackend):
+    """bigquery.
+
+    Client calls are blocking: job submission and result polling run on the
+    shared "bigquery" executor (asyncdb.utils.executors), so concurrent
+    queries do not serialize on the event loop.
+    A job running longer than ``timeout`` seconds (driver argument, or
+    ``timeout=`` on query) is cancelled.
+    Large results can be streamed by pages (or Arrow record batches, using
+    the BigQuery Storage Read API when installed) with ``stream()``.
+    """
+
     _provider = "bigquery"
     _syntax = "sql"
     _test_query = "SELECT 1"
@@ -41,6 +99,10 @@ class bigquery(SQLDriver, ModelBackend):
         self._dsn = ""
         self._project_id = params.get("project_id")
         super().__init__(dsn=dsn, loop=loop, params=params, **kwargs)
+        DBCursorBackend.__init__(self)
+        self._query_timeout: Optional[float] = kwargs.get("timeout", None)
+        self._executor = self.get_executor("bigquery")
+        self._bqstorage = None
         if not self._credentials:
             self._account = os.environ.get("GOOGLE_APPLICATION_CREDENTIALS", None)
         if self._account is None and self._credentials is None:
@@ -71,6 +133,37 @@ class bigquery(SQLDriver, ModelBackend):
         # BigQuery client does not maintain persistent connections, so nothing to close here.
         self._connected = False
         self._connection = None
+        self._bqstorage = None
+
+    async def _run(self, fn, *args, **kwargs) -> Any:
+        """Runs a blocking client call on the executor."""
+        return await run_blocking(fn, *args, executor=self._executor, driver=self._provider, **kwargs)
+
+    async def _job_result(self, job: Any, *args, timeout: Optional[float] = None, **kwargs) -> Any:
+        """_job_result.
+
+        Waits for a job on the executor, the job is cancelled on timeout or cancellation.
+        """
+        if timeout is None:
+            timeout = self._query_timeout
+        try:
+            return await run_blocking(
+                job.result,
+                *args,
+                executor=self._executor,
+                driver=self._provider,
+                timeout=timeout,
+                interrupt=partial(self._executor.submit, job.cancel),
+                **kwargs
+            )
+        except asyncio.TimeoutError as err:
+            raise DriverError(f"BigQuery: job {job.job_id} cancelled after {timeout} seconds") from err
+
+    def _storage_client(self) -> Any:
+        """BigQuery Storage Read API client (None when google-cloud-bigquery-storage is not installed)."""
+        if self._bqstorage is None:
+            self._bqstorage = self._connection._ensure_bqstorage_client()  # pylint: disable=W0212
+        return self._bqstorage
 
     async def execute(self, query, **kwargs):
         """
@@ -81,8 +174,8 @@ class bigquery(SQLDriver, ModelBackend):
         if not self._connection:
             await self.connection()
         try:
-            job = self._connection.query(query, **kwargs)
-            result = job.result()  # Waits for the query to finish
+            job = await self._run(self._connection.query, query, **kwargs)
+            result = await self._job_result(job)  # Waits for the query to finish
         except Exception as e:
             error = e
         return result, error
@@ -96,8 +189,8 @@ class bigquery(SQLDriver, ModelBackend):
         if not self._connection:
             await self.connection()
         try:
-            job = self._connection.query(query, **kwargs)
-            result = job.result()  # Waits for the query to finish
+            job = await self._run(self._connection.query, query, **kwargs)
+            result = await self._job_result(job)  # Waits for the query to finish
         except Exception as e:
             error = e
         return result, error
@@ -120,7 +213,7 @@ class bigquery(SQLDriver, ModelBackend):
         try:
             dataset_ref = bq.DatasetReference(self._connection.project, dataset_id)
             dataset_obj = bq.Dataset(dataset_ref)
-            dataset_obj = self._connection.create_dataset(dataset_obj)
+            dataset_obj = await self._run(self._connection.create_dataset, dataset_obj)
             return dataset_obj
         except Conflict:
             self._logger.warning(f"Dataset {self._connection.project}.{dataset_obj.dataset_id} already exists")
@@ -134,7 +227,7 @@ class bigquery(SQLDriver, ModelBackend):
     async def drop_dataset(self, dataset_id: str):
         try:
             dataset_ref = bq.DatasetReference(self._connection.project, dataset_id)
-            self._connection.delete_dataset(dataset_ref, delete_contents=True, not_found_ok=True)
+            await self._run(self._connection.delete_dataset, dataset_ref, delete_contents=True, not_found_ok=True)
             return True
         except Exception as exc:
             self._logger.error(f"Error deleting Dataset: {exc}")
@@ -156,7 +249,7 @@ class bigquery(SQLDriver, ModelBackend):
         table_ref = dataset_ref.table(table_id)
         table = bq.Table(table_ref, schema=schema)
         try:
-            table = self._connection.create_table(table)  # API request
+            table = await self._run(self._connection.create_table, table)  # API request
             self._logger.info(f"Created table {table.project}.{table.dataset_id}.{table.table_id}")
             return table
         except Conflict:
@@ -188,7 +281,7 @@ class bigquery(SQLDriver, ModelBackend):
 
             # Ensure the table exists
             try:
-                table = self._connection.get_table(table_ref)
+                table = await self._run(self._connection.get_table, table_ref)
             except NotFound:
                 raise DriverError(
                     f"BigQuery: Table `{dataset_id}.{table_id}` does not exist."
@@ -205,10 +298,10 @@ class bigquery(SQLDriver, ModelBackend):
             query = f"SELECT * FROM `{self._project_id}.{dataset_id}.{table_id}` WHERE FALSE"
 
             self._logger.debug(f"Truncating table with query: {query}")
-            job = self._connection.query(query, job_config=job_config)
+            job = await self._run(self._connection.query, query, job_config=job_config)
 
             # Wait for the job to complete
-            await asyncio.get_event_loop().run_in_executor(None, job.result)
+            await self._job_result(job)
 
             self._logger.info(f"Successfully truncated table `{dataset_id}.{table_id}`.")
             return True
@@ -222,28 +315,52 @@ class bigquery(SQLDriver, ModelBackend):
                 f"BigQuery: Error truncating table `{dataset_id}.{table_id}`: {e}"
             ) from e
 
-    async def query(self, sentence: str, factory: Optional[str] = None, **kwargs):
+    async def query(
+        self,
+        sentence: str,
+        factory: Optional[str] = None,
+        timeout: Optional[float] = None,
+        format: Optional[str] = None,  # pylint: disable=W0622
+        **kwargs
+    ):
+        """query.
+
+        Runs a query, returns its rows (every page is read on the executor,
+        use ``stream()`` for large results), as a DataFrame for the "pandas"
+        format, tuples for "tuple" and an Arrow table for columnar formats.
+
+        ``format`` (or ``factory``) applies only to this call, the output
+        format of the driver is not changed.
+        """
         if not self._connection:
             await self.connection()
         await self.valid_operation(sentence)
         self.start_timing()
-        if factory:
-            self.output_format(factory)
+        factory = format or factory
+        # "tuple" rows are returned as they are.
+        serializer, output = self._output_for("native" if factory == "tuple" else factory)
         error = None
         result = None
         try:
-            job = self._connection.query(sentence, **kwargs)
+            job = await self._run(self._connection.query, sentence, **kwargs)
+            rows = await self._job_result(job, timeout=timeout)
             if factory == 'pandas':
-                result = job.to_dataframe()
+                result = await self._run(rows.to_dataframe, bqstorage_client=self._storage_client())
             elif factory == 'tuple':
-                result = [tuple(row.values()) for row in job]
+                result = await self._run(_tuples, rows)
+            elif factory in ('arrow', 'polars') or getattr(serializer, "columnar", False):
+                result = await self._run(rows.to_arrow, bqstorage_client=self._storage_client())
             else:
-                result = job.result()
-        except Exception as e:
+                # pages are fetched while iterating the RowIterator.
+                result = await self._run(list, rows)
+        except Exception as e:  # pylint: disable=W0703
             error = f"BigQuery: Error executing query: {e}"
-        finally:
-            self.generated_at()
-            return [None, error] if error else await self._serializer(result, error)
+        self.generated_at()
+        if error:
+            return [None, error]
+        if output is not None:
+            return output(result, error)
+        return await serializer(result, error)
 
     async def queryrow(self, sentence: str):
         pass
@@ -263,7 +380,8 @@ class bigquery(SQLDriver, ModelBackend):
         result = None
         try:
             if use_pandas is True:
-                result = pandas_gbq.read_gbq(
+                result = await self._run(
+                    pandas_gbq.read_gbq,
                     sentence,
                     project_id=self._project_id,
                     credentials=self.credentials,
@@ -272,14 +390,36 @@ class bigquery(SQLDriver, ModelBackend):
                     **kwargs,
                 )
             else:
-                result = self._connection.query(sentence, **kwargs).to_dataframe()
-        except Exception as e:
+                job = await self._run(self._connection.query, sentence, **kwargs)
+                rows = await self._job_result(job)
+                result = await self._run(rows.to_dataframe, bqstorage_client=self._storage_client())
+        except Exception as e:  # pylint: disable=W0703
             error = f"BigQuery: Error executing Fetch: {e}"
-        finally:
-            self.generated_at()
-            if error:
-                return [None, error]
-            return (result, error)  # pylint: disable=W0150
+        self.generated_at()
+        if error:
+            return [None, error]
+        return (result, error)
+
+    async def _fetch_batches(self, sentence: str, params: Iterable[Any], batch_size: int, arrow: bool = False):
+        if not self._connection:
+            await self.connection()
+        await self.valid_operation(sentence)
+        job_config = bq.QueryJobConfig(query_parameters=list(params)) if params else None
+        try:
+            job = await self._run(self._connection.query, sentence, job_config=job_config)
+            rows = await self._job_result(job, page_size=batch_size)
+            if arrow:
+                # Storage Read API streams when available, REST pages otherwise.
+                batches = rows.to_arrow_iterable(bqstorage_client=self._storage_client())
+            else:
+                batches = (list(page) for page in rows.pages)
+            while (batch := await self._run(next, batches, None)) is not None:
+                if len(batch):
+                    yield batch
+        except DriverError:
+            raise
+        except Exception as err:
+            raise DriverError(message=f"BigQuery: Error on Stream: {err}") from err
 
     async def fetch_all(self, query, *args):
         """
@@ -384,8 +524,7 @@ class bigquery(SQLDriver, ModelBackend):
                     job = await self._thread_func(
                         self._connection.load_table_from_json, data, table, job_config=job_config, **kwargs
                     )
-                    loop = asyncio.get_event_loop()
-                    await loop.run_in_executor(None, job.result)
+                    await self._job_result(job)
                     if job.errors and len(job.errors) > 0:
                         raise RuntimeError(f"Job failed with errors: {job.errors}")
                     else:
@@ -417,7 +556,7 @@ class bigquery(SQLDriver, ModelBackend):
             job = await self._thread_func(
                 self._connection.load_table_from_uri, source_uri, table, job_config=job_config
             )
-            job.result()  # Waits for table load to complete.
+            await self._job_result(job)  # Waits for table load to complete.
             self._logger.info(f"Loaded {job.output_rows} rows into {table.project}.{table.dataset_id}.{table.table_id}")
             return job
         except Exception as e:
@@ -491,8 +630,8 @@ class bigquery(SQLDriver, ModelBackend):
                 gcs_uri = bucket_uri
             job_config = LoadJobConfig(source_format=SourceFormat.CSV, autodetect=True, **kwargs)
             table = f"{self._project_id}.{dataset_id}.{table_id}"
-            job = self._connection.load_table_from_uri(gcs_uri, table, job_config=job_config)
-            job.result()  # Wait for the job to complete
+            job = await self._run(self._connection.load_table_from_uri, gcs_uri, table, job_config=job_config)
+            await self._job_result(job)  # Wait for the job to complete
             return job
         except Exception as e:
             raise DriverError(f"BigQuery: Error loading from CSV in GCS: {e}")
@@ -506,8 +645,8 @@ class bigquery(SQLDriver, ModelBackend):
         elif not isinstance(file_obj, bytes):
             raise DriverError("BigQuery: Invalid file object")
         try:
-            job = self._connection.load_table_from_file(file_obj, table_id, job_config=job_config)
-            job.result()  # Wait for the job to complete
+            job = await self._run(self._connection.load_table_from_file, file_obj, table_id, job_config=job_config)
+            await self._job_result(job)  # Wait for the job to complete
             return job
         except Exception as e:
             raise DriverError(f"BigQuery: Error loading from CSV: {e}")
@@ -637,17 +776,16 @@ class bigquery(SQLDriver, ModelBackend):
                 source_format=bq.SourceFormat.NEWLINE_DELIMITED_JSON,
             )
             job = await self._thread_func(self._connection.load_table_from_json, [source], table, job_config=job_config)
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, job.result)
+            await self._job_result(job)
             if job.errors and len(job.errors) > 0:
                 raise RuntimeError(f"Error Inserting Data: {job.errors}")
             # get the row inserted again:
             condition = self._where(fields, **_filter)
             _select_stmt = f"SELECT * FROM {table} {condition}"
             self._logger.debug(f"SELECT: {_select_stmt}")
-            job = self._connection.query(_select_stmt)
-            result = job.result()
-            result = next(iter(result))
+            job = await self._run(self._connection.query, _select_stmt)
+            result = await self._job_result(job)
+            result = await self._run(_first, result)
             if result:
                 _model.reset_values()
                 for f, val in result.items():
@@ -688,8 +826,8 @@ class bigquery(SQLDriver, ModelBackend):
                 raise DriverError(f"Avoid DELETE without WHERE conditions: {_filter}")
             _delete = f"DELETE FROM {table} {condition};"
             self._logger.debug(f"DELETE: {_delete}")
-            job = self._connection.query(_delete)
-            job.result()  # Waits for the query to finish
+            job = await self._run(self._connection.query, _delete)
+            await self._job_result(job)  # Waits for the query to finish
             num_deleted_rows = job.num_dml_affected_rows
             return f"DELETE {num_deleted_rows} rows: {_filter!s}"
         except Exception as err:
@@ -834,8 +972,8 @@ class bigquery(SQLDriver, ModelBackend):
             job_config = bq.QueryJobConfig(query_parameters=query_params)
 
             # Execute the query with parameters
-            job = self._connection.query(_update, job_config=job_config)
-            job.result()  # Wait for completion
+            job = await self._run(self._connection.query, _update, job_config=job_config)
+            await self._job_result(job)  # Wait for completion
             num_affected_rows = job.num_dml_affected_rows
             self._logger.info(f"UPDATED rows: {num_affected_rows}")
 
@@ -884,9 +1022,9 @@ class bigquery(SQLDriver, ModelBackend):
             select_config = bq.QueryJobConfig(query_parameters=select_params)
 
             _all = f"SELECT * FROM {table}{select_condition}"
-            job = self._connection.query(_all, job_config=select_config)
-            result = job.result()
-            data = dict(next(iter(result))) if result.total_rows > 0 else {}
+            job = await self._run(self._connection.query, _all, job_config=select_config)
+            result = await self._job_result(job)
+            data = dict(await self._run(_first, result) or {})
             _model.reset_values()
             for f, val in data.items():
                 setattr(_model, f, val)
@@ -927,9 +1065,9 @@ class bigquery(SQLDriver, ModelBackend):
         condition = self._where(fields, **_filter)
         _get = f"SELECT * FROM {table} {condition}"
         try:
-            job = self._connection.query(_get)
-            result = job.result()  # Waits for the query to finish
-            return next(iter(result))
+            job = await self._run(self._connection.query, _get)
+            result = await self._job_result(job)  # Waits for the query to finish
+            return await self._run(_first, result)
         except Exception as e:
             raise DriverError(f"Error: Model Fetch over {table}: {e}") from e
 
@@ -964,9 +1102,9 @@ class bigquery(SQLDriver, ModelBackend):
         condition = self._where(fields, **_filter)
         _get = f"SELECT {columns} FROM {table} {condition}"
         try:
-            job = self._connection.query(_get)
-            result = job.result()  # Waits for the query to finish
-            return [row for row in result]
+            job = await self._run(self._connection.query, _get)
+            result = await self._job_result(job)  # Waits for the query to finish
+            return await self._run(list, result)
         except Exception as e:
             raise DriverError(f"Error: Model GET over {table}: {e}") from e
 
@@ -996,9 +1134,9 @@ class bigquery(SQLDriver, ModelBackend):
             columns = "*"
         _get = f"SELECT {columns} FROM {table} {condition}"
         try:
-            job = self._connection.query(_get)
-            result = job.result()  # Waits for the query to finish
-            return [row for row in result]
+            job = await self._run(self._connection.query, _get)
+            result = await self._job_result(job)  # Waits for the query to finish
+            return await self._run(list, result)
         except Exception as e:
             raise DriverError(f"Error: Model GET over {table}: {e}") from e
 
@@ -1034,9 +1172,9 @@ class bigquery(SQLDriver, ModelBackend):
         _get = f"SELECT {columns} FROM {table} {condition}"
         print("SELECT :: ", _get)
         try:
-            job = self._connection.query(_get)
-            result = job.result()  # Waits for the query to finish
-            return next(iter(result))
+            job = await self._run(self._connection.query, _get)
+            result = await self._job_result(job)  # Waits for the query to finish
+            return await self._run(_first, result)
         except Exception as e:
             raise DriverError(f"Error: Model GET over {table}: {e}") from e
 
@@ -1057,9 +1195,9 @@ class bigquery(SQLDriver, ModelBackend):
             columns = "*"
         _all = f"SELECT {columns} FROM {table}"
         try:
-            job = self._connection.query(_all, **kwargs)
-            result = job.result()  # Waits for the query to finish
-            return [row for row in result]
+            job = await self._run(self._connection.query, _all, **kwargs)
+            result = await self._job_result(job)  # Waits for the query to finish
+            return await self._run(list, result)
         except Exception as e:
             raise DriverError(f"Error: Model All over {table}: {e}") from e
 
@@ -1082,8 +1220,8 @@ class bigquery(SQLDriver, ModelBackend):
         _delete = f"DELETE FROM {table} {condition}"
         try:
             self._logger.debug(f"DELETE: {_delete}")
-            job = self._connection.query(_delete)
-            job.result()  # Waits for the query to finish
+            job = await self._run(self._connection.query, _delete)
+            await self._job_result(job)  # Waits for the query to finish
             num_deleted_rows = job.num_dml_affected_rows
             return f"DELETE {num_deleted_rows} rows: {_filter!s}"
         except Exception as err:
@@ -1203,8 +1341,8 @@ class bigquery(SQLDriver, ModelBackend):
             job_config = bq.QueryJobConfig(query_parameters=query_params)
 
             # Execute the query with parameters
-            job = self._connection.query(_update, job_config=job_config)
-            job.result()  # Wait for completion
+            job = await self._run(self._connection.query, _update, job_config=job_config)
+            await self._job_result(job)  # Wait for completion
             num_affected_rows = job.num_dml_affected_rows
             self._logger.info(f"UPDATED rows: {num_affected_rows}")
 
@@ -1253,8 +1391,8 @@ class bigquery(SQLDriver, ModelBackend):
             select_config = bq.QueryJobConfig(query_parameters=select_params)
 
             _all = f"SELECT * FROM {table}{select_condition}"
-            job = self._connection.query(_all, job_config=select_config)
-            result = job.result()
+            job = await self._run(self._connection.query, _all, job_config=select_config)
+            result = await self._job_result(job)
             return [model(**dict(r)) for r in result]
         except Exception as err:
             raise DriverError(message=f"Error on UPDATE over table {model.Meta.name}: {err!s}") from err
@@ -1304,3 +1442,11 @@ class bigquery(SQLDriver, ModelBackend):
             return f"DELETED: {_filter}"
         except Exception as err:
             raise DriverError(message=f"Error on DELETE over table {model.Meta.name}: {err!s}") from err
+
+
+def _tuples(rows: Iterable) -> list:
+    return [tuple(row.values()) for row in rows]
+
+
+def _first(rows: Iterable) -> Optional[Any]:
+    return next(iter(rows), None)
@@ -4,12 +4,13 @@ Notes on memcache Provider
 --------------------
 This provider implements a simple subset of funcionalities
 over DeltaLake DeltaTable Protocol.
-TODO: add Thread Pool Support.
+Blocking calls (deltalake, duckdb, pyarrow) run on the shared "delta" executor.
 """
 import asyncio
 from collections.abc import Iterable
 import time
 import gc
+from functools import partial
 import duckdb
 from typing import Any, Union, Optional
 from datetime import datetime
@@ -21,10 +22,10 @@ import pyarrow.csv as pcsv
 import pyarrow.dataset as ds
 from pyarrow import fs
 import pandas as pd
-from concurrent.futures import ThreadPoolExecutor
 from deltalake import DeltaTable, write_deltalake
 from deltalake.exceptions import DeltaError, DeltaProtocolError
 from ..exceptions import DriverError
+from ..utils.executors import run_blocking
 from .base import (
     InitDriver,
 )
@@ -42,6 +43,22 @@ class delta(InitDriver):
         self._delta = params.pop("path", None)
         super().__init__(loop=loop, params=params, **kwargs)
         self.kwargs = params
+        self._query_timeout: Optional[float] = kwargs.get("timeout", None)
+        self._executor = self.get_executor("delta")
+
+    async def _blocking(self, fn, *args, timeout: Optional[float] = None, interrupt=None, **kwargs) -> Any:
+        """_blocking.
+
+        Runs a blocking call on the executor, calling interrupt() on timeout or cancellation.
+        """
+        if timeout is None:
+            timeout = self._query_timeout
+        try:
+            return await run_blocking(
+                fn, *args, executor=self._executor, driver=self._provider, timeout=timeout, interrupt=interrupt, **kwargs
+            )
+        except asyncio.TimeoutError as err:
+            raise DriverError(f"DeltaTable: operation interrupted after {timeout} seconds") from err
 
     ### Context magic Methods
     def __enter__(self):
@@ -64,15 +81,7 @@ class delta(InitDriver):
         try:
             if version is not None:
                 self.kwargs["version"] = version
-            if self._delta.startswith("s3:"):
-                raw_fs, normalized_path = fs.FileSystem.from_uri(self._delta)
-                self._filesystem = fs.SubTreeFileSystem(normalized_path, raw_fs)
-                self._connection = DeltaTable(self._delta)
-                self._storage = self._connection.to_pyarrow_dataset(filesystem=self._filesystem)
-            else:
-                self._filesystem = None
-                self._connection = DeltaTable(self._delta, storage_options=self.storage_options, **self.kwargs)
-                self._storage = self._connection.to_pyarrow_dataset()
+            await self._blocking(self._open_table)
         except DeltaError as exc:
             raise DriverError(message=f"{exc}") from exc
         except Exception as err:
@@ -83,6 +92,17 @@ class delta(InitDriver):
             self._initialized_on = time.time()
         return self
 
+    def _open_table(self) -> None:
+        if self._delta.startswith("s3:"):
+            raw_fs, normalized_path = fs.FileSystem.from_uri(self._delta)
+            self._filesystem = fs.SubTreeFileSystem(normalized_path, raw_fs)
+            self._connection = DeltaTable(self._delta)
+            self._storage = self._connection.to_pyarrow_dataset(filesystem=self._filesystem)
+        else:
+            self._filesystem = None
+            self._connection = DeltaTable(self._delta, storage_options=self.storage_options, **self.kwargs)
+            self._storage = self._connection.to_pyarrow_dataset()
+
     async def close(self):  # pylint: disable=W0221,W0236
         """
         Closing DeltaTable Connection
@@ -136,29 +156,33 @@ class delta(InitDriver):
         self, path: Union[str, Path], data: Any, name: Optional[str] = None, mode: str = "append", **kwargs
     ):
         if isinstance(path, str):
-            path = Path(str).resolve()
+            path = Path(path).resolve()
         if isinstance(data, str):
-            data = Path(str).resolve()
-        if isinstance(data, Path):
-            # open this file with Pandas or Arrow
-            ext = data.suffix
-            if ext == ".csv":
-                read_options = pcsv.ReadOptions()
-                parse_options = pcsv.ParseOptions()
-                convert_options = pcsv.ConvertOptions()
-                data = pcsv.read_csv(
-                    data, read_options=read_options, parse_options=parse_options, convert_options=convert_options
-                )
-            elif ext in [".xls", ".xlsx"]:
-                if ext == ".xls":
-                    engine = "xlrd"
-                else:
-                    engine = "openpyxl"
-                data = pd.read_excel(data, engine=engine)
-            elif ext == ".parquet":
-                data = pq.read_table(data)
-        try:
+            data = Path(data).resolve()
+
+        def _create(data):
+            if isinstance(data, Path):
+                # open this file with Pandas or Arrow
+                ext = data.suffix
+                if ext == ".csv":
+                    read_options = pcsv.ReadOptions()
+                    parse_options = pcsv.ParseOptions()
+                    convert_options = pcsv.ConvertOptions()
+                    data = pcsv.read_csv(
+                        data, read_options=read_options, parse_options=parse_options, convert_options=convert_options
+                    )
+                elif ext in [".xls", ".xlsx"]:
+                    if ext == ".xls":
+                        engine = "xlrd"
+                    else:
+                        engine = "openpyxl"
+                    data = pd.read_excel(data, engine=engine)
+                elif ext == ".parquet":
+                    data = pq.read_table(data)
             write_deltalake(path, data, name=name, mode=mode, **kwargs)
+
+        try:
+            await self._blocking(_create, data)
         except DeltaError as exc:
             raise DriverError(f"Delta: can't create a table in path {path}, error: {exc}") from exc
         except Exception as exc:
@@ -187,20 +211,13 @@ class delta(InitDriver):
         Getting Data from Delta using columns and
         partitions.
         """
-        result = None
         args = {}
         if partitions:
             args = {"partitions": partitions}
         if columns:
             args["columns"] = columns
         try:
-            if factory == "pandas":
-                result = self._connection.to_pandas(**args)
-            elif factory == "arrow":
-                result = self._connection.to_pyarrow_table(**args)
-            elif factory == "arrow_dataset":
-                result = self._connection.to_pyarrow_dataset(**args, **kwargs)
-            return result
+            return await self._blocking(self._read_table, factory, args, kwargs)
         except (DeltaError, DeltaProtocolError) as exc:
             raise DriverError(f"DeltaTable Error: {exc}") from exc
         except Exception as exc:
@@ -222,11 +239,16 @@ class delta(InitDriver):
         args = {}
         if partitions:
             args = {"partitions": partitions}
-        try:
+        timeout = kwargs.pop("timeout", None)
+        connections = []
+
+        def _query():
+            result = None
             # connect to an in-memory database
             with duckdb.connect() as con:
+                connections.append(con)
                 dataset = self._connection.to_pyarrow_dataset(**args, **kwargs)
-                ex_data = duckdb.arrow(dataset)
+                ex_data = con.from_arrow(dataset)
                 if sentence and sentence.strip().upper().startswith("SELECT"):
                     # Register the Arrow dataset as a table
                     con.register(tablename, dataset)
@@ -234,7 +256,7 @@ class delta(InitDriver):
                     if factory == "pandas":
                         result = rst.df()
                     elif factory == "polars":
-                        result = rst.df_polars()
+                        result = rst.pl()
                     elif factory == "arrow":
                         result = rst.arrow()
                 else:
@@ -245,12 +267,15 @@ class delta(InitDriver):
                         result = result.pl()
                     elif factory == "arrow":
                         result = result.to_arrow_table()
+            return result
+
+        try:
+            result = await self._blocking(_query, timeout=timeout, interrupt=partial(_interrupt, connections))
         except (DeltaError, DeltaProtocolError) as exc:
             error = exc
-        except Exception as exc:
+        except Exception as exc:  # pylint: disable=W0703
             error = exc
-        finally:
-            return [result, error]  # pylint: disable=W0150
+        return [result, error]
 
     fetch_all = query
 
@@ -266,7 +291,6 @@ class delta(InitDriver):
         Get a single row from Delta using a query (with DuckDB).
         """
         result = None
-        dataset = None
         error = None
         args = {}
         if partitions:
@@ -279,9 +303,13 @@ class delta(InitDriver):
         if "LIMIT" not in sentence.upper():
             sentence = f"{sentence.strip()} LIMIT 1"
 
-        try:
-            rst = None
+        timeout = kwargs.pop("timeout", None)
+        connections = []
+
+        def _queryrow():
+            result = None
             with duckdb.connect() as con:
+                connections.append(con)
                 dataset = self._connection.to_pyarrow_dataset(**args, **kwargs)
                 # Register the dataset as a table in DuckDB
                 con.register(tablename, dataset)
@@ -293,7 +321,7 @@ class delta(InitDriver):
                         if not df.empty:
                             result = df.iloc[0]
                     elif factory == "polars":
-                        pl_df = rst.df_polars()
+                        pl_df = rst.pl()
                         if pl_df.shape[0] > 0:
                             result = pl_df.row(0)  # Get the first row
                     elif factory == "arrow":
@@ -302,14 +330,15 @@ class delta(InitDriver):
                             result = arrow_table.slice(0, 1)  # Return the first row
                     else:
                         raise ValueError(f"Unsupported factory type: {factory}")
+            return result
+
+        try:
+            result = await self._blocking(_queryrow, timeout=timeout, interrupt=partial(_interrupt, connections))
         except (DeltaError, DeltaProtocolError) as exc:
             error = exc
-        except Exception as exc:
+        except Exception as exc:  # pylint: disable=W0703
             error = exc
-        finally:
-            rst = None
-            dataset = None
-            return [result, error]  # pylint: disable=W0150
+        return [result, error]
 
     fetch_one = queryrow
 
@@ -320,11 +349,17 @@ class delta(InitDriver):
 
         Creating a parquet file from a File (CSV/XLSX) object.
         """
+        await self._blocking(self._file_to_parquet, filename, parquet, factory, chunksize, **kwargs)
+
+    def _file_to_parquet(
+        self, filename: Union[str, Path], parquet: str, factory: str = "pandas", chunksize: int = 100000, **kwargs
+    ):
         if isinstance(filename, str):
             filename = Path(filename).resolve()
         ext = filename.suffix
         arguments = kwargs.get("pd_args", {})
         df = None
+        atable = None
         if ext in (".csv", ".CSV", ".txt", ".TXT"):
             if factory == "pandas":
                 csv_chunks = pd.read_csv(
@@ -397,13 +432,11 @@ class delta(InitDriver):
             args["partition_by"] = partition_by
         try:
             destination = path.joinpath(table_id)
-            if isinstance(data, pd.DataFrame):
-                write_deltalake(destination, data, **args)
-            elif isinstance(data, pl.DataFrame):
-                data.write_delta(destination, **args)
+            if isinstance(data, pl.DataFrame):
+                await self._blocking(data.write_delta, destination, **args)
             else:
-                # assuming a pyarrow:
-                write_deltalake(destination, data, **args)
+                # pandas DataFrame or pyarrow:
+                await self._blocking(write_deltalake, destination, data, **args)
             # Destination will be the new file path:
             self._delta = destination
         except (DeltaError, DeltaProtocolError) as exc:
@@ -435,21 +468,24 @@ class delta(InitDriver):
         if columns:
             args["columns"] = columns
         try:
-            if factory == "pandas":
-                result = self._connection.to_pandas(**args)
-            elif factory == "arrow":
-                result = self._connection.to_pyarrow_table(**args)
-            elif factory == "arrow_dataset":
-                result = self._connection.to_pyarrow_dataset(**args, **kwargs)
-            elif factory == "polars":
-                table = self._connection.to_pyarrow_table(**args)
-                result = pl.from_arrow(table)
+            result = await self._blocking(self._read_table, factory, args, kwargs)
         except (DeltaError, DeltaProtocolError) as exc:
             error = exc
-        except Exception as exc:
+        except Exception as exc:  # pylint: disable=W0703
             error = exc
-        finally:
-            return [result, error]  # pylint: disable=W0150
+        return [result, error]
+
+    def _read_table(self, factory: str, args: dict, kwargs: dict) -> Any:
+        if factory == "pandas":
+            return self._connection.to_pandas(**args)
+        elif factory == "arrow":
+            return self._connection.to_pyarrow_table(**args)
+        elif factory == "arrow_dataset":
+            return self._connection.to_pyarrow_dataset(**args, **kwargs)
+        elif factory == "polars":
+            table = self._connection.to_pyarrow_table(**args)
+            return pl.from_arrow(table)
+        return None
 
     async def copy_to(
         self,
@@ -490,7 +526,8 @@ class delta(InitDriver):
             mtd = pl.scan_csv
         else:
             mtd = pl.read_csv
-        try:
+
+        def _copy():
             df = mtd(
                 source,
                 separator=separator,
@@ -508,7 +545,15 @@ class delta(InitDriver):
             pq_file = pq.ParquetFile(destination)
             metadata = pq_file.metadata
             return destination, metadata
+
+        try:
+            return await self._blocking(_copy)
         except FileExistsError:
             raise
         except Exception as err:
             raise DriverError(f"Delta: Error on COPY to Parquet: {err!s}") from err
+
+
+def _interrupt(connections: list) -> None:
+    for con in connections:
+        con.interrupt()
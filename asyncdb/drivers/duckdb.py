@@ -6,6 +6,7 @@ import time
 import duckdb as duck
 from ..exceptions import NoDataFound, DriverError
 from ..interfaces.cursors import DBCursorBackend
+from ..utils.executors import run_blocking
 from .sql import SQLCursor, SQLDriver
 
 
@@ -18,14 +19,16 @@ class duckdbCursor(SQLCursor):
     _connection: duck.DuckDBPyConnection = None
 
     async def __aenter__(self) -> "duckdbCursor":
-        self._cursor = self._connection.execute(self._sentence, parameters=self._params)
+        self._cursor = await self._provider._blocking(
+            self._connection.execute, self._sentence, parameters=self._params
+        )
         return self
 
     async def __anext__(self):
         """Use `cursor.fetchrow()` to provide an async iterable.
         raise: StopAsyncIteration when done.
         """
-        row = self._cursor.fetchone()
+        row = await self._provider._blocking(self._cursor.fetchone)
         if row is not None:
             return row
         else:
@@ -33,16 +36,25 @@ class duckdbCursor(SQLCursor):
 
     ### Cursor Methods.
     async def fetch_one(self) -> Optional[Sequence]:
-        return self._cursor.fetchone()
+        return await self._provider._blocking(self._cursor.fetchone)
 
     async def fetch_many(self, size: int = None) -> Iterable[Sequence]:
-        return self._cursor.fetch(size)
+        return await self._provider._blocking(self._cursor.fetchmany, size)
 
     async def fetch_all(self) -> Iterable[Sequence]:
-        return self._cursor.fetchall()
+        return await self._provider._blocking(self._cursor.fetchall)
 
 
 class duckdb(SQLDriver, DBCursorBackend):
+    """duckdb.
+
+    DuckDB calls are blocking: they run on the shared "duckdb" executor
+    (asyncdb.utils.executors), one at a time per connection; a stream runs
+    on its own cursor, so calls are not blocked between its batches.
+    A query running longer than ``timeout`` seconds (driver argument, or
+    ``timeout=`` on every call) is interrupted and raises DriverError.
+    """
+
     _provider: str = "duckdb"
     _syntax: str = "sql"
     _dsn_template: str = "{database}"
@@ -51,6 +63,44 @@ class duckdb(SQLDriver, DBCursorBackend):
         SQLDriver.__init__(self, dsn, loop, params, **kwargs)
         DBCursorBackend.__init__(self)
         self._memory_limit: str = kwargs.get("memory_limit", "1GB")
+        self._query_timeout: Optional[float] = kwargs.get("timeout", None)
+        self._executor = self.get_executor("duckdb")
+        self._lock = asyncio.Lock()
+
+    async def _blocking(self, fn, *args, timeout: Optional[float] = None, **kwargs) -> Any:
+        """_blocking.
+
+        Runs a DuckDB call on the executor, interrupting it on timeout or cancellation.
+        """
+        async with self._lock:
+            return await self._call(fn, *args, timeout=timeout, **kwargs)
+
+    async def _call(self, fn, *args, timeout: Optional[float] = None, cursor: Any = None, **kwargs) -> Any:
+        """_call.
+
+        Runs a DuckDB call on the executor, the caller holds the connection lock
+        (or runs it on its own cursor).
+        """
+        if timeout is None:
+            timeout = self._query_timeout
+        connection = cursor if cursor is not None else self._connection
+        try:
+            return await run_blocking(
+                fn,
+                *args,
+                executor=self._executor,
+                driver=self._provider,
+                timeout=timeout,
+                interrupt=connection.interrupt if connection is not None else None,
+                **kwargs
+            )
+        except asyncio.TimeoutError as err:
+            raise DriverError(f"DuckDB: query interrupted after {timeout} seconds") from err
+
+    @staticmethod
+    def _run(connection, sentence: Any, fetch: str, *args, **kwargs) -> Any:
+        cursor = connection.execute(sentence, *args, **kwargs)
+        return getattr(cursor, fetch)()
 
     async def connection(self, **kwargs):
         """
@@ -61,9 +111,9 @@ class duckdb(SQLDriver, DBCursorBackend):
         if not self._dsn:
             self._dsn = ":memory:"
         try:
-            self._connection = duck.connect(database=self._dsn, **kwargs)
+            self._connection = await self._blocking(duck.connect, database=self._dsn, **kwargs)
             if self._connection:
-                self._connection.execute(f"SET memory_limit='{self._memory_limit}'")
+                await self._blocking(self._connection.execute, f"SET memory_limit='{self._memory_limit}'")
                 if self._init_func is not None and callable(self._init_func):
                     try:
                         await self._init_func(self._connection)  # pylint: disable=E1102
@@ -72,7 +122,7 @@ class duckdb(SQLDriver, DBCursorBackend):
                 self._connected = True
                 self._initialized_on = time.time()
             return self
-        except duckdb.ConnectionException as e:
+        except duck.ConnectionException as e:
             raise DriverError(f"Unable to Open Database: {self._dsn}, {e}") from e
         except Exception as e:
             self._logger.exception(e, stack_info=True)
@@ -99,58 +149,62 @@ class duckdb(SQLDriver, DBCursorBackend):
         """
         try:
             if self._connection:
-                self._connection.close()
+                await self._blocking(self._connection.close)
         except Exception as err:
             raise DriverError(message=f"{__name__!s}: Closing Error: {err!s}") from err
         finally:
             self._connection = None
             self._connected = False
 
-    async def query(self, sentence: Any, *args, **kwargs) -> Any:
+    async def query(
+        self, sentence: Any, *args, timeout: Optional[float] = None, format: Optional[str] = None, **kwargs  # pylint: disable=W0622
+    ) -> Any:
         """
-        Getting a Query from Database
+        Getting a Query from Database (serialized by ``format``, when given).
         """
         error = None
-        cursor = None
+        self._result = None
+        serializer, output = self._output_for(format)
         await self.valid_operation(sentence)
+        # columnar formats (arrow, polars, ...) are built from an Arrow table.
+        fetch = "fetch_arrow_table" if getattr(serializer, "columnar", False) else "fetchall"
         try:
-            cursor = self._connection.execute(sentence, *args, **kwargs)
-            self._result = cursor.fetchall()
-            if not self._result:
-                return (None, NoDataFound())
-        except Exception as err:
+            self._result = await self._blocking(
+                self._run, self._connection, sentence, fetch, *args, timeout=timeout, **kwargs
+            )
+        except Exception as err:  # pylint: disable=W0703
             error = f"DuckDB Error on Query: {err}"
-            raise DriverError(message=error) from err
-        finally:
-            return await self._serializer(self._result, error)
+        if output is not None:
+            return output(self._result, error)
+        return await serializer(self._result, error)
 
-    async def queryrow(self, sentence: Any = None) -> Iterable[Any]:
+    async def queryrow(
+        self, sentence: Any = None, timeout: Optional[float] = None, format: Optional[str] = None  # pylint: disable=W0622
+    ) -> Iterable[Any]:
         """
         Getting a single Row from Database
         """
         error = None
-        cursor = None
+        self._result = None
+        serializer, output = self._output_for(format)
         await self.valid_operation(sentence)
         try:
-            cursor = self._connection.execute(sentence)
-            self._result = cursor.fetchone()
-            if not self._result:
-                return (None, NoDataFound())
-        except Exception as e:
+            self._result = await self._blocking(self._run, self._connection, sentence, "fetchone", timeout=timeout)
+        except Exception as e:  # pylint: disable=W0703
             error = f"Error on Query: {e}"
-            raise DriverError(message=error) from e
-        finally:
-            return await self._serializer(self._result, error)
+        if output is not None:
+            return output(self._result, error)
+        return await serializer(self._result, error)
 
-    async def fetch_all(self, sentence: str, *args, **kwargs) -> Sequence:
+    async def fetch_all(self, sentence: str, *args, timeout: Optional[float] = None, **kwargs) -> Sequence:
         """
         Alias for Query, but without error Support.
         """
-        cursor = None
         await self.valid_operation(sentence)
         try:
-            cursor = self._connection.execute(sentence, *args, **kwargs)
-            self._result = await cursor.fetchall()
+            self._result = await self._blocking(
+                self._run, self._connection, sentence, "fetchall", *args, timeout=timeout, **kwargs
+            )
             if not self._result:
                 raise NoDataFound("DuckDB Fetch All: Data Not Found")
             return self._result
@@ -161,15 +215,17 @@ class duckdb(SQLDriver, DBCursorBackend):
     # alias to be compatible with aiosqlite methods.
     fetchall = fetch_all
 
-    async def fetch_many(self, sentence: str, size: int = None):
+    async def fetch_many(self, sentence: str, size: int = None, timeout: Optional[float] = None):
         """
         Aliases for query, without error support
         """
         await self.valid_operation(sentence)
-        cursor = None
+
+        def _fetch(connection):
+            return connection.execute(sentence).fetchmany(size)
+
         try:
-            cursor = self._connection.execute(sentence)
-            self._result = cursor.fetchmany(size)
+            self._result = await self._blocking(_fetch, self._connection, timeout=timeout)
             if not self._result:
                 raise NoDataFound()
             return self._result
@@ -179,18 +235,39 @@ class duckdb(SQLDriver, DBCursorBackend):
 
     fetchmany = fetch_many
 
-    async def fetch_one(self, sentence: str, *args, **kwargs) -> Optional[dict]:
+    async def _fetch_batches(self, sentence: str, params: Iterable[Any], batch_size: int, arrow: bool = False):
+        await self.valid_operation(sentence)
+        # the result is pending until the last batch: it runs on its own cursor
+        # (a duplicate connection to the same database), other calls are not blocked
+        # between batches, even when the stream is left before its end.
+        cursor = await self._blocking(self._connection.cursor)
+        try:
+            await self._call(cursor.execute, sentence, parameters=params or None, cursor=cursor)
+            # names of the (tuple) rows.
+            self._attributes = cursor.description
+            if arrow:
+                # native Arrow batches, no row materialization.
+                reader = await self._call(cursor.fetch_record_batch, batch_size, cursor=cursor)
+                while (batch := await self._call(_next_batch, reader, cursor=cursor)) is not None:
+                    yield batch
+            else:
+                while rows := await self._call(cursor.fetchmany, batch_size, cursor=cursor):
+                    yield rows
+        except duck.Error as err:
+            raise DriverError(message=f"DuckDB Error on Stream: {err}") from err
+        finally:
+            cursor.close()
+
+    async def fetch_one(self, sentence: str, *args, timeout: Optional[float] = None, **kwargs) -> Optional[dict]:
         """
         aliases for queryrow, but without error support
         """
         await self.valid_operation(sentence)
-        cursor = None
         try:
-            cursor = self._connection.execute(sentence, *args, **kwargs)
-            self._result = cursor.fetchone()
+            self._result = await self._blocking(
+                self._run, self._connection, sentence, "fetchone", *args, timeout=timeout, **kwargs
+            )
             return self._result
-            if not self._result:
-                raise NoDataFound()
         except Exception as err:
             error = f"Error on Query: {err}"
             raise DriverError(message=error) from err
@@ -198,7 +275,13 @@ class duckdb(SQLDriver, DBCursorBackend):
     fetchone = fetch_one
     fetchrow = fetch_one
 
-    async def execute(self, sentence: Any, **kwargs) -> Optional[Any]:
+    @staticmethod
+    def _commit(connection, method: str, sentence: Any, *args) -> Any:
+        if result := getattr(connection, method)(sentence, *args):
+            connection.commit()
+        return result
+
+    async def execute(self, sentence: Any, timeout: Optional[float] = None, **kwargs) -> Optional[Any]:
         """Execute a transaction
         get a SQL sentence and execute
         returns: results of the execution
@@ -211,27 +294,26 @@ class duckdb(SQLDriver, DBCursorBackend):
             params = None
         await self.valid_operation(sentence)
         try:
-            if result := self._connection.execute(sentence, parameters=params):
-                self._connection.commit()
-        except Exception as err:
+            result = await self._blocking(
+                self._commit, self._connection, "execute", sentence, params, timeout=timeout
+            )
+        except Exception as err:  # pylint: disable=W0703
             error = f"Error on Execute: {err}"
-            raise DriverError(message=error) from err
-        finally:
-            return (result, error)
+        return (result, error)
 
-    async def execute_many(self, sentence: Union[str, list], args: list) -> Optional[Any]:
+    async def execute_many(
+        self, sentence: Union[str, list], args: list, timeout: Optional[float] = None
+    ) -> Optional[Any]:
         error = None
+        result = None
         await self.valid_operation(sentence)
         try:
-            print("THIS > ", sentence, args)
-            result = self._connection.executemany(sentence, args)
-            if result:
-                self._connection.commit()
-        except Exception as err:
+            result = await self._blocking(
+                self._commit, self._connection, "executemany", sentence, args, timeout=timeout
+            )
+        except Exception as err:  # pylint: disable=W0703
             error = f"Error on Execute Many: {err}"
-            raise DriverError(message=error) from err
-        finally:
-            return (result, error)
+        return (result, error)
 
     executemany = execute_many
 
@@ -249,7 +331,7 @@ class duckdb(SQLDriver, DBCursorBackend):
         if parameters is None:
             parameters = []
         try:
-            result = self._connection.execute(sentence, parameters=parameters)
+            result = await self._blocking(self._connection.execute, sentence, parameters=parameters)
         except Exception as err:
             error = f"Error on Cursor Fetch: {err}"
             raise DriverError(message=error) from err
@@ -264,7 +346,7 @@ class duckdb(SQLDriver, DBCursorBackend):
         Returns:
             _type_: Single record for iteration.
         """
-        data = self._cursor.fetchone()
+        data = await self._blocking(self._cursor.fetchone)
         if data is not None:
             return data
         else:
@@ -279,12 +361,8 @@ class duckdb(SQLDriver, DBCursorBackend):
             columns = ", ".join(["{name} {type}".format(**e) for e in fields])
             sql = sql.format(name=name, columns=columns)
             try:
-                result = self._connection.execute(sql)
-                if result:
-                    self._connection.commit()
-                    return True
-                else:
-                    return False
+                result = await self._blocking(self._commit, self._connection, "execute", sql)
+                return bool(result)
             except Exception as err:
                 raise DriverError(f"Error in Object Creation: {err!s}") from err
         else:
@@ -311,12 +389,18 @@ class duckdb(SQLDriver, DBCursorBackend):
             dest = f"'{destination!s}' (FORMAT PARQUET, CODEC 'SNAPPY', ROW_GROUP_SIZE 100000);"
         try:
             qry = f"COPY ({query}) TO {dest}"
-            result = self._connection.execute(qry)
+            result = await self._blocking(self._commit, self._connection, "execute", qry)
             if result:
-                self._connection.commit()
                 # return the name of created file:
                 return destination
             else:
                 return False
         except Exception as err:
             raise DriverError(f"DuckDB: Error on COPY: {err!s}") from err
+
+
+def _next_batch(reader) -> Any:
+    try:
+        return reader.read_next_batch()
+    except StopIteration:
+        return None
@@ -169,9 +169,8 @@ class jdbc(SQLDriver, DatabaseBackend, ModelBackend):
         finally:
             self._connected = False
             self._connection = None
-            # Shutdown the executor
+            # release the (shared) executor
             if self._executor:
-                self._executor.shutdown(wait=True)
                 self._executor = None
                 # Detach all threads before shutting down JVM
                 if jpype.isThreadAttachedToJVM():
@@ -192,8 +191,6 @@ class jdbc(SQLDriver, DatabaseBackend, ModelBackend):
         return self._columns
 
     async def _query(self, sentence, cursor: Any, fetch: Any, *args, **kwargs) -> Iterable:
-        loop = asyncio.get_event_loop()
-
         def _execute(sentence, cursor, fetch, *args, **kwargs):
             cursor.execute(sentence, *args, **kwargs)
             self._columns = tuple([d[0] for d in cursor.description])
@@ -201,15 +198,12 @@ class jdbc(SQLDriver, DatabaseBackend, ModelBackend):
 
         func = partial(_execute, sentence, cursor, fetch, *args, **kwargs)
         try:
-            fut = loop.run_in_executor(self._executor, func)
-            return await fut
+            return await self._thread_func(func, executor=self._executor)
         except Exception as e:
             self._logger.exception(e, stack_info=True)
             raise
 
     async def _execute(self, sentence, cursor: Any, *args, **kwargs) -> Iterable:
-        loop = asyncio.get_event_loop()
-
         def _execute(sentence, cursor, *args, **kwargs):
             cursor.execute(sentence, *args, **kwargs)
             self._connection.commit()
@@ -217,8 +211,7 @@ class jdbc(SQLDriver, DatabaseBackend, ModelBackend):
 
         func = partial(_execute, sentence, cursor, *args, **kwargs)
         try:
-            fut = loop.run_in_executor(self._executor, func)
-            return await fut
+            return await self._thread_func(func, executor=self._executor)
         except Exception as e:
             self._logger.exception(e, stack_info=True)
             raise
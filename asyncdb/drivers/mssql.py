@@ -9,6 +9,7 @@ import pymssql
 from pymssql import _mssql
 from ..interfaces.cursors import DBCursorBackend
 from ..exceptions import DataError, EmptyStatement, NoDataFound, DriverError, StatementError
+from ..utils.executors import run_blocking
 from .sql import SQLDriver, SQLCursor
 
 
@@ -31,6 +32,8 @@ class mssql(SQLDriver, DBCursorBackend):
     """mssql.
 
     Microsoft SQL Server using low-level _mssql Protocol.
+    _mssql calls are blocking: they run on the shared "mssql" executor
+    (asyncdb.utils.executors), one at a time per connection.
     """
 
     _provider = "mssql"
@@ -53,6 +56,8 @@ class mssql(SQLDriver, DBCursorBackend):
             self.tds_version = "7.3"
         SQLDriver.__init__(self, dsn=dsn, loop=loop, params=params, **kwargs)
         DBCursorBackend.__init__(self)
+        self._executor = self.get_executor("mssql")
+        self._lock = asyncio.Lock()
         try:
             if "host" in self.params:
                 self.params["server"] = "{}:{}".format(self.params["host"], self.params["port"])
@@ -65,6 +70,20 @@ class mssql(SQLDriver, DBCursorBackend):
             self.application_name = self._server_settings["application_name"]
             del self._server_settings["application_name"]
 
+    async def _blocking(self, fn, *args, **kwargs) -> Any:
+        """_blocking.
+
+        Runs a _mssql call on the executor, holding the connection lock.
+        """
+        async with self._lock:
+            return await run_blocking(fn, *args, executor=self._executor, driver=self._provider, **kwargs)
+
+    @staticmethod
+    def _fetch_rows(connection, sentence: str, args: tuple) -> list:
+        # rows are read from the socket while iterating the connection.
+        connection.execute_query(sentence, args)
+        return list(connection)
+
     async def close(self):  # pylint: disable=W0221
         """
         Closing a Connection
@@ -72,7 +91,7 @@ class mssql(SQLDriver, DBCursorBackend):
         try:
             if self._connection:
                 try:
-                    self._connection.close()
+                    await self._blocking(self._connection.close)
                 except Exception as err:
                     self._connection = None
                     raise DriverError(message=f"Connection Error, Terminated: {err}") from err
@@ -99,7 +118,7 @@ class mssql(SQLDriver, DBCursorBackend):
             self.params["tds_version"] = self.tds_version
             if self._server_settings:
                 self.params["conn_properties"] = self._server_settings
-            self._connection = _mssql.connect(**self.params)  # pylint: disable=I1101
+            self._connection = await self._blocking(_mssql.connect, **self.params)  # pylint: disable=I1101
             if self._connection.connected:
                 self._connected = True
                 self._initialized_on = time.time()
@@ -117,7 +136,7 @@ class mssql(SQLDriver, DBCursorBackend):
             raise DriverError(message=f"connection Error, Terminated: {err}") from err
 
     async def use(self, database: str):  # pylint: disable=W0236
-        self._connection.select_db(database)
+        await self._blocking(self._connection.select_db, database)
 
     @property
     async def identity(self):
@@ -148,7 +167,7 @@ class mssql(SQLDriver, DBCursorBackend):
         if not self._connection:
             await self.connection()
         try:
-            self._result = self._connection.execute_non_query(sentence, args)
+            self._result = await self._blocking(self._connection.execute_non_query, sentence, args)
         except _mssql.MSSQLDatabaseException as ex:  # pylint: disable=I1101
             num = ex.number
             state = ex.state
@@ -184,8 +203,7 @@ class mssql(SQLDriver, DBCursorBackend):
         self._result = None
         await self.valid_operation(sentence)
         try:
-            self._connection.execute_query(sentence, args)
-            self._result = self._connection
+            self._result = await self._blocking(self._fetch_rows, self._connection, sentence, args)
         except _mssql.MSSQLDatabaseException as ex:  # pylint: disable=I1101
             num = ex.number
             state = ex.state
@@ -210,7 +228,7 @@ class mssql(SQLDriver, DBCursorBackend):
         self._result = None
         await self.valid_operation(sentence)
         try:
-            self._result = self._connection.execute_row(sentence, args)
+            self._result = await self._blocking(self._connection.execute_row, sentence, args)
             if not self._result:
                 # raise NoDataFound("SQL Server: No Data was Found")
                 return [None, NoDataFound("SQL Server: No Data was Found")]
@@ -237,7 +255,7 @@ class mssql(SQLDriver, DBCursorBackend):
         self._result = None
         await self.valid_operation(sentence)
         try:
-            self._result = self._connection.execute_row(sentence, args)
+            self._result = await self._blocking(self._connection.execute_row, sentence, args)
             if not self._result:
                 # raise NoDataFound("SQL Server: No Data was Found")
                 raise NoDataFound("SQL Server: No Data was Found")
@@ -275,7 +293,7 @@ class mssql(SQLDriver, DBCursorBackend):
         self._result = None
         await self.valid_operation(sentence)
         try:
-            self._connection.execute_query(sentence, args)
+            self._result = await self._blocking(self._fetch_rows, self._connection, sentence, args)
             if not self._result:
                 raise NoDataFound("SQL Server: No Data was Found")
             return self._result
@@ -308,7 +326,7 @@ class mssql(SQLDriver, DBCursorBackend):
         self._result = None
         await self.valid_operation(sentence)
         try:
-            self._result = self._connection.execute_scalar(sentence, args)
+            self._result = await self._blocking(self._connection.execute_scalar, sentence, args)
             if not self._result:
                 raise NoDataFound("SQL Server: No Data was Found")
             return self._result
@@ -6,7 +6,7 @@ from typing import Optional, Union, Any
 from collections.abc import Callable, Iterable
 import ssl
 import asyncmy
-from asyncmy.cursors import DictCursor
+from asyncmy.cursors import DictCursor, SSDictCursor
 from ..exceptions import (
     ConnectionTimeout,
     NoDataFound,
@@ -74,7 +74,8 @@ class mysqlPool(BasePool):
         Take a connection from the pool.
         """
         try:
-            self._connection = await self._pool.acquire()
+            with self._metrics.acquiring():
+                self._connection = await self._pool.acquire()
         except Exception as err:
             raise DriverError(f"MySQL: Unable to acquire a connection from the pool: {err}")
         if self._connection:
@@ -94,9 +95,20 @@ class mysqlPool(BasePool):
             conn = connection
         try:
             await self._pool.release(conn)
+            self._metrics.release()
         except Exception as err:
+            self._metrics.failure(err)
             raise DriverError(f"MySQL: Unable to release a connection from the pool: {err}")
 
+    def _pool_stats(self) -> dict:
+        return {
+            "size": self._pool.size,
+            "in_use": self._pool.size - self._pool.freesize,
+            "idle": self._pool.freesize,
+            "min_size": self._pool.minsize,
+            "max_clients": self._pool.maxsize,
+        }
+
     async def wait_close(self, gracefully=True):
         """
         close
@@ -295,8 +307,9 @@ class mysql(SQLDriver, DBCursorBackend):
         """
         raise NotImplementedError
 
-    async def query(self, sentence: str, size: int = None):
+    async def query(self, sentence: str, size: int = None, format: Optional[str] = None):  # pylint: disable=W0622
         error = None
+        serializer, output = self._output_for(format)
         await self.valid_operation(sentence)
         try:
             self.start_timing()
@@ -318,10 +331,13 @@ class mysql(SQLDriver, DBCursorBackend):
             self.generated_at()
             if error:
                 return [None, error]
-            return await self._serializer(self._result, error)  # pylint: disable=W0150
+            if output is not None:
+                return output(self._result, error)  # pylint: disable=W0150
+            return await serializer(self._result, error)  # pylint: disable=W0150
 
-    async def queryrow(self, sentence: str):
+    async def queryrow(self, sentence: str, format: Optional[str] = None):  # pylint: disable=W0622
         error = None
+        serializer, output = self._output_for(format)
         await self.valid_operation(sentence)
         try:
             self.start_timing()
@@ -340,7 +356,9 @@ class mysql(SQLDriver, DBCursorBackend):
             self.generated_at()
             if error:
                 return [None, error]
-            return await self._serializer(self._result, error)  # pylint: disable=W0150
+            if output is not None:
+                return output(self._result, error)  # pylint: disable=W0150
+            return await serializer(self._result, error)  # pylint: disable=W0150
 
     async def fetch_one(self, sentence: str):
         await self.valid_operation(sentence)
@@ -399,6 +417,21 @@ class mysql(SQLDriver, DBCursorBackend):
         finally:
             self.generated_at()
 
+    async def _fetch_batches(self, sentence: str, params: Iterable[Any], batch_size: int, arrow: bool = False):
+        """
+        Unbuffered (server-side) cursor, rows are read from the socket batch_size at a time.
+        """
+        await self.valid_operation(sentence)
+        try:
+            async with self._connection.cursor(cursor=SSDictCursor) as cursor:
+                await cursor.execute(sentence, params or None)
+                while rows := await cursor.fetchmany(batch_size):
+                    yield rows
+        except RuntimeError as err:
+            raise DriverError(f"MySQL Runtime Error: {err}") from err
+        except Exception as err:
+            raise DriverError(f"MySQL: Error on Stream: {err}") from err
+
     async def execute(self, sentence: str):
         """Execute a transaction
         get a SQL sentence and execute
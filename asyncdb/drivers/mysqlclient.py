@@ -5,7 +5,6 @@ import time
 from typing import Optional, Union, Any
 from collections.abc import Callable, Iterable
 import ssl
-from concurrent.futures import ThreadPoolExecutor
 import MySQLdb
 from MySQLdb.cursors import DictCursor
 from asyncdb.exceptions import (
@@ -35,7 +34,7 @@ class mysqlclientPool(BasePool):
         self._min_size = 10
         self._init_command = kwargs.pop("init_command", None)
         self._sql_modes = kwargs.pop("sql_modes", None)
-        self._executor = ThreadPoolExecutor(max_workers=self._min_size)
+        self._executor = self.get_executor(executor="thread", max_workers=self._min_size)
         self._queue = asyncio.Queue(maxsize=self._max_clients)
         self._current_size: int = 0
         super(mysqlclientPool, self).__init__(dsn=dsn, loop=loop, params=params, **kwargs)
@@ -57,6 +56,7 @@ class mysqlclientPool(BasePool):
             **params,
             executor=self._executor,
         )
+        self._metrics.connection_opened(connection)
         return connection
 
     async def connect(self):
@@ -81,12 +81,15 @@ class mysqlclientPool(BasePool):
         """
         Acquire a connection from the pool, creating a new one if needed.
         """
-        if self._queue.empty() and self._current_size < self._max_clients:
-            try:
-                self._connection = await self._connection_()
-                self._current_size += 1
-            except Exception as err:
-                raise DriverError(f"MySQL: Unable to acquire a connection from the pool: {err}")
+        try:
+            with self._metrics.acquiring():
+                if self._queue.empty() and self._current_size < self._max_clients:
+                    self._connection = await self._connection_()
+                    self._current_size += 1
+                else:
+                    self._connection = await self._queue.get()
+        except Exception as err:
+            raise DriverError(f"MySQL: Unable to acquire a connection from the pool: {err}")
         if self._connection:
             db = mysqlclient(pool=self)
             db.set_connection(self._connection)
@@ -104,13 +107,25 @@ class mysqlclientPool(BasePool):
             conn = connection
         try:
             if self._queue.full():
+                self._metrics.connection_closed(conn)
                 conn.close()
                 self._current_size -= 1
             else:
                 await self._queue.put(conn)
+            self._metrics.release()
         except Exception as err:
+            self._metrics.failure(err)
             raise DriverError(f"MySQL: Unable to release a connection from the pool: {err}")
 
+    def _pool_stats(self) -> dict:
+        return {
+            "size": self._current_size,
+            "in_use": self._current_size - self._queue.qsize(),
+            "idle": self._queue.qsize(),
+            "min_size": self._min_size,
+            "max_clients": self._max_clients,
+        }
+
     async def wait_close(self, gracefully=True):
         """
         close
@@ -159,9 +174,8 @@ class mysqlclientPool(BasePool):
         error = None
         result = None
         try:
-            loop = asyncio.get_running_loop()
             conn = await self._connection_()
-            result = await loop.run_in_executor(self._executor, self._execute, conn, sentence, *args)
+            result = await self._thread_func(self._execute, conn, sentence, *args, executor=self._executor)
         except Exception as err:
             error = f"MySQL: Unable to Execute: {err}"
         finally:
@@ -342,8 +356,9 @@ class mysqlclient(SQLDriver, DBCursorBackend):
         except Exception as err:
             raise DriverError(f"MySQL: Unable to Execute: {err}")
 
-    async def query(self, sentence: str, *args, size: int = None):
+    async def query(self, sentence: str, *args, size: int = None, format: Optional[str] = None):  # pylint: disable=W0622
         error = None
+        serializer, output = self._output_for(format)
         await self.valid_operation(sentence)
         try:
             self.start_timing()
@@ -366,10 +381,13 @@ class mysqlclient(SQLDriver, DBCursorBackend):
             self.generated_at()
             if error:
                 return [None, error]
-            return await self._serializer(self._result, error)  # pylint: disable=W0150
+            if output is not None:
+                return output(self._result, error)  # pylint: disable=W0150
+            return await serializer(self._result, error)  # pylint: disable=W0150
 
-    async def queryrow(self, sentence: str, *args):
+    async def queryrow(self, sentence: str, *args, format: Optional[str] = None):  # pylint: disable=W0622
         error = None
+        serializer, output = self._output_for(format)
         await self.valid_operation(sentence)
         try:
             self.start_timing()
@@ -386,7 +404,9 @@ class mysqlclient(SQLDriver, DBCursorBackend):
             self.generated_at()
             if error:
                 return [None, error]
-            return await self._serializer(self._result, error)  # pylint: disable=W0150
+            if output is not None:
+                return output(self._result, error)  # pylint: disable=W0150
+            return await serializer(self._result, error)  # pylint: disable=W0150
 
     async def fetch_one(self, sentence: str, *args):
         await self.valid_operation(sentence)
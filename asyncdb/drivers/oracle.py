@@ -115,9 +115,8 @@ class oracle(SQLDriver):
             self._logger.exception(e, stack_info=True)
             raise DriverError(f"Oracle Closing Error: {e!s}") from e
         finally:
-            if self._executor:
-                self._executor.shutdown(wait=True)
-                self._executor = None
+            # release the (shared) executor
+            self._executor = None
             self._connected = False
             self._connection = None
 
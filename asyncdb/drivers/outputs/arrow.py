@@ -1,10 +1,13 @@
 import logging
 from io import StringIO
-import pandas
-from google.cloud.bigquery.table import RowIterator
+from collections.abc import AsyncIterator, Sequence
+from typing import Any, Optional
 import pyarrow as pa
 import pyarrow.csv as pc
-from .base import OutputFormat
+from ...utils.executors import run_blocking
+from ...utils.modules import lazy_isinstance
+from ...conversions.pgrecords import arrow_schema, to_arrow
+from .base import OutputFormat, batches_of
 
 
 def arrow_parser(csv_stream: StringIO, chunksize: int, delimiter: str = ",", columns: list = None):
@@ -59,25 +62,219 @@ class arrowFormat(OutputFormat):
     Returns an Apache Arrow Table from a Resultset
     """
 
-    async def serialize(self, result, error, *args, **kwargs):
+    columnar: bool = True
+
+    async def serialize(self, result, error, *args, attributes: list = None, **kwargs):
         table = None
         try:
-            if isinstance(result, RowIterator):
-                for chunk in arrow_parser(result.csv_stream, chunksize=1000):
-                    yield chunk
+            if lazy_isinstance(result, "google.cloud.bigquery.table.RowIterator"):
+                table = result.to_arrow()
             elif isinstance(result, pa.Table):
                 table = result
-            elif isinstance(result, pandas.DataFrame):
+            elif isinstance(result, pa.RecordBatch):
+                table = pa.Table.from_batches([result])
+            elif lazy_isinstance(result, "pandas.DataFrame"):
                 table = pa.Table.from_pandas(result, **kwargs)
+            elif result is None:
+                table = None
             else:
-                names = result[0].keys()
-                table = pa.Table.from_arrays(result, names=names, **kwargs)
-            self._result = table
+                if hasattr(result, "keys"):
+                    # a single row (ex: queryrow)
+                    result = [result]
+                table = to_arrow(result, attributes)
         except ValueError as err:
             logging.error(f"Arrow Serialization Error: {err}")
             error = Exception(f"arrowFormat: Error Parsing Column: {err}")
         except Exception as err:
             logging.exception(f"Arrow Serialization Error: {err}", stack_info=True)
             error = Exception(f"arrowFormat: Error on Data: error: {err}")
+        return (table, error)
+
+
+class _Chunks:
+    """Write-only file keeping the bytes written by an Arrow writer until taken."""
+
+    def __init__(self):
+        self._chunks: list = []
+        self._position: int = 0
+        self.closed: bool = False
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def writable(self) -> bool:
+        return True
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def take(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _inferred(datatype: pa.DataType) -> bool:
+    """Types inferred from the values of a batch, that may change in the next one."""
+    return (
+        pa.types.is_null(datatype)
+        or pa.types.is_decimal(datatype)
+        or pa.types.is_nested(datatype)
+    )
+
+
+def _text(column: pa.ChunkedArray) -> pa.Array:
+    return pa.array([None if v is None else str(v) for v in column.to_pylist()], type=pa.string())
+
+
+def _conform(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    """Table with the types of schema, columns without a cast are converted to text."""
+    if table.schema == schema:
+        return table
+    columns = []
+    for column, field in zip(table.columns, schema):
+        if column.type == field.type:
+            columns.append(column)
+        elif pa.types.is_string(field.type) and _inferred(column.type) and not pa.types.is_null(column.type):
+            # the text of the values (a cast pads decimals to the scale of the batch).
+            columns.append(_text(column))
+        else:
+            columns.append(column.cast(field.type))
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+class ArrowFileFormat(OutputFormat):
+    """
+    Base of the Arrow file formats (parquet, ipc).
+
+    Batches (rows, typed by the column metadata of the driver, or Arrow
+    batches) are written incrementally, in groups of row_group_size rows;
+    the writer runs on the shared executor. ``serialize`` returns the file
+    as bytes or, with a destination, writes it there and returns the
+    destination. As streaming formats, they can be exported from a cursor
+    stream (ex: ``driver.export(sql, "sales.parquet", format="parquet")``).
+
+    Args:
+        destination: path or file-like object of the query results.
+        compression: compression codec (ex: "zstd", "lz4", "snappy").
+        row_group_size: rows by row group (parquet) or record batch (ipc).
+
+    Any other argument is passed to the writer.
+    """
+
+    columnar: bool = True
+    streaming: bool = True
+
+    def __init__(
+        self,
+        destination: Any = None,
+        compression: Optional[str] = None,
+        row_group_size: int = 128 * 1024,
+        **kwargs
+    ):
+        self._destination = destination
+        self._compression: Optional[str] = compression
+        self._row_group_size: int = row_group_size
+        self._options: dict = kwargs
+
+    def _writer(self, sink: Any, schema: pa.Schema) -> Any:
+        raise NotImplementedError()  # pragma: no cover
+
+    def _write(self, writer: Any, table: pa.Table) -> None:
+        raise NotImplementedError()  # pragma: no cover
+
+    @staticmethod
+    def schema(table: pa.Table, attributes: Optional[Sequence] = None, native: bool = False) -> pa.Schema:
+        """schema.
+
+        Schema of the whole file, known before the first batch is written:
+        from the typed attributes (numerics and arrays as text, asyncpg does
+        not expose their typmod), else from the first batch, where the types
+        inferred from the values of rows (decimals, arrays, all-NULL columns)
+        are declared as text. Arrow batches (``native``) keep their types.
+        """
+        if attributes and all(hasattr(a, "type") for a in attributes):
+            return arrow_schema(attributes)
+        return pa.schema([
+            field.with_type(pa.string())
+            if pa.types.is_null(field.type) or (not native and _inferred(field.type)) else field
+            for field in table.schema
+        ])
+
+    @staticmethod
+    def to_table(batch: Any, attributes: Optional[Sequence] = None, schema: Optional[pa.Schema] = None) -> pa.Table:
+        if isinstance(batch, pa.Table):
+            return batch
+        if isinstance(batch, pa.RecordBatch):
+            return pa.Table.from_batches([batch])
+        if lazy_isinstance(batch, "pandas.DataFrame"):
+            return pa.Table.from_pandas(batch, preserve_index=False)
+        if lazy_isinstance(batch, "polars.DataFrame"):
+            return batch.to_arrow()
+        if hasattr(batch, "keys"):
+            # a single row (ex: queryrow)
+            batch = [batch]
+        elif not isinstance(batch, list):
+            batch = list(batch)
+        return to_arrow(batch, attributes, schema)
+
+    async def encode(self, batches: Any, attributes: Optional[Sequence] = None) -> AsyncIterator[bytes]:
+        sink = _Chunks()
+        writer = None
+        schema = None
+        pending: list = []
+        rows = 0
+        try:
+            async for batch in batches_of(batches):
+                table = self.to_table(batch, attributes, schema)
+                if writer is None:
+                    native = isinstance(batch, (pa.Table, pa.RecordBatch))
+                    schema = self.schema(table, attributes, native=native)
+                    writer = self._writer(sink, schema)
+                    if not native and table.schema != schema:
+                        # the text of the values, not of the types inferred from this batch.
+                        table = self.to_table(batch, attributes, schema)
+                pending.append(_conform(table, schema))
+                rows += table.num_rows
+                if rows < self._row_group_size:
+                    continue
+                table = pa.concat_tables(pending)
+                full = rows - rows % self._row_group_size
+                await run_blocking(self._write, writer, table.slice(0, full))
+                pending = [table.slice(full)]
+                rows -= full
+                if data := sink.take():
+                    yield data
+            if writer is None:
+                # no rows: the schema only.
+                schema = self.schema(self.to_table([], attributes), attributes)
+                writer = self._writer(sink, schema)
+            if rows:
+                await run_blocking(self._write, writer, pa.concat_tables(pending))
+            await run_blocking(writer.close)
+            writer = None
+            if data := sink.take():
+                yield data
         finally:
-            return (table, error)
+            if writer is not None:
+                writer.close()
+
+    async def serialize(self, result, error, *args, attributes: list = None, **kwargs):
+        if error:
+            return (None, error)
+        try:
+            if self._destination is None:
+                return (b"".join([chunk async for chunk in self.encode(result, attributes)]), None)
+            await self.write(result, self._destination, attributes)
+            return (self._destination, None)
+        except (pa.ArrowException, OSError, ValueError, TypeError) as err:
+            logging.error(f"{type(self).__name__} Serialization Error: {err}")
+            return (None, Exception(f"{type(self).__name__}: Error on Data: error: {err}"))
@@ -1,16 +1,107 @@
-from abc import ABC, abstractmethod
+import inspect
+import io
+import os
+from abc import ABC
+from collections.abc import AsyncIterable, AsyncIterator, Sequence
+from typing import Any, Optional
+import aiofiles
+
+
+def column_names(records: Sequence, attributes: Optional[Sequence] = None) -> list:
+    """column_names.
+
+    Names of the columns of a resultset: from the asyncpg Attributes or a
+    DB-API cursor ``description``, else from the keys of the first row
+    (``column_N`` for plain tuples).
+    """
+    if attributes:
+        return [a.name if hasattr(a, "name") else a[0] for a in attributes]
+    if records and hasattr(records[0], "keys"):
+        return list(records[0].keys())
+    return [f"column_{idx}" for idx in range(len(records[0]) if records else 0)]
+
+
+async def batches_of(result: Any) -> AsyncIterator:
+    """Batches of a result: an async iterable of batches (ex: a stream), or a single batch."""
+    if isinstance(result, AsyncIterable):
+        async for batch in result:
+            yield batch
+    elif result is not None:
+        yield result
+
+
+async def write_chunks(chunks: AsyncIterator, destination: Any, encoding: str = "utf-8") -> int:
+    """write_chunks.
+
+    Writes encoded chunks to a destination: a file path, a file-like object
+    (text files receive decoded chunks), an async sink (awaitable ``write``,
+    ex: an HTTP response, or an asyncio StreamWriter) or a callable.
+    Returns the bytes written.
+    """
+    written = 0
+    if isinstance(destination, (str, os.PathLike)):
+        async with aiofiles.open(destination, mode="wb") as file:
+            async for chunk in chunks:
+                await file.write(chunk)
+                written += len(chunk)
+        return written
+    text = isinstance(destination, io.TextIOBase)
+    write = destination if callable(destination) and not hasattr(destination, "write") else destination.write
+    drain = getattr(destination, "drain", None)
+    async for chunk in chunks:
+        result = write(chunk.decode(encoding) if text else chunk)
+        if inspect.isawaitable(result):
+            await result
+        if drain is not None:
+            await drain()
+        written += len(chunk)
+    return written
 
 
 class OutputFormat(ABC):
     """
     Abstract Interface for different output formats.
+
+    Formats implement ``serialize`` (a coroutine), or are ``synchronous``
+    and implement ``convert`` (a plain function): drivers call ``convert``
+    directly, without creating a coroutine for every result.
     """
 
-    @abstractmethod
+    # Columnar formats receive the column metadata of the resultset
+    # (ex: asyncpg attributes) as the "attributes" keyword of serialize.
+    columnar: bool = False
+    # Synchronous formats are called through ``convert``.
+    synchronous: bool = False
+    # Identity formats return [result, error] unchanged.
+    identity: bool = False
+    # Streaming formats encode batches of rows into chunks (``encode``).
+    streaming: bool = False
+
+    def convert(self, result, error, *args, **kwargs):
+        """
+        Making the serialization of data (synchronous formats).
+        """
+        raise NotImplementedError(f"{type(self).__name__} is not a synchronous format")
+
+    def encode(self, batches: Any, attributes: Optional[Sequence] = None) -> AsyncIterator:
+        """
+        Encoded chunks (bytes) of a result, or of an async iterable of batches
+        (ex: a cursor stream), for the streaming formats.
+        """
+        raise NotImplementedError(f"{type(self).__name__} is not a streaming format")
+
+    async def write(self, batches: Any, destination: Any, attributes: Optional[Sequence] = None) -> int:
+        """
+        Writes a result, or an async iterable of batches, to a destination
+        (see write_chunks), returns the bytes written.
+        """
+        return await write_chunks(self.encode(batches, attributes), destination, getattr(self, "_encoding", "utf-8"))
+
     async def serialize(self, result, error, *args, **kwargs):
         """
         Making the serialization of data.
         """
+        return self.convert(result, error, *args, **kwargs)
 
     async def __call__(self, result, error, *args, **kwargs):
         return await self.serialize(result, error, *args, **kwargs)
@@ -1,31 +1,117 @@
+import csv
 from io import StringIO
-import pandas
-from .base import OutputFormat
+from collections.abc import AsyncIterator, Iterator, Sequence
+from typing import Any, Optional, Union
+from ...utils.modules import lazy_isinstance
+from .base import OutputFormat, batches_of, column_names
+
+
+QUOTING: dict = {
+    "minimal": csv.QUOTE_MINIMAL,
+    "all": csv.QUOTE_ALL,
+    "nonnumeric": csv.QUOTE_NONNUMERIC,
+    "none": csv.QUOTE_NONE,
+}
 
 
 class csvFormat(OutputFormat):
     """
-    Returns a CSV string from a Resultset
-    TODO: migrate to aiocsv
+    Returns a CSV string from a Resultset.
+
+    Rows are written by the csv module, straight from the driver records
+    (no DataFrame, no index column). As a streaming format, ``encode``
+    yields the document in chunks of bytes, and ``write`` sends it to a
+    path, a file or an async sink, from a result or a cursor stream.
+
+    Args:
+        delimiter: field separator.
+        quoting: "minimal", "all", "nonnumeric", "none" (or a csv.QUOTE_* constant).
+        header: write the column names as first line.
+        encoding: encoding of the streamed chunks.
+        lineterminator: end of line.
+        chunk_size: rows by encoded chunk.
     """
 
-    async def serialize(self, result, error, *args, **kwargs):
-        df = None
+    synchronous: bool = True
+    streaming: bool = True
+
+    delimiter: str = ","
+
+    def __init__(
+        self,
+        delimiter: Optional[str] = None,
+        quoting: Union[str, int] = "minimal",
+        header: bool = True,
+        encoding: str = "utf-8",
+        lineterminator: str = "\n",
+        chunk_size: int = 1000,
+        **kwargs
+    ):
+        self._delimiter: str = delimiter or self.delimiter
+        self._quoting: int = QUOTING[quoting] if isinstance(quoting, str) else quoting
+        self._header: bool = header
+        self._encoding: str = encoding
+        self._lineterminator: str = lineterminator
+        self._chunk_size: int = chunk_size
+        # csv.QUOTE_NONE needs an escape character.
+        self._escapechar: Optional[str] = kwargs.get("escapechar", "\\" if self._quoting == csv.QUOTE_NONE else None)
+
+    def _writer(self, buffer: StringIO):
+        return csv.writer(
+            buffer,
+            delimiter=self._delimiter,
+            quoting=self._quoting,
+            lineterminator=self._lineterminator,
+            escapechar=self._escapechar,
+        )
+
+    def _rows(self, batch: Any, attributes: Optional[Sequence] = None) -> tuple:
+        """(column names, rows as sequences of values) of a batch."""
+        if lazy_isinstance(batch, "pandas.DataFrame"):
+            return list(batch.columns), list(batch.itertuples(index=False, name=None))
+        if lazy_isinstance(batch, "pyarrow.RecordBatch") or lazy_isinstance(batch, "pyarrow.Table"):
+            return batch.schema.names, list(zip(*(column.to_pylist() for column in batch.columns)))
+        if hasattr(batch, "keys"):
+            # a single row (ex: queryrow)
+            batch = [batch]
+        elif not isinstance(batch, (list, tuple)):
+            batch = list(batch)
+        names = column_names(batch, attributes)
+        if batch and isinstance(batch[0], dict):
+            # dicts iterate over their keys.
+            return names, [row.values() for row in batch]
+        return names, batch
+
+    def chunks(self, batch: Any, attributes: Optional[Sequence] = None, header: bool = False) -> Iterator[str]:
+        """CSV text of a batch, in chunks of chunk_size rows (the first one with the header)."""
+        names, rows = self._rows(batch, attributes)
+        buffer = StringIO()
+        writer = self._writer(buffer)
+        if header:
+            writer.writerow(names)
+        for start in range(0, max(len(rows), 1), self._chunk_size):
+            writer.writerows(rows[start:start + self._chunk_size])
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+    def convert(self, result, error, *args, **kwargs):
+        if error:
+            return (None, error)
+        if result is None:
+            return ("", error)
         try:
-            if isinstance(result, pandas.DataFrame):
-                df = result
-            else:
-                df = pandas.DataFrame(data=result, **kwargs)
-            csv_buffer = StringIO()
-            df.to_csv(csv_buffer)
-            self._result = csv_buffer.getvalue()
-        except pandas.errors.EmptyDataError as err:
-            error = Exception(f"Error with Empty Data: error: {err}")
-        except pandas.errors.ParserError as err:
-            error = Exception(f"Error parsing Data: error: {err}")
-        except ValueError as err:
-            error = Exception(f"Error Parsing a Column, error: {err}")
-        except Exception as err:
-            error = Exception(f"PandasFormat: Error on Data: error: {err}")
-        finally:
-            return (self._result, error)
+            return ("".join(self.chunks(result, header=self._header)), error)
+        except (csv.Error, TypeError) as err:
+            return (None, Exception(f"csvFormat: Error on Data: error: {err}"))
+
+    async def encode(self, batches: Any, attributes: Optional[Sequence] = None) -> AsyncIterator[bytes]:
+        header = self._header
+        async for batch in batches_of(batches):
+            for chunk in self.chunks(batch, attributes, header=header):
+                header = False
+                if chunk:
+                    yield chunk.encode(self._encoding)
+        if header and attributes:
+            # no rows: the header only.
+            yield next(self.chunks([], attributes, header=True)).encode(self._encoding)
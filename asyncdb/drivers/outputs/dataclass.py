@@ -13,6 +13,8 @@ class dataclassFormat(OutputFormat):
     Most Basic Definition of Format.
     """
 
+    synchronous: bool = True
+
     def __init__(self, **kwargs):
         self._model = None
         if "model" in kwargs:
@@ -22,6 +24,6 @@ class dataclassFormat(OutputFormat):
             pass
             # cls = make_dataclass('Output', )
 
-    async def serialize(self, result, error, *args, **kwargs):
+    def convert(self, result, error, *args, **kwargs):
         lsgen = [self._model(**dict(row)) for row in result]
         return (lsgen, error)
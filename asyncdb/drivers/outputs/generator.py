@@ -12,7 +12,9 @@ class genFormat(OutputFormat):
     Most Basic Definition of Format.
     """
 
-    async def serialize(self, result, error, *args, **kwargs):
+    synchronous: bool = True
+
+    def convert(self, result, error, *args, **kwargs):
         if error:
             return (None, error)
         lsgen = (dict(row) for row in result)
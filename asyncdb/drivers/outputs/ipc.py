@@ -0,0 +1,23 @@
+from typing import Any
+import pyarrow as pa
+from .arrow import ArrowFileFormat
+
+
+class ipcFormat(ArrowFileFormat):
+    """
+    Writes a Resultset as an Arrow IPC file (Feather v2), or as an IPC
+    stream with ``stream=True``; record batches of at most row_group_size rows.
+    """
+
+    def __init__(self, *args, stream: bool = False, **kwargs):
+        self._stream: bool = stream
+        super().__init__(*args, **kwargs)
+
+    def _writer(self, sink: Any, schema: pa.Schema) -> Any:
+        options = pa.ipc.IpcWriteOptions(compression=self._compression, **self._options)
+        if self._stream:
+            return pa.ipc.new_stream(sink, schema, options=options)
+        return pa.ipc.new_file(sink, schema, options=options)
+
+    def _write(self, writer: Any, table: pa.Table) -> None:
+        writer.write_table(table, max_chunksize=self._row_group_size)
@@ -3,8 +3,7 @@ Iterable.
 
 Output format returning a simple list of dictionaries.
 """
-import pandas
-from google.cloud.bigquery.table import RowIterator
+from ...utils.modules import lazy_isinstance
 from .base import OutputFormat
 
 
@@ -13,11 +12,13 @@ class iterFormat(OutputFormat):
     Most Basic Definition of Format.
     """
 
-    async def serialize(self, result, error, *args, **kwargs):
+    synchronous: bool = True
+
+    def convert(self, result, error, *args, **kwargs):
         try:
-            if isinstance(result, (RowIterator, list)):
+            if isinstance(result, list) or lazy_isinstance(result, "google.cloud.bigquery.table.RowIterator"):
                 data = [dict(row) for row in result]
-            elif isinstance(result, pandas.DataFrame):
+            elif lazy_isinstance(result, "pandas.DataFrame"):
                 data = result.to_dict(orient="records")
             else:
                 data = dict(result)
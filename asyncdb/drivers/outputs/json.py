@@ -1,22 +1,91 @@
-import pandas
+from collections.abc import AsyncIterator, Iterator, Sequence
+from typing import Any, Optional
+import orjson
 from ...utils.encoders import DefaultEncoder
-from .base import OutputFormat
+from ...utils.modules import lazy_isinstance
+from .base import OutputFormat, batches_of, column_names
+
+
+# orjson options of the streaming encoders: naive datetimes as UTC, numpy types and arrays.
+OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
 
 
 class jsonFormat(OutputFormat):
     """
     Most Basic Definition of Format.
+
+    A JSON array of the rows. As a streaming format, ``encode`` yields the
+    array as chunks of bytes (encoded by orjson, chunk_size rows each),
+    from a result or from the batches of a cursor stream.
+
+    Args:
+        option: orjson options of the streaming encoder.
+        chunk_size: rows by encoded chunk.
     """
 
+    synchronous: bool = True
+    streaming: bool = True
+
     _encoder = DefaultEncoder()
+    # framing of the streamed document.
+    _start: bytes = b"["
+    _end: bytes = b"]"
+    _separator: bytes = b","
+    _terminator: bytes = b""
 
-    async def serialize(self, result, error, *args, **kwargs):
+    def __init__(self, option: int = OPTIONS, chunk_size: int = 1000, **kwargs):
+        self._option: int = option
+        self._chunk_size: int = chunk_size
+
+    def convert(self, result, error, *args, **kwargs):
         if error:
             return (None, error)
-        if isinstance(result, pandas.DataFrame):
+        if lazy_isinstance(result, "pandas.DataFrame"):
             dump = result.to_dict(orient="records")
-        elif isinstance(result, pandas.Series):
+        elif lazy_isinstance(result, "pandas.Series"):
             dump = result.to_dict()
         else:
             dump = [dict(r) for r in result]
         return (self._encoder.dumps(dump), error)
+
+    def _rows(self, batch: Any, attributes: Optional[Sequence] = None) -> Sequence:
+        """Rows of a batch as dicts (orjson does not encode Records)."""
+        if lazy_isinstance(batch, "pandas.DataFrame"):
+            return batch.to_dict(orient="records")
+        if lazy_isinstance(batch, "pyarrow.RecordBatch") or lazy_isinstance(batch, "pyarrow.Table"):
+            return batch.to_pylist()
+        if hasattr(batch, "keys"):
+            # a single row (ex: queryrow)
+            batch = [batch]
+        elif not isinstance(batch, (list, tuple)):
+            batch = list(batch)
+        if not batch or isinstance(batch[0], dict):
+            return batch
+        if hasattr(batch[0], "keys"):
+            return [dict(row) for row in batch]
+        names = column_names(batch, attributes)
+        return [dict(zip(names, row)) for row in batch]
+
+    def chunks(self, batch: Any, attributes: Optional[Sequence] = None) -> Iterator[bytes]:
+        """Encoded rows of a batch, joined in chunks of chunk_size rows (without framing)."""
+        rows = self._rows(batch, attributes)
+        dumps = orjson.dumps
+        default = self._encoder.default
+        for start in range(0, len(rows), self._chunk_size):
+            encoded = [
+                dumps(row, default=default, option=self._option) for row in rows[start:start + self._chunk_size]
+            ]
+            yield self._separator.join(encoded) + self._terminator
+
+    async def encode(self, batches: Any, attributes: Optional[Sequence] = None) -> AsyncIterator[bytes]:
+        first = True
+        if self._start:
+            yield self._start
+        async for batch in batches_of(batches):
+            for chunk in self.chunks(batch, attributes):
+                if not first and not self._terminator:
+                    chunk = self._separator + chunk
+                first = False
+                yield chunk
+        if self._end:
+            yield self._end
@@ -0,0 +1,22 @@
+from .json import jsonFormat
+
+
+class ndjsonFormat(jsonFormat):
+    """
+    Newline-delimited JSON: one JSON object by row.
+
+    ``convert`` returns the NDJSON document as a string, ``encode`` yields
+    it in chunks of bytes (see jsonFormat).
+    """
+
+    _start: bytes = b""
+    _end: bytes = b""
+    _separator: bytes = b"\n"
+    _terminator: bytes = b"\n"
+
+    def convert(self, result, error, *args, **kwargs):
+        if error:
+            return (None, error)
+        if result is None:
+            return ("", error)
+        return (b"".join(self.chunks(result)).decode(), error)
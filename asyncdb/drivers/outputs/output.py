@@ -3,10 +3,17 @@ All Output formats supported by asyncdb.
 """
 
 from importlib import import_module
+from typing import Callable, Optional
+
+
+def _identity(result, error, *args, **kwargs):
+    return [result, error]
 
 
 class OutputFactory:
     _format: dict = {}
+    # shared (serializer, fast path) of the formats used per call.
+    _instances: dict = {}
 
     def __new__(cls, driver, frmt: str, *args, **kwargs):
         if frmt is None or frmt == "native":
@@ -27,3 +34,32 @@ class OutputFactory:
     @classmethod
     def register_format(cls, frmt, obj):
         cls._format[frmt] = obj
+        cls._instances.pop(frmt, None)
+
+    @classmethod
+    def shared(cls, driver, frmt: str) -> tuple:
+        """
+        (serializer, fast path) of a format without arguments, for a single call.
+        The format instance is created once and shared by every driver:
+        formats keep no state between calls.
+        """
+        if frmt is None or frmt == "native":
+            return driver.output, cls.fast_path(driver.output)
+        try:
+            return cls._instances[frmt]
+        except KeyError:
+            serializer = cls(driver, frmt)
+            pair = cls._instances[frmt] = (serializer, cls.fast_path(serializer))
+            return pair
+
+    @staticmethod
+    def fast_path(serializer) -> Optional[Callable]:
+        """
+        Plain function replacing the serializer coroutine, for identity
+        (ex: native) and synchronous formats; None for the other formats.
+        """
+        if getattr(serializer, "identity", False):
+            return _identity
+        if getattr(serializer, "synchronous", False):
+            return serializer.convert
+        return None
@@ -1,10 +1,31 @@
 import logging
 from io import StringIO
-from asyncpg import Record
+from typing import Optional, Union
 import pandas
+import pyarrow as pa
+import pyarrow.compute as pc
+from ...utils.modules import lazy_isinstance
+from ...conversions.pgrecords import to_arrow
 from .base import OutputFormat
 
 
+# Arrow type -> pandas nullable extension dtype ("numpy_nullable" backend).
+NULLABLE_DTYPES: dict = {
+    pa.int8(): pandas.Int8Dtype(),
+    pa.int16(): pandas.Int16Dtype(),
+    pa.int32(): pandas.Int32Dtype(),
+    pa.int64(): pandas.Int64Dtype(),
+    pa.uint8(): pandas.UInt8Dtype(),
+    pa.uint16(): pandas.UInt16Dtype(),
+    pa.uint32(): pandas.UInt32Dtype(),
+    pa.uint64(): pandas.UInt64Dtype(),
+    pa.bool_(): pandas.BooleanDtype(),
+    pa.float32(): pandas.Float32Dtype(),
+    pa.float64(): pandas.Float64Dtype(),
+    pa.string(): pandas.StringDtype(),
+    pa.large_string(): pandas.StringDtype(),
+}
+
 
 def pandas_parser(csv_stream: StringIO, chunksize: int, delimiter: str = ",", columns: list = None):
     """
@@ -16,39 +37,85 @@ def pandas_parser(csv_stream: StringIO, chunksize: int, delimiter: str = ",", co
     yield from pandas.read_csv(csv_stream, chunksize=chunksize, sep=delimiter, names=columns, header=None)
 
 
+def _categorize(table: pa.Table, categories: Union[list, float]) -> pa.Table:
+    """Dictionary-encode the text columns listed in categories (or with a distinct ratio under it)."""
+    rows = table.num_rows
+    for idx, field in enumerate(table.schema):
+        if not (pa.types.is_string(field.type) or pa.types.is_large_string(field.type)):
+            continue
+        if isinstance(categories, (list, tuple, set)):
+            if field.name not in categories:
+                continue
+        elif not rows or pc.count_distinct(table.column(idx)).as_py() / rows > categories:
+            continue
+        table = table.set_column(idx, field.name, pc.dictionary_encode(table.column(idx)))
+    return table
+
+
 class pandasFormat(OutputFormat):
     """
-    Returns a Pandas Dataframe from a Resultset
+    Returns a Pandas Dataframe from a Resultset.
+
+    Columns are built through Arrow, typed from the column metadata of the
+    driver (asyncpg attributes or a DB-API description).
+
+    Args:
+        dtype_backend: "numpy" (default), "numpy_nullable" (nullable extension
+            dtypes: Int64, boolean, string, ...) or "pyarrow" (pd.ArrowDtype columns,
+            no copy from Arrow).
+        categories: text columns returned as categoricals, a list of names or
+            the max. ratio of distinct values to rows (ex: 0.1).
     """
 
-    async def serialize(self, result, error, *args, **kwargs):
+    columnar: bool = True
+
+    def __init__(self, dtype_backend: Optional[str] = None, categories: Union[list, float, None] = None, **kwargs):
+        if dtype_backend not in (None, "numpy", "numpy_nullable", "pyarrow"):
+            raise ValueError(f"pandasFormat: unknown dtype_backend {dtype_backend!r}")
+        self._dtype_backend: Optional[str] = dtype_backend
+        self._categories: Union[list, float, None] = categories
+
+    def _types_mapper(self):
+        if self._dtype_backend == "pyarrow":
+            return pandas.ArrowDtype
+        if self._dtype_backend == "numpy_nullable":
+            return NULLABLE_DTYPES.get
+        return None
+
+    def to_pandas(self, table: Union[pa.Table, pa.RecordBatch], owned: bool = False) -> pandas.DataFrame:
+        """DataFrame of an Arrow table, releasing its columns while converting when ``owned``."""
+        if isinstance(table, pa.RecordBatch):
+            table = pa.Table.from_batches([table])
+        if self._categories:
+            table = _categorize(table, self._categories)
+        return table.to_pandas(types_mapper=self._types_mapper(), self_destruct=owned)
+
+    async def serialize(self, result, error, *args, attributes: list = None, **kwargs):
         df = None
         try:
             if isinstance(result, pandas.DataFrame):
                 df = result
-            elif isinstance(result, Record):
-                result = [dict(result)]
-                df = pandas.DataFrame(data=result, **kwargs)
-            elif isinstance(result, list):
-                if len(result) == 0:
-                    df = pandas.DataFrame()
-                else:
-                    result = [dict(row) for row in result]
-                    df = pandas.DataFrame(data=result, **kwargs)
+            elif lazy_isinstance(result, "pyarrow.RecordBatch") or lazy_isinstance(result, "pyarrow.Table"):
+                df = self.to_pandas(result)
+            elif lazy_isinstance(result, "google.cloud.bigquery.table.RowIterator"):
+                df = self.to_pandas(result.to_arrow(), owned=True)
             else:
                 result = result or []
-                df = pandas.DataFrame(data=[dict(row) for row in result], **kwargs)
-            self._result = df
+                if hasattr(result, "keys"):
+                    # a single row (ex: queryrow)
+                    result = [result]
+                elif not isinstance(result, list):
+                    result = list(result)
+                df = self.to_pandas(to_arrow(result, attributes), owned=True)
         except pandas.errors.EmptyDataError as err:
             error = Exception(f"Error with Empty Data: error: {err}")
         except pandas.errors.ParserError as err:
-            logging.error(error)
+            logging.error(err)
             error = Exception(f"Error parsing Data: error: {err}")
         except ValueError as err:
-            logging.error(error)
+            logging.error(err)
             error = Exception(f"Error Parsing a Column, error: {err}")
         except Exception as err:
-            logging.error(error)
+            logging.error(err)
             error = Exception(f"PandasFormat: Error on Data: error: {err}")
-        finally:
-            return (df, error)
+        return (df, error)
@@ -0,0 +1,17 @@
+from typing import Any
+import pyarrow as pa
+import pyarrow.parquet as pq
+from .arrow import ArrowFileFormat
+
+
+class parquetFormat(ArrowFileFormat):
+    """
+    Writes a Resultset as a Parquet file, one row group by row_group_size rows
+    (default compression: snappy).
+    """
+
+    def _writer(self, sink: Any, schema: pa.Schema) -> pq.ParquetWriter:
+        return pq.ParquetWriter(sink, schema, compression=self._compression or "snappy", **self._options)
+
+    def _write(self, writer: pq.ParquetWriter, table: pa.Table) -> None:
+        writer.write_table(table, row_group_size=self._row_group_size)
@@ -1,10 +1,9 @@
 import logging
-import pandas
 import io
 import uuid
-from google.cloud.bigquery.table import RowIterator
-from pandas import DataFrame
 import polars as pl
+from ...utils.modules import lazy_isinstance
+from ...conversions.pgrecords import to_arrow
 from .base import OutputFormat
 
 
@@ -42,37 +41,43 @@ def polars_parser(
 
 class polarsFormat(OutputFormat):
     """
-    Returns a PyPolars Dataframe from a Resultset
+    Returns a PyPolars Dataframe from a Resultset.
+
+    Rows are converted column by column into Arrow (typed from the column
+    metadata of the driver: asyncpg attributes or a DB-API description),
+    then handed to Polars without copies; UUIDs become strings and
+    numerics keep their decimal type.
     """
 
-    async def serialize(self, result, error, *args, **kwargs):
+    columnar: bool = True
+
+    async def serialize(self, result, error, *args, attributes: list = None, **kwargs):
         df = None
         try:
-            if isinstance(result, (RowIterator, list)):
-                data = [dict(row) for row in result]
-                a = pandas.DataFrame(data=data, **kwargs)
-                for col in a.select_dtypes(include=['object']):
-                    if len(a) > 0 and isinstance(a[col].iloc[0], uuid.UUID):
-                        a[col] = a[col].astype(str)
-                df = pl.from_pandas(a, **kwargs)
-            elif isinstance(result, DataFrame):
+            if isinstance(result, pl.DataFrame):
+                df = result
+            elif lazy_isinstance(result, "pyarrow.RecordBatch") or lazy_isinstance(result, "pyarrow.Table"):
+                df = pl.from_arrow(result, **kwargs)
+            elif lazy_isinstance(result, "google.cloud.bigquery.table.RowIterator"):
+                df = pl.from_arrow(result.to_arrow(), **kwargs)
+            elif lazy_isinstance(result, "pandas.DataFrame"):
                 for col in result.select_dtypes(include=['object']):
                     if len(result) > 0 and isinstance(result[col].iloc[0], uuid.UUID):
                         result[col] = result[col].astype(str)
                 df = pl.from_pandas(result, **kwargs)
+            elif result is None:
+                df = None
             else:
-                result = [dict(row) for row in result]
-                a = pandas.DataFrame(data=result, **kwargs)
-                for col in a.select_dtypes(include=['object']):
-                    if len(a) > 0 and isinstance(a[col].iloc[0], uuid.UUID):
-                        a[col] = a[col].astype(str)
-                df = pl.from_pandas(a, **kwargs)
-            self._result = df
+                if hasattr(result, "keys"):
+                    # a single row (ex: queryrow)
+                    result = [result]
+                elif not isinstance(result, (list, tuple)):
+                    result = list(result)
+                df = pl.from_arrow(to_arrow(result, attributes), **kwargs)
         except ValueError as err:
-            print(err)
+            logging.error(f"Polars Serialization Error: {err}")
             error = Exception(f"PolarFormat: Error Parsing Column: {err}")
         except Exception as err:
             logging.exception(f"Polars Serialization Error: {err}", stack_info=True)
             error = Exception(f"PolarFormat: Error on Data: error: {err}")
-        finally:
-            return (df, error)
+        return (df, error)
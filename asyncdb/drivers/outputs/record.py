@@ -14,8 +14,10 @@ class recordFormat(OutputFormat):
     Returns a List of Records from a Resultset
     """
 
-    async def serialize(self, result, error, *args, **kwargs):
-        self._result = None
+    synchronous: bool = True
+
+    def convert(self, result, error, *args, **kwargs):
+        _set = None
         if error:
             return (None, error)
         try:
@@ -26,9 +28,9 @@ class recordFormat(OutputFormat):
                     _set = [Record.from_dict(row) for row in result]
             else:
                 _set = Record.from_dict(result)
-            self._result = _set
         except (TypeError, ValueError, AttributeError) as err:
             logging.exception(f"Record Serialization Error: {err}", stack_info=True)
             error = Exception(f"recordFormat Error: {err}")
+            _set = None
         finally:
-            return (self._result, error)
+            return (_set, error)
@@ -14,14 +14,16 @@ class recordsetFormat(OutputFormat):
     Returns a List of Records from a Resultset
     """
 
-    async def serialize(self, result, error, *args, **kwargs):
-        self._result = None
+    synchronous: bool = True
+
+    def convert(self, result, error, *args, **kwargs):
+        _set = None
         if error:
             return (None, error)
         try:
-            self._result = Recordset.from_result(result)
+            _set = Recordset.from_result(result)
         except (TypeError, ValueError, AttributeError) as err:
             logging.exception(f"Recordset Serialization Error: {err}", stack_info=True)
             error = Exception(f"recordsetFormat: Error on Data: error: {err}")
         finally:
-            return (self._result, error)
+            return (_set, error)
@@ -0,0 +1,9 @@
+from .csv import csvFormat
+
+
+class tsvFormat(csvFormat):
+    """
+    Returns a TSV (tab-separated values) string from a Resultset.
+    """
+
+    delimiter: str = "\t"
@@ -6,15 +6,18 @@ This provider implements basic funcionalities from asyncpg
 """
 
 import asyncio
+import codecs
+import csv
 from enum import Enum
 import io
 import os
+import re
 import ssl
 import time
 import uuid
+import weakref
 from collections.abc import Callable, Iterable
 from typing import Any, AsyncGenerator, Generator, Optional, Union
-from dataclasses import is_dataclass
 import contextlib
 from datamodel import BaseModel
 import asyncpg
@@ -26,17 +29,21 @@ from asyncpg.exceptions import (
     InterfaceWarning,
     InternalClientError,
     InvalidSQLStatementNameError,
+    InvalidCachedStatementError,
+    OutdatedSchemaCacheError,
     PostgresError,
     PostgresSyntaxError,
     TooManyConnectionsError,
     UndefinedColumnError,
     UndefinedTableError,
     UniqueViolationError,
+    UnsupportedClientFeatureError,
     ForeignKeyViolationError,
     NotNullViolationError,
     QueryCanceledError
 )
 from asyncpg.pgproto import pgproto
+from asyncpg.prepared_stmt import PreparedStatement
 try:
     from pgvector.asyncpg import register_vector
 except ImportError:
@@ -54,7 +61,8 @@ from ..interfaces.model import ModelBackend
 from ..interfaces.cursors import DBCursorBackend
 from ..models import Model
 from ..utils.encoders import DefaultEncoder
-from ..utils.types import Entity
+from ..utils.buffers import ChunkQueue
+from ..utils.lru import LRUCache
 from .base import BasePool
 from .sql import SQLCursor, SQLDriver
 
@@ -62,6 +70,25 @@ from .sql import SQLCursor, SQLDriver
 max_cached_statement_lifetime = 600
 max_cacheable_statement_size = 1024 * 15
 
+# Prepared statements are bound to the connection that prepared them:
+# one LRU cache per (raw) asyncpg connection, shared by every pg wrapper
+# (pool connections are wrapped on each acquire).
+_statement_caches: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _rebind(stmt: PreparedStatement) -> Optional[PreparedStatement]:
+    """
+    A usable handle of a cached statement. asyncpg invalidates the handles
+    when the connection is released to the pool (its reset query keeps the
+    server-side statements): the statement is bound again, without a round-trip.
+    Returns None when the statement was closed.
+    """
+    if stmt._con_release_ctr == stmt._connection._pool_release_ctr:
+        return stmt
+    if stmt._state.closed:
+        return None
+    return PreparedStatement(stmt._connection, stmt._query, stmt._state)
+
 
 class NAVConnection(asyncpg.Connection):
     """
@@ -131,6 +158,10 @@ class pgPool(BasePool):
             self._min_size = kwargs["min_size"]
         if "numeric_as_float" in kwargs:
             self._numeric_as_float = kwargs["numeric_as_float"]
+        # explicit prepared statements cached per connection (0: disabled)
+        self._prepared_cache_size: int = kwargs.get("prepared_cache_size", 128)
+        # result cache shared by the acquired connections.
+        self._query_cache = kwargs.get("cache", None)
         # Connection Configuration:
         try:
             self._connection_config = params.pop("connection_config", {})
@@ -191,12 +222,16 @@ class pgPool(BasePool):
             return [result, error]  # pylint: disable=W0150
 
     async def init_connection(self, connection):
+        self._metrics.connection_opened(connection)
         # Setup jsonb encoder/decoder
         def _encoder(value):
             # return json.dumps(value, cls=BaseEncoder)
             return self._encoder.dumps(value)  # pylint: disable=E1120
 
         def _decoder(value):
+            if value[:1] == "\x01":
+                # jsonb inside a record (ex: pipelines) is sent in binary: version byte + text.
+                value = value[1:]
             return self._encoder.loads(value)  # pylint: disable=E1120
 
         await connection.set_type_codec(
@@ -318,6 +353,17 @@ class pgPool(BasePool):
             self._logger.exception(f"Asyncpg Unknown Error: {ex}", stack_info=True)
             raise DriverError(f"Asyncpg Unknown Error: {ex}") from ex
 
+    def _pool_stats(self) -> dict:
+        size = self._pool.get_size()
+        idle = self._pool.get_idle_size()
+        return {
+            "size": size,
+            "in_use": size - idle,
+            "idle": idle,
+            "min_size": self._pool.get_min_size(),
+            "max_clients": self._pool.get_max_size(),
+        }
+
     async def acquire(self):
         """
         Takes a connection from the pool.
@@ -326,7 +372,8 @@ class pgPool(BasePool):
         self._connection = None
         # Take a connection from the pool.
         try:
-            self._connection = await self._pool.acquire()
+            with self._metrics.acquiring():
+                self._connection = await self._pool.acquire()
         except TooManyConnectionsError as err:
             self._logger.error(f"Too Many Connections Error: {err}")
             raise TooManyConnections(f"Too Many Connections Error: {err}") from err
@@ -342,10 +389,11 @@ class pgPool(BasePool):
             raise ProviderError(f"Interface Error: {err}") from err
         except InterfaceWarning as err:
             self._logger.warning(f"Interface Warning: {err}")
-        except Exception as err:  # pylint: disable=W0703
+        except Exception as err:
             self._logger.error(f"Unknown Error on Acquire: {err}")
+            raise ProviderError(f"Unknown Error on Acquire: {err}") from err
         if self._connection:
-            db = pg(pool=self)
+            db = pg(pool=self, prepared_cache_size=self._prepared_cache_size, cache=self._query_cache)
             db.set_connection(self._connection)
         return db
 
@@ -367,10 +415,12 @@ class pgPool(BasePool):
             return True
         try:
             await self._pool.release(conn, timeout=timeout)
+            self._metrics.release()
             return True
         except asyncio.exceptions.CancelledError:
             pass
         except InterfaceError as err:
+            self._metrics.failure(err)
             raise ProviderError(message=f"Release Interface Error: {err}") from err
         except InternalClientError as err:
             self._logger.debug(
@@ -379,6 +429,7 @@ class pgPool(BasePool):
             )
             return False
         except Exception as err:
+            self._metrics.failure(err)
             raise ProviderError(message=f"Release Error: {err}") from err
 
     async def wait_close(self, gracefully=True, timeout=5):
@@ -468,6 +519,218 @@ class pgCursor(SQLCursor):
     _connection: asyncpg.Connection = None
 
 
+# text that is not SQL code: string literals, quoted identifiers, comments and dollar quotes.
+_skipped = (
+    r"(?<![\w$])[Ee]'(?:[^'\\]|\\.|'')*'|'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\""
+    r"|--[^\n]*|/\*.*?\*/|(?<![\w$])\$(?P<tag>(?:[A-Za-z_]\w*)?)\$.*?\$(?P=tag)\$"
+)
+_lexemes = re.compile(rf"(?P<skip>{_skipped})|(?<![\w$])\$(?P<param>\d+)", re.DOTALL)
+
+
+def _code(sentence: str) -> str:
+    """The SQL code of sentence, with literals, identifiers and comments blanked out."""
+    return _lexemes.sub(lambda m: " " if m.group("skip") else m.group(0), sentence)
+
+
+def _renumber(sentence: str, offset: int) -> str:
+    """Shift the $n placeholders of sentence (outside literals and comments) by offset."""
+    if not offset:
+        return sentence
+    return _lexemes.sub(
+        lambda m: f"${int(m.group('param')) + offset}" if m.group("param") else m.group(0), sentence
+    )
+
+
+def _record_ends(text: str, quote: str = '"'):
+    """Offsets after every complete CSV record of text (newlines outside quoted fields)."""
+    pos = 0
+    quoted = False
+    for line in text.split('\n')[:-1]:
+        pos += len(line) + 1
+        if line.count(quote) % 2:
+            quoted = not quoted
+        if not quoted:
+            yield pos
+
+
+_reading = re.compile(r"^\s*(?:SELECT|VALUES|TABLE|WITH)\b", re.IGNORECASE)
+_modifying = re.compile(r"\b(?:INSERT|UPDATE|DELETE|MERGE|INTO)\b", re.IGNORECASE)
+_ordering = re.compile(r"\(|\)|\bORDER\s+BY\b", re.IGNORECASE)
+
+
+def _ordered(code: str) -> bool:
+    """An ORDER BY at the top level of the statement (not in a subquery or a window)."""
+    depth = 0
+    for m in _ordering.finditer(code):
+        token = m.group(0)
+        if token == "(":
+            depth += 1
+        elif token == ")":
+            depth -= 1
+        elif not depth:
+            return True
+    return False
+
+
+def _combinable(sentence: str) -> bool:
+    """
+    A read statement that can run as a subquery: not a data-modifying one,
+    SHOW, ..., and without an order of rows to keep (ORDER BY).
+    """
+    code = _code(sentence)
+    if "/*" in code or "*/" in code:
+        # nested comments.
+        return False
+    return bool(_reading.match(code)) and not _modifying.search(code) and not _ordered(code)
+
+
+class pgPipeline:
+    """pgPipeline.
+
+    Collects statements and sends them in (roughly) one round-trip, results
+    are returned in order by ``run()`` (called on exit of the context).
+
+    Consecutive reads (query, queryrow, fetchval of SELECT, VALUES, TABLE or
+    read-only WITH statements, without a top-level ORDER BY) are sent as a
+    single statement: the rows of every one come in an array (``ARRAY(SELECT
+    ...)``), decoded with the types of the server, and the column names from
+    its first row. Other statements (ordered reads, writes, INSERT ...
+    RETURNING, data-modifying CTEs, SHOW, ...) are sent one by one, in
+    order, a round-trip each; execute returns the status of each one. Rows
+    are returned as dicts.
+
+    Statements are not atomic: every one commits on its own, unless
+    ``transaction`` is set (a single transaction for the whole pipeline).
+
+    Usage:
+        async with conn.pipeline() as pipe:
+            pipe.queryrow("SELECT * FROM users WHERE id = $1", 10)
+            pipe.fetchval("SELECT count(*) FROM orders WHERE user_id = $1", 10)
+        user, orders = pipe.results
+    """
+
+    def __init__(self, driver: "pg", transaction: bool = False):
+        self._driver = driver
+        self._transaction = transaction
+        self._entries: list = []
+        self.results: list = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _add(self, kind: str, sentence: str, args: tuple) -> int:
+        if not sentence:
+            raise EmptyStatement("Pipeline: cannot use an empty sentence")
+        self._entries.append((kind, sentence.strip().rstrip(";"), args))
+        return len(self._entries) - 1
+
+    def query(self, sentence: str, *args) -> int:
+        """Adds a query (list of rows), returns its position on the results."""
+        return self._add("query", sentence, args)
+
+    def queryrow(self, sentence: str, *args) -> int:
+        """Adds a query of a single row (or None)."""
+        return self._add("queryrow", sentence, args)
+
+    def fetchval(self, sentence: str, *args) -> int:
+        """Adds a query of a single value (or None)."""
+        return self._add("fetchval", sentence, args)
+
+    def execute(self, sentence: str, *args) -> int:
+        """Adds a statement without results, returns its status."""
+        return self._add("execute", sentence, args)
+
+    async def __aenter__(self) -> "pgPipeline":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None and self._entries:
+            await self.run()
+
+    async def run(self) -> list:
+        """
+        Sends the pending statements, returns the results of every statement in order.
+        """
+        driver = self._driver
+        entries, self._entries = self._entries, []
+        if not entries:
+            return self.results
+        if not driver._connection:
+            await driver.connection()
+        driver.start_timing()
+        transaction = driver._connection.transaction() if self._transaction else contextlib.nullcontext()
+        try:
+            async with transaction:
+                results = []
+                for combined, group in self._groups(entries):
+                    if combined:
+                        results.extend(await self._reads(group))
+                    else:
+                        for entry in group:
+                            results.append(await self._run_one(*entry))
+        except (PostgresError, InterfaceError) as err:
+            raise DriverError(f"Pipeline Error: {err}") from err
+        finally:
+            driver.generated_at()
+        self.results = results
+        return results
+
+    @staticmethod
+    def _groups(entries: list):
+        """Runs of consecutive entries: (combined reads?, entries)."""
+        group, current = [], None
+        for entry in entries:
+            combined = entry[0] != "execute" and _combinable(entry[1])
+            if combined != current and group:
+                yield current, group
+                group = []
+            current = combined
+            group.append(entry)
+        if group:
+            yield current, group
+
+    async def _reads(self, entries: list) -> list:
+        driver = self._driver
+        if len(entries) == 1:
+            return [await self._run_one(*entries[0])]
+        columns, sources, params = [], [], []
+        for i, (kind, sentence, args) in enumerate(entries):
+            # a single row (or value): the first one only.
+            limit = "" if kind == "query" else " LIMIT 1"
+            # (a newline closes a trailing comment)
+            sources.append(f"ARRAY(SELECT _r FROM ({_renumber(sentence, len(params))}\n) AS _r{limit}) AS _s{i}")
+            # column names, from the first row.
+            columns.append(f"_s{i}, ARRAY(SELECT json_object_keys(row_to_json(_s{i}[1])))")
+            params.extend(args)
+        batch = "SELECT " + ", ".join(columns) + " FROM (SELECT " + ", ".join(sources) + ") AS _a"
+        try:
+            _, row = await driver._run_prepared(batch, "fetchrow", *params)
+        except UnsupportedClientFeatureError as err:
+            # a column type (or custom codec) without binary decoding inside records.
+            driver._logger.warning(f"Pipeline: sending the statements one by one: {err}")
+            return [await self._run_one(*entry) for entry in entries]
+        results = []
+        for i, (kind, _, _) in enumerate(entries):
+            rows, names = row[2 * i] or [], row[2 * i + 1]
+            if kind == "fetchval":
+                results.append(rows[0][0] if rows else None)
+                continue
+            rows = [dict(zip(names, r)) for r in rows]
+            results.append(rows if kind == "query" else (rows[0] if rows else None))
+        return results
+
+    async def _run_one(self, kind: str, sentence: str, args: tuple) -> Any:
+        if kind == "execute":
+            return await self._driver._connection.execute(sentence, *args)
+        method = {"query": "fetch", "queryrow": "fetchrow", "fetchval": "fetchval"}[kind]
+        _, result = await self._driver._run_prepared(sentence, method, *args)
+        if kind == "query":
+            return [dict(row) for row in result]
+        if kind == "queryrow" and result is not None:
+            return dict(result)
+        return result
+
+
 class pg(SQLDriver, DBCursorBackend, ModelBackend):
     _provider = "pg"
     _syntax = "sql"
@@ -480,10 +743,15 @@ class pg(SQLDriver, DBCursorBackend, ModelBackend):
         self._cursor = None
         self._transaction = None
         self._server_settings = {}
+        self.stream_stats: dict = {}
         SQLDriver.__init__(self, dsn=dsn, loop=loop, params=params, **kwargs)
         self._custom_record: bool = kwargs.get("custom_record", False)
         self._record_class_ = kwargs.get("record_class", pgRecord)
         self._cache_size: int = kwargs.get("cache_size", 36000)
+        # explicit prepared statements cached per connection (0: disabled)
+        self._prepared_cache_size: int = kwargs.get("prepared_cache_size", 128)
+        # max. rows per multi-row INSERT on Model.create
+        self._insert_batch_size: int = kwargs.get("insert_batch_size", 1000)
         self._enable_vector: bool = kwargs.get("enable_vector", False)
         #  max_inactive_connection_lifetime
         self._max_inactive_timeout = kwargs.pop("max_inactive_timeout", 360000)
@@ -582,6 +850,9 @@ class pg(SQLDriver, DBCursorBackend, ModelBackend):
             return self._encoder.dumps(value)  # pylint: disable=E1120
 
         def _decoder(value):
+            if value[:1] == "\x01":
+                # jsonb inside a record (ex: pipelines) is sent in binary: version byte + text.
+                value = value[1:]
             return self._encoder.loads(value)  # pylint: disable=E1120
 
         await conn.set_type_codec(
@@ -765,15 +1036,107 @@ class pg(SQLDriver, DBCursorBackend, ModelBackend):
         finally:
             return [self._prepared, error]  # pylint: disable=W0150
 
-    async def query(self, sentence: Union[str, Any], *args, **kwargs):
+    ## Prepared Statement Cache
+    def _statement_cache(self) -> Optional[LRUCache]:
+        if not self._prepared_cache_size or not self._connection:
+            return None
+        # unwrap pool connection proxies.
+        conn = getattr(self._connection, "_con", None) or self._connection
+        try:
+            return _statement_caches[conn]
+        except KeyError:
+            cache = _statement_caches[conn] = LRUCache(maxsize=self._prepared_cache_size)
+            return cache
+
+    async def _prepare_cached(self, sentence: str):
+        """
+        Returns the prepared statement of sentence from the connection cache,
+        preparing (Parse/Describe round-trip) only on a cache miss.
+        """
+        cache = self._statement_cache()
+        if cache is None:
+            return await self._connection.prepare(sentence)
+        stmt = cache.get(sentence)
+        if stmt is not None:
+            stmt = _rebind(stmt)
+        if stmt is None:
+            stmt = await self._connection.prepare(sentence)
+        cache.put(sentence, stmt)
+        return stmt
+
+    async def _run_prepared(self, sentence: str, method: str, *args, **kwargs):
+        """
+        Runs a method (fetch, fetchrow, ...) of a cached prepared statement,
+        returning (stmt, result). The statement is prepared again (once) when the
+        server invalidated the cached plan (ex: after an ALTER TABLE).
+        """
+        stmt = await self._prepare_cached(sentence)
+        try:
+            return stmt, await getattr(stmt, method)(*args, **kwargs)
+        except (InvalidCachedStatementError, OutdatedSchemaCacheError):
+            self.invalidate_statements(sentence)
+            if self._connection.is_in_transaction():
+                # the transaction is aborted, cannot retry.
+                raise
+        stmt = await self._prepare_cached(sentence)
+        return stmt, await getattr(stmt, method)(*args, **kwargs)
+
+    def invalidate_statements(self, sentence: str = None) -> None:
+        """
+        Remove a sentence (or all of them) from the prepared statement cache.
+        """
+        if (cache := self._statement_cache()) is not None:
+            if sentence is None:
+                cache.clear()
+            else:
+                cache.pop(sentence)
+
+    def statement_cache_stats(self) -> dict:
+        """
+        Hit/Miss/Eviction counters of the prepared statement cache.
+        """
+        if (cache := self._statement_cache()) is not None:
+            return cache.stats()
+        return {}
+
+    def _serializer_is_columnar(self, serializer: Any = None) -> bool:
+        return getattr(serializer or self._serializer, "columnar", False)
+
+    async def _serialize(self, result, error, serializer: Any = None, attributes: Any = None):
+        """_serialize.
+
+        Calls the output serializer (default: the driver's), passing the statement
+        attributes to columnar formats (arrow) to build typed columns.
+        """
+        serializer = serializer or self._serializer
+        if self._serializer_is_columnar(serializer):
+            return await serializer(result, error, attributes=attributes or self._attributes)
+        return await serializer(result, error)
+
+    async def query(self, sentence: Union[str, Any], *args, format: Optional[str] = None, **kwargs):  # pylint: disable=W0622
+        """query.
+
+        Returns [result, error], serialized by the output format of the driver
+        or by ``format`` (only for this call).
+        """
         self._result = None
         error = None
+        attributes = None
+        serializer, output = self._output_for(format)
         await self.valid_operation(sentence)
         try:
             self.start_timing()
-            self._result = await self._connection.fetch(sentence, *args, **kwargs)
-            if not self._result:
-                return [None, "Data was not found"]
+            if self._serializer_is_columnar(serializer):
+                # columnar formats are typed from the statement attributes.
+                if kwargs:
+                    stmt = await self._connection.prepare(sentence, **kwargs)
+                    self._result = await stmt.fetch(*args)
+                else:
+                    stmt, self._result = await self._run_prepared(sentence, "fetch", *args)
+                self._attributes = attributes = stmt.get_attributes()
+                self._columns = [a.name for a in attributes]
+            else:
+                self._result = await self._connection.fetch(sentence, *args, **kwargs)
         except RuntimeError as err:
             error = f"Query Error: {err}"
         except (InvalidSQLStatementNameError, PostgresSyntaxError, UndefinedColumnError, UndefinedTableError) as err:
@@ -782,22 +1145,24 @@ class pg(SQLDriver, DBCursorBackend, ModelBackend):
             error = f"Postgres Error: {err}"
         except Exception as err:  # pylint: disable=W0703
             error = f"Error on Query: {err}"
-        finally:
-            self.generated_at()
-            return [None, error] if error else await self._serializer(self._result, error)  # pylint: disable=W0150
-
-    async def queryrow(self, sentence: str, *args):
+        self.generated_at()
+        if error:
+            return [None, error]
+        if output is not None:
+            return output(self._result, error)
+        return await self._serialize(self._result, error, serializer, attributes)
+
+    async def queryrow(self, sentence: str, *args, format: Optional[str] = None):  # pylint: disable=W0622
         self._result = None
         error = None
+        attributes = None
+        serializer, output = self._output_for(format)
         started = self.start_timing()
         await self.valid_operation(sentence)
         try:
-            stmt = await self._connection.prepare(sentence)
-            self._attributes = stmt.get_attributes()
-            self._columns = [a.name for a in self._attributes]
-            self._result = await stmt.fetchrow(*args)
-            if not self._result:
-                return [None, "Data was not found"]
+            stmt, self._result = await self._run_prepared(sentence, "fetchrow", *args)
+            self._attributes = attributes = stmt.get_attributes()
+            self._columns = [a.name for a in attributes]
         except RuntimeError as err:
             error = f"Query Error: {err}"
         except (InvalidSQLStatementNameError, PostgresSyntaxError, UndefinedColumnError, UndefinedTableError) as err:
@@ -806,9 +1171,10 @@ class pg(SQLDriver, DBCursorBackend, ModelBackend):
             error = f"Postgres Error: {err}"
         except Exception as err:  # pylint: disable=W0703
             error = f"Error on Query Row: {err}"
-        finally:
-            self.generated_at(started)
-            return await self._serializer(self._result, error)  # pylint: disable=W0150
+        self.generated_at(started)
+        if output is not None:
+            return output(self._result, error)
+        return await self._serialize(self._result, error, serializer, attributes)
 
     async def execute(self, sentence: Any, *args, **kwargs) -> Optional[Any]:
         """Execute a transaction
@@ -846,6 +1212,8 @@ class pg(SQLDriver, DBCursorBackend, ModelBackend):
             error = f"Error on Execute: {err}"
         finally:
             self.generated_at()
+            if self._output_sync is not None:
+                return self._output_sync(self._result, error)  # pylint: disable=W0150
             return await self._serializer(self._result, error)  # pylint: disable=W0150
 
     async def execute_many(self, sentence: str, *args):
@@ -882,6 +1250,8 @@ class pg(SQLDriver, DBCursorBackend, ModelBackend):
             error = f"Error on Execute: {err}"
         finally:
             self.generated_at()
+            if self._output_sync is not None:
+                return self._output_sync(self._result, error)  # pylint: disable=W0150
             return await self._serializer(self._result, error)  # pylint: disable=W0150
 
     executemany = execute_many
@@ -891,10 +1261,9 @@ class pg(SQLDriver, DBCursorBackend, ModelBackend):
         await self.valid_operation(sentence)
         try:
             self.start_timing()
-            stmt = await self._connection.prepare(sentence)
+            stmt, result = await self._run_prepared(sentence, "fetch", *args)
             self._attributes = stmt.get_attributes()
             self._columns = [a.name for a in self._attributes]
-            result = await stmt.fetch(*args)
             if not result:
                 return None
             return result
@@ -941,6 +1310,15 @@ class pg(SQLDriver, DBCursorBackend, ModelBackend):
         finally:
             self.generated_at()
 
+    ## Pipeline
+    def pipeline(self, transaction: bool = False) -> pgPipeline:
+        """pipeline.
+
+        Context collecting statements to send them in one round-trip,
+        see pgPipeline. ``transaction`` runs them in a transaction.
+        """
+        return pgPipeline(self, transaction=transaction)
+
     ## Transaction Context
     async def transaction(self):
         if not self._connection:
@@ -992,6 +1370,24 @@ class pg(SQLDriver, DBCursorBackend, ModelBackend):
             error = f"Error Fetchrow Cursor: {err}"
             raise DriverError(error) from err
 
+    async def _fetch_batches(self, sentence: str, params: Iterable[Any], batch_size: int, arrow: bool = False):
+        """
+        Server-side cursor (inside a transaction) fetching batch_size rows per round-trip.
+        """
+        await self.valid_operation(sentence)
+        try:
+            async with self._connection.transaction():
+                stmt = await self._connection.prepare(sentence)
+                self._attributes = stmt.get_attributes()
+                self._columns = [a.name for a in self._attributes]
+                cursor = await stmt.cursor(*params)
+                while rows := await cursor.fetch(batch_size):
+                    yield rows
+        except (InvalidSQLStatementNameError, PostgresSyntaxError, UndefinedColumnError, UndefinedTableError) as err:
+            raise StatementError(f"Sentence Error: {err}") from err
+        except PostgresError as err:
+            raise DriverError(f"Postgres Error on Stream: {err}") from err
+
     ## Cursor Iterator Context
     def __aiter__(self):
         return self
@@ -1150,132 +1546,186 @@ class pg(SQLDriver, DBCursorBackend, ModelBackend):
     async def use(self, database: str):
         raise NotImplementedError  # pragma: no cover
 
-    async def _insert_(self, _model: Model, **kwargs):  # pylint: disable=W0613
+    def _insert_values_(self, _model: Model) -> tuple[list, list, list]:
         """
-        insert a row from model.
+        Returns the columns to be inserted, their values and
+        all the columns of a Model instance.
         """
-        try:
-            schema = ""
-            sc = _model.Meta.schema
-            if sc:
-                schema = f"{sc}."
-            table = f"{schema}{_model.Meta.name}"
-        except AttributeError:
-            table = _model.__name__
         cols = []
         columns = []
         source = []
-        _filter = {}
-        n = 1
-        fields = _model.columns()
-        for name, field in fields.items():
+        for name, _, required, db_default, default, _ in self._model_plan_(_model).fields:
             try:
-                val = getattr(_model, field.name)
+                value = getattr(_model, name)
             except AttributeError:
                 continue
             ## getting the value of column:
-            value = self._get_value(field, val)
-            column = field.name
-            columns.append(column)
+            if isinstance(value, Enum):
+                value = value.value
+            columns.append(name)
             # validating required field
-            try:
-                required = field.required()
-            except AttributeError:
-                required = False
-            pk = self._get_attribute(field, value, attr="primary_key")
-            if pk is True and value is None:
-                if "db_default" in field.metadata:
-                    continue
-            if required is False and value is None or value == "None":
-                if "db_default" in field.metadata:
-                    continue
-                else:
-                    # get default value
-                    default = field.default
-                    if callable(default):
-                        value = default()
-                    else:
+            if value is None or value == "None":
+                if required is True and value is None:
+                    if db_default:
+                        # field get a default value from database
                         continue
-            elif required is True and value is None or value == "None":
-                if "db_default" in field.metadata:
-                    # field get a default value from database
-                    continue
-                else:
                     raise ValueError(f"Field {name} is required and value is null over {_model.Meta.name}")
-            elif is_dataclass(value):
-                if isinstance(value, BaseModel):
-                    ### get value for primary key associated with.
-                    try:
-                        value = getattr(value, name)
-                    except AttributeError:
-                        value = None
-            elif isinstance(value, Enum):
-                value = value.value
+                if required is False or value == "None":
+                    if db_default or default is None:
+                        continue
+                    # get default value
+                    value = default()
+            elif isinstance(value, BaseModel):
+                ### get value for primary key associated with.
+                value = getattr(value, name, None)
             source.append(value)
-            cols.append(column)
-            n += 1
-            if pk := self._get_attribute(field, value, attr="primary_key"):
-                _filter[column] = pk
+            cols.append(name)
+        return cols, source, columns
+
+    async def _insert_(self, _model: Model, **kwargs):  # pylint: disable=W0613
+        """
+        insert a row from model.
+        """
+        plan = self._model_plan_(_model)
+        cols, source, columns = self._insert_values_(_model)
         try:
-            cols = ",".join(cols)
-            values = ",".join(["${}".format(a) for a in range(1, n)])  # pylint: disable=C0209
-            columns = ",".join(columns)
-            primary = f"RETURNING {columns}"
-            insert = f"INSERT INTO {table}({cols}) VALUES({values}) {primary}"
+            key = ("insert", tuple(cols), tuple(columns))
+            if (insert := plan.statements.get(key)) is None:
+                values = ",".join([f"${a}" for a in range(1, len(source) + 1)])
+                insert = f"INSERT INTO {plan.table}({','.join(cols)}) VALUES({values}) RETURNING {','.join(columns)}"
+                plan.statements[key] = insert
             self._logger.debug(f"INSERT: {insert}")
-            stmt = await self._connection.prepare(insert)
-            result = await stmt.fetchrow(*source, timeout=2)
+            stmt, result = await self._run_prepared(insert, "fetchrow", *source, timeout=2)
             self._logger.debug(stmt.get_statusmsg())
             if result:
-                _model.reset_values()
-                for f, val in result.items():
-                    setattr(_model, f, val)
+                self._hydrate_(_model, result)
                 return _model
         except UniqueViolationError:
             raise
         except Exception as err:
             raise DriverError(message=f"Error on Insert over table {_model.Meta.name}: {err!s}") from err
 
+    async def _insert_many_(self, _model: Model, records: list, returning: bool = True, upsert: bool = False) -> list:
+        """
+        Batched insert of Model instances in a single transaction,
+        using multi-row INSERT ... RETURNING (returning or upsert) or COPY.
+        An upsert updates the rows with the same primary key (ON CONFLICT).
+        """
+        plan = self._model_plan_(_model)
+        schema = getattr(_model.Meta, "schema", None)
+        name = getattr(_model.Meta, "name", _model.__name__)
+        table = f"{schema}.{name}" if schema else name
+        if upsert and not plan.primary_keys:
+            raise ValueError(f"Upsert over {name} requires a primary key on the Model")
+        rows = [(record, *self._insert_values_(record)) for record in records]
+        try:
+            async with self._connection.transaction():
+                for cols, group in self._group_rows(rows).items():
+                    if not cols:
+                        # only database defaults.
+                        for record, _, _, columns in group:
+                            result = await self._connection.fetchrow(
+                                f"INSERT INTO {table} DEFAULT VALUES RETURNING {','.join(columns)}"
+                            )
+                            self._hydrate_(record, result)
+                    elif returning or upsert:
+                        await self._insert_returning_(
+                            table, cols, group, plan.primary_keys, upsert=upsert, returning=returning
+                        )
+                    else:
+                        await self._connection.copy_records_to_table(
+                            name,
+                            records=[source for _, _, source, _ in group],
+                            columns=list(cols),
+                            schema_name=schema or None
+                        )
+            return records
+        except UniqueViolationError:
+            raise
+        except Exception as err:
+            raise DriverError(message=f"Error on Insert over table {name}: {err!s}") from err
+
+    async def _insert_returning_(
+        self,
+        table: str,
+        cols: tuple,
+        group: list,
+        keys: tuple,
+        upsert: bool = False,
+        returning: bool = True
+    ) -> None:
+        ncols = len(cols)
+        # asyncpg accepts at most 32767 arguments per statement.
+        size = max(1, min(self._insert_batch_size, 32767 // ncols))
+        columns = ",".join(group[0][3])
+        conflict = ""
+        if upsert:
+            updated = [col for col in cols if col not in keys] or list(keys)
+            conflict = f" ON CONFLICT ({','.join(keys)}) DO UPDATE SET " + ",".join(
+                f"{col} = EXCLUDED.{col}" for col in updated
+            )
+        # rows are matched to their records by primary key, when inserted with one.
+        keyed = bool(keys) and all(key in cols for key in keys)
+        positions = [cols.index(key) for key in keys] if keyed else []
+        for i in range(0, len(group), size):
+            chunk = group[i:i + size]
+            values = ",".join(
+                "(" + ",".join(f"${j * ncols + k}" for k in range(1, ncols + 1)) + ")"
+                for j in range(len(chunk))
+            )
+            insert = f"INSERT INTO {table}({','.join(cols)}) VALUES {values}{conflict} RETURNING {columns}"
+            args = [value for _, _, source, _ in chunk for value in source]
+            _, result = await self._run_prepared(insert, "fetch", *args)
+            if not returning:
+                continue
+            if keyed:
+                pairs = self._pair_rows(
+                    [(record, tuple(source[p] for p in positions)) for record, _, source, _ in chunk], keys, result
+                )
+            else:
+                # keys generated by the database: rows come back in the order of VALUES.
+                pairs = zip((record for record, *_ in chunk), result)
+            for record, row in pairs:
+                self._hydrate_(record, row)
+
+    def _hydrate_(self, _model: Model, row: Any) -> None:
+        if not row:
+            return
+        if _model.Meta.validate_assignment:
+            _model.reset_values()
+            for f, val in row.items():
+                setattr(_model, f, val)
+            return
+        # same result of reset_values() + setattr, without the per-attribute hook.
+        fields = _model.__fields__
+        values = {}
+        for f, val in row.items():
+            if f in fields:
+                values[f] = val
+                object.__setattr__(_model, f, val)
+            else:
+                setattr(_model, f, val)
+        object.__setattr__(_model, "__values__", values)
+
     async def _delete_(self, _model: Model, _filter: dict = None, **kwargs):  # pylint: disable=W0613
         """
         delete a row from model.
         """
-        try:
-            schema = ""
-            sc = _model.Meta.schema
-            if sc:
-                schema = f"{sc}."
-            table = f"{schema}{_model.Meta.name}"
-        except AttributeError:
-            table = _model.__name__
-        source = []
-        if not _filter:
-            _filter = {}
-        n = 1
-        fields = _model.columns()
-        for _, field in fields.items():
-            try:
-                val = getattr(_model, field.name)
-            except AttributeError:
+        plan = self._model_plan_(_model)
+        _filter = dict(_filter) if _filter else {}
+        for column in plan.primary_keys:
+            if column in _filter or not hasattr(_model, column):
+                # already this value on delete:
                 continue
-            ## getting the value of column:
-            value = self._get_value(field, val)
-            column = field.name
-            source.append(value)
-            n += 1
-            curval = _model.old_value(column)
-            if pk := self._get_attribute(field, curval, attr="primary_key"):
-                if column in _filter:
-                    # already this value on delete:
-                    continue
-                _filter[column] = pk
+            _filter[column] = _model.old_value(column)
         try:
-            condition = self._where(fields, **_filter)
+            condition, params = self._where_params(_model.columns(), _filter)
             if not condition:
                 raise DriverError(f"Avoid DELETE without WHERE conditions: {_filter}")
-            _delete = f"DELETE FROM {table} {condition};"
+            _delete = f"DELETE FROM {plan.table} {condition};"
             self._logger.debug(f"DELETE: {_delete}")
-            result = await self._connection.execute(_delete)
+            stmt, _ = await self._run_prepared(_delete, "fetch", *params)
+            result = stmt.get_statusmsg()
             return f"DELETE {result}: {_filter!s}"
         except Exception as err:
             raise DriverError(message=f"Error on Insert over table {_model.Meta.name}: {err!s}") from err
@@ -1286,77 +1736,53 @@ class pg(SQLDriver, DBCursorBackend, ModelBackend):
         TODO: How to update when if primary key changed.
         Alternatives: Saving *dirty* status and previous value on dict
         """
-        try:
-            schema = ""
-            sc = _model.Meta.schema
-            if sc:
-                schema = f"{sc}."
-            table = f"{schema}{_model.Meta.name}"
-        except AttributeError:
-            table = _model.__name__
+        plan = self._model_plan_(_model)
         cols = []
         source = []
         _filter = {}
         _updated = {}
-        n = 1
-        fields = _model.columns()
-        for name, field in fields.items():
+        for name, _, required, db_default, default, primary in plan.fields:
             try:
-                val = getattr(_model, field.name)
+                value = getattr(_model, name)
             except AttributeError:
                 continue
             ## getting the value of column:
-            value = self._get_value(field, val)
-
-            column = field.name
+            if isinstance(value, Enum):
+                value = value.value
             # validating required field
-            try:
-                required = field.required()
-            except AttributeError:
-                required = False
             if required is False and value is None or value == "None":
-                default = field.default
-                if callable(default):
-                    value = default()
-                else:
+                if default is None:
                     continue
-            elif required is True and value is None or value == "None":
-                if "db_default" in field.metadata:
+                value = default()
+            elif required is True and value is None:
+                if db_default:
                     # field get a default value from database
                     continue
                 raise ValueError(f"Field {name} is required and value is null over {_model.Meta.name}")
-            elif is_dataclass(value):
-                if isinstance(value, BaseModel):
-                    ### get value for primary key associated with.
-                    try:
-                        value = getattr(value, name)
-                    except AttributeError:
-                        value = None
-            elif isinstance(value, Enum):
-                value = value.value
-            cols.append("{} = {}".format(name, "${}".format(n)))  # pylint: disable=C0209
+            elif isinstance(value, BaseModel):
+                ### get value for primary key associated with.
+                value = getattr(value, name, None)
+            cols.append(name)
             source.append(value)
-            n += 1
-            curval = _model.old_value(name)
-            if pk := self._get_attribute(field, curval, attr="primary_key"):
-                _filter[column] = pk
-            if pk := self._get_attribute(field, value, attr="primary_key"):
-                _updated[column] = pk
+            if primary:
+                _filter[name] = _model.old_value(name)
+                _updated[name] = value
         try:
-            set_fields = ", ".join(cols)
-            condition = self._where(fields, **_filter)
-            _update = f"UPDATE {table} SET {set_fields} {condition}"
+            fields = _model.columns()
+            condition, params = self._where_params(fields, _filter, start=len(cols) + 1)
+            key = ("update", tuple(cols), condition)
+            if (_update := plan.statements.get(key)) is None:
+                set_fields = ", ".join([f"{name} = ${n}" for n, name in enumerate(cols, start=1)])
+                _update = f"UPDATE {plan.table} SET {set_fields} {condition}"
+                plan.statements[key] = _update
             self._logger.debug(f"UPDATE: {_update}")
-            stmt = await self._connection.prepare(_update)
-            result = await stmt.fetchrow(*source, timeout=2)
+            stmt, result = await self._run_prepared(_update, "fetchrow", *source, *params, timeout=2)
             self._logger.debug(f"STATUS {stmt.get_statusmsg()}")
-            condition = self._where(fields, **_updated)
-            get = f"SELECT * FROM {table} {condition}"
-            result = await self._connection.fetchrow(get)
+            condition, params = self._where_params(fields, _updated)
+            get = f"SELECT * FROM {plan.table} {condition}"
+            _, result = await self._run_prepared(get, "fetchrow", *params)
             if result:
-                _model.reset_values()
-                for f, val in result.items():
-                    setattr(_model, f, val)
+                self._hydrate_(_model, result)
                 return _model
         except Exception as err:
             raise DriverError(message=f"Error on Insert over table {_model.Meta.name}: {err!s}") from err
@@ -1383,22 +1809,16 @@ class pg(SQLDriver, DBCursorBackend, ModelBackend):
         fields = _model.columns()
         _filter = {}
         if "where" in kwargs:
-            condition = self._where(fields, **kwargs["where"])
+            condition, params = self._where_params(fields, kwargs["where"])
         else:
-            for name, field in fields.items():
+            for name in fields:
                 if name in kwargs:
-                    try:
-                        val = kwargs[name]
-                    except AttributeError:
-                        continue
-                    ## getting the value of column:
-                    datatype = field.type
-                    value = Entity.toSQL(val, datatype)
-                    _filter[name] = value
-            condition = self._where(fields, **_filter)
+                    _filter[name] = kwargs[name]
+            condition, params = self._where_params(fields, _filter)
         _get = f"SELECT * FROM {table} {condition}"
         try:
-            return await self._connection.fetchrow(_get)
+            _, result = await self._run_prepared(_get, "fetchrow", *params)
+            return result
         except Exception as e:
             raise DriverError(f"Error: Model Fetch over {table}: {e}") from e
 
@@ -1418,22 +1838,16 @@ class pg(SQLDriver, DBCursorBackend, ModelBackend):
 
         # NEW: allow a logical expression via "where"
         if "where" in kwargs:
-            condition = self._where(fields, **kwargs["where"])
+            condition, params = self._where_params(fields, kwargs["where"])
         else:
-            for name, field in fields.items():
+            for name in fields:
                 if name in kwargs:
-                    try:
-                        val = kwargs[name]
-                    except AttributeError:
-                        continue
-                    ## getting the value of column:
-                    datatype = field.type
-                    value = Entity.toSQL(val, datatype)
-                    _filter[name] = value
-            condition = self._where(fields, **_filter)
+                    _filter[name] = kwargs[name]
+            condition, params = self._where_params(fields, _filter)
         _get = f"SELECT {columns} FROM {table} {condition}"
         try:
-            return await self._connection.fetch(_get)
+            _, result = await self._run_prepared(_get, "fetch", *params)
+            return result
         except Exception as e:
             raise DriverError(f"Error: Model GET over {table}: {e}") from e
 
@@ -1483,22 +1897,16 @@ class pg(SQLDriver, DBCursorBackend, ModelBackend):
         columns = ",".join(args) if args else ",".join(fields)
 
         if "where" in kwargs:
-            condition = self._where(fields, **kwargs["where"])
+            condition, params = self._where_params(fields, kwargs["where"])
         else:
-            for name, field in fields.items():
+            for name in fields:
                 if name in kwargs:
-                    try:
-                        val = kwargs[name]
-                    except AttributeError:
-                        continue
-                    ## getting the value of column:
-                    datatype = field.type
-                    value = Entity.toSQL(val, datatype)
-                    _filter[name] = value
-            condition = self._where(fields, **_filter)
+                    _filter[name] = kwargs[name]
+            condition, params = self._where_params(fields, _filter)
         _get = f"SELECT {columns} FROM {table} {condition}"
         try:
-            return await self._connection.fetchrow(_get)
+            _, result = await self._run_prepared(_get, "fetchrow", *params)
+            return result
         except Exception as e:
             raise DriverError(f"Error: Model GET over {table}: {e}") from e
 
@@ -1532,19 +1940,17 @@ class pg(SQLDriver, DBCursorBackend, ModelBackend):
         fields = _model.columns(_model)
         _filter = {}
         if "where" in kwargs:
-            condition = self._where(fields, **kwargs["where"])
+            condition, params = self._where_params(fields, kwargs["where"])
         else:
-            for name, field in fields.items():
-                datatype = field.type
+            for name in fields:
                 if name in kwargs:
-                    val = kwargs[name]
-                    value = Entity.toSQL(val, datatype)
-                    _filter[name] = value
-            condition = self._where(fields, **_filter)
+                    _filter[name] = kwargs[name]
+            condition, params = self._where_params(fields, _filter)
         _delete = f"DELETE FROM {table} {condition}"
         try:
             self._logger.debug(f"DELETE: {_delete}")
-            result = await self._connection.execute(_delete)
+            stmt, _ = await self._run_prepared(_delete, "fetch", *params)
+            result = stmt.get_statusmsg()
             return f"DELETE {result}: {_filter!s}"
         except Exception as err:
             raise DriverError(message=f"Error on Insert over table {_model.Meta.name}: {err!s}") from err
@@ -1586,19 +1992,19 @@ class pg(SQLDriver, DBCursorBackend, ModelBackend):
             n += 1
         try:
             set_fields = ", ".join(cols)
-            condition = self._where(fields, **_filter)
+            condition, params = self._where_params(fields, _filter, start=n)
             _update = f"UPDATE {table} SET {set_fields} {condition}"
             self._logger.debug(f"UPDATE: {_update}")
-            stmt = await self._connection.prepare(_update)
-            result = await stmt.fetchrow(*source, timeout=2)
+            stmt, result = await self._run_prepared(_update, "fetchrow", *source, *params, timeout=2)
             self._logger.debug(stmt.get_statusmsg())
             print(f"UPDATE {result}: {_filter!s}")
 
             new_conditions = {**_filter, **new_cond}
-            condition = self._where(fields, **new_conditions)
+            condition, params = self._where_params(fields, new_conditions)
 
             _all = f"SELECT * FROM {table} {condition}"
-            if result := await self._connection.fetch(_all):
+            _, result = await self._run_prepared(_all, "fetch", *params)
+            if result:
                 return [model(**dict(r)) for r in result]
         except Exception as err:
             raise DriverError(message=f"Error on UPDATE over table {model.Meta.name}: {err!s}") from err
@@ -1640,29 +2046,169 @@ class pg(SQLDriver, DBCursorBackend, ModelBackend):
             cols.append("{} = {}".format(name, "${}".format(n)))  # pylint: disable=C0209
             n += 1
         try:
-            condition = self._where(fields, **_filter)
+            condition, params = self._where_params(fields, _filter)
             _delete = f"DELETE FROM {table} {condition}"
             self._logger.debug(f"DELETE: {_delete}")
-            stmt = await self._connection.prepare(_delete)
-            result = await stmt.fetchrow(*source, timeout=2)
+            stmt, result = await self._run_prepared(_delete, "fetchrow", *params, timeout=2)
             self._logger.debug(stmt.get_statusmsg())
             print(f"DELETE {result}: {_filter!s}")
 
             new_conditions = {**_filter, **new_cond}
-            condition = self._where(fields, **new_conditions)
+            condition, params = self._where_params(fields, new_conditions)
 
             _all = f"SELECT * FROM {table} {condition}"
-            if result := await self._connection.fetch(_all):
+            _, result = await self._run_prepared(_all, "fetch", *params)
+            if result:
                 return [model(**dict(r)) for r in result]
         except Exception as err:
             raise DriverError(message=f"Error on DELETE over table {model.Meta.name}: {err!s}") from err
 
-    async def stream_query(
+    @contextlib.asynccontextmanager
+    async def _copy_stream(self, sql: str, queue: ChunkQueue, **kwargs):
+        """
+        Run copy_from_query in a background task feeding a bounded ChunkQueue.
+        On exit the COPY is awaited (raising its errors), if the consumer stopped
+        early the rest of the COPY is discarded (cancelling it would close the connection).
+        """
+        async def copy_stream():
+            try:
+                await self._connection.copy_from_query(
+                    sql,
+                    output=queue.put,
+                    **kwargs
+                )
+            finally:
+                await queue.close()
+
+        copy_task = asyncio.create_task(copy_stream())
+        try:
+            yield copy_task
+            await copy_task
+        finally:
+            if not copy_task.done():
+                await queue.discard()
+                with contextlib.suppress(Exception):
+                    await copy_task
+            self.stream_stats = queue.stats()
+            self._logger.debug(
+                f"Stream Query: {self.stream_stats}"
+            )
+
+    async def _stream_binary(
         self,
         query: str,
+        queue: ChunkQueue,
+        chunksize: int = 10000,
+        output: str = 'arrow',
+    ):
+        """
+        Stream a query's results via COPY TO STDOUT in binary format,
+        decoding them into fixed-schema Arrow RecordBatches of chunksize rows.
+        """
+        # Lazy import: pyarrow is only required for binary streaming.
+        from ..conversions.pgbinary import BinaryCopyDecoder, binary_copy_query
+        if output == 'polars':
+            import polars as pl  # pylint: disable=C0415
+        elif output not in ('arrow', 'pandas'):
+            raise ValueError(
+                f"Binary streaming: unsupported output {output}, expected arrow, polars or pandas"
+            )
+        async with self.handle_copy_errors("Binary Stream Query"):
+            stmt = await self._prepare_cached(query)
+            sql, columns = binary_copy_query(query, stmt.get_attributes())
+        decoder = BinaryCopyDecoder(
+            columns,
+            batch_size=chunksize,
+            numeric_as_float=self._numeric_as_float
+        )
+
+        def convert(batch):
+            if output == 'polars':
+                return pl.from_arrow(batch)
+            elif output == 'pandas':
+                return batch.to_pandas()
+            return batch
+
+        async with self.handle_copy_errors("Binary Stream Query"):
+            async with self._copy_stream(sql, queue, format='binary'):
+                while (chunk := await queue.get()) is not None:
+                    for batch in decoder.feed(chunk):
+                        yield convert(batch)
+                if (batch := decoder.flush()) is not None:
+                    yield convert(batch)
+
+    async def _stream_csv(
+        self,
+        query: str,
+        queue: ChunkQueue,
         parser: Callable[[io.StringIO, int], Generator],
         chunksize: int = 1000,
         delimiter='|',
+    ):
+        # We'll accumulate CSV text in a buffer
+        buffer = io.StringIO()
+        columns = None  # Store the header row (column names)
+        accumulated_lines = 0  # lines for the current batch
+        # multi-byte characters can be split between COPY chunks.
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        tail = ''  # text after the last complete record
+        async with self._copy_stream(
+            query,
+            queue,
+            delimiter=delimiter,
+            format='csv',
+            quote='"',
+            escape='"',
+            header=True,
+        ):
+            # Consumer loop, the queue returns None once the COPY is finished.
+            while (chunk := await queue.get()) is not None:
+                text_chunk = tail + decoder.decode(chunk)
+                ends = _record_ends(text_chunk)
+                if columns is None:
+                    # this is the first row: the header:
+                    end_header = next(ends, None)
+                    if end_header is None:
+                        tail = text_chunk
+                        continue
+                    columns = next(csv.reader([text_chunk[:end_header]], delimiter=delimiter))
+                    # remove the header from the current chunk:
+                    text_chunk = text_chunk[end_header:]
+                    ends = _record_ends(text_chunk)
+                end = 0
+                for end in ends:
+                    accumulated_lines += 1
+                # a record split between chunks waits for the next one.
+                tail = text_chunk[end:]
+                buffer.write(text_chunk[:end])
+                # If we reached our threshold, parse & yield
+                if accumulated_lines >= chunksize:
+                    buffer.seek(0)
+                    for parsed_obj in parser(buffer, chunksize, delimiter=delimiter, columns=columns):
+                        yield parsed_obj
+                    accumulated_lines = 0
+                    buffer.seek(0)
+                    buffer.truncate(0)
+            tail += decoder.decode(b'', final=True)
+            if tail.strip():
+                buffer.write(tail)
+                accumulated_lines += 1
+            # If there's leftover unparsed data
+            if accumulated_lines:
+                buffer.seek(0)
+                for parsed_obj in parser(buffer, chunksize, delimiter=delimiter, columns=columns):
+                    yield parsed_obj
+
+    async def stream_query(
+        self,
+        query: str,
+        parser: Callable[[io.StringIO, int], Generator] = None,
+        chunksize: int = 1000,
+        delimiter='|',
+        binary: bool = False,
+        output: str = 'arrow',
+        max_queue_chunks: int = 16,
+        max_buffered_bytes: int = 0,
     ):
         """
         Stream a query's results via COPY TO STDOUT in CSV format,
@@ -1673,80 +2219,28 @@ class pg(SQLDriver, DBCursorBackend, ModelBackend):
         :param parser:     a function like pandas_parser(csv_stream, chunksize)
                         that yields parsed objects (DataFrame, etc.)
         :param chunksize:  how many rows each parser chunk should contain
+        :param binary:     use COPY binary format, decoding rows directly
+                        into typed chunks (no parser required).
+        :param output:     binary mode chunk type: arrow (RecordBatch), polars or pandas.
+        :param max_queue_chunks: max. pending COPY chunks before the producer
+                        is suspended (0: unbounded).
+        :param max_buffered_bytes: max. pending COPY bytes before the producer
+                        is suspended (0: unbounded).
+
+        Queue metrics (high-water marks, producer waits) of the last stream
+        are available on ``stream_stats``.
         """
         if not self._connection:
             await self.connection()
-        # We'll accumulate CSV text in a buffer
-        buffer = io.StringIO()
-        columns = None  # Store the header row (column names)
-        accumulated_lines = []  # store lines for the current batch
-
-        # A queue to collect raw bytes from the producer
-        queue = asyncio.Queue()
-
-        # Define the coroutine that asyncpg will call with each chunk of bytes
-        async def producer_coroutine(chunk: bytes):
-            # This function is called by asyncpg whenever new bytes arrive.
-            # We just stuff them into the queue.
-            await queue.put(chunk)
-
-        # We wrap copy_from_query in a task so it runs in parallel with consumption.
-        # Once copy_from_query returns, we know no more data is coming.
-        copy_task = asyncio.create_task(
-            self._connection.copy_from_query(
-                query,
-                output=producer_coroutine,  # call our coroutine for every chunk
-                delimiter=delimiter,
-                format='csv',
-                quote='"',
-                escape='"',
-                # force_quote=True,
-                header=True,
-            )
-        )
-
-        # Consumer loop
-        while True:
-            try:
-                chunk = await queue.get()
-                if chunk is None:
-                    break  # No more data
-            except asyncio.TimeoutError:
-                continue
-
-            text_chunk = chunk.decode('utf-8', errors='replace')
-            if columns is None:
-                # this is the first row: the header:
-                end_header = text_chunk.find('\n', 0)
-                header = text_chunk[:end_header]
-                columns = header.strip().split(delimiter)
-                # remove the header from the current chunk:
-                text_chunk = text_chunk[end_header + 1:]
-            accumulated_lines = text_chunk.count('\n')
-            # If we reached our threshold, parse & yield
-            if accumulated_lines >= chunksize:
-                buffer.write(text_chunk)
-                buffer.seek(0)
-                for parsed_obj in parser(buffer, chunksize, delimiter=delimiter, columns=columns):
-                    yield parsed_obj
-                accumulated_lines = 0
-                buffer.seek(0)
-                buffer.truncate(0)
-            else:
-                buffer.write(text_chunk)
-
-            queue.task_done()
-
-            if copy_task.done() and queue.empty():
-                break  # No more data
-
-        # If there's leftover unparsed data
-        if accumulated_lines:
-            buffer.seek(0)
-            for parsed_obj in parser(buffer, chunksize, delimiter=delimiter, columns=columns):
-                yield parsed_obj
-
-        # Make sure the COPY command is fully done
-        # (awaiting copy_task will raise if there's any error in the copy).
-        await copy_task
-        await queue.join()
+        if not binary and parser is None:
+            raise ValueError("Stream Query: a parser is required for CSV streaming")
+        # bounded queue: once full, the COPY callback awaits and
+        # asyncpg stops reading from the socket (backpressure).
+        queue = ChunkQueue(max_chunks=max_queue_chunks, max_bytes=max_buffered_bytes)
+        if binary:
+            stream = self._stream_binary(query, queue, chunksize=chunksize, output=output)
+        else:
+            stream = self._stream_csv(query, queue, parser, chunksize=chunksize, delimiter=delimiter)
+        async with contextlib.aclosing(stream):
+            async for chunk in stream:
+                yield chunk
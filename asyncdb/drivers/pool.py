@@ -0,0 +1,300 @@
+"""
+Generic Pool.
+
+Pool of connected driver instances, for the drivers without a native
+pool (sqlite, duckdb, oracle, jdbc, mssql, ...).
+
+Usage:
+    pool = AsyncPool("duckdb", params={"database": "/data/analytics.db"}, max_clients=4)
+    await pool.connect()
+    async with await pool.acquire() as conn:
+        result, error = await conn.query("SELECT 1")
+"""
+import asyncio
+import time
+from collections import deque
+from typing import Any, Optional, Union
+from ..exceptions import DriverError, TooManyConnections
+from ..utils.modules import load_driver
+from .base import BasePool
+
+
+# drivers opening a private database for every ":memory:" connection.
+IN_MEMORY_DRIVERS: set = {"duckdb", "sqlite"}
+
+
+class PooledConnection:
+    """PooledConnection.
+
+    Async context manager over an acquired driver, releasing it to the pool on exit.
+    """
+
+    __slots__ = ("_pool", "_driver")
+
+    def __init__(self, pool: "DriverPool", driver: Any):
+        self._pool = pool
+        self._driver = driver
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._driver, name)
+
+    async def __aenter__(self) -> Any:
+        return self._driver
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self._pool.release(self._driver)
+
+
+class DriverPool(BasePool):
+    """DriverPool.
+
+    Keeps between ``min_size`` and ``max_clients`` connected instances of a driver.
+
+    Args:
+        driver: driver name (ex: "duckdb") or class.
+        min_size: connections opened on connect, and kept while idle.
+        max_clients: max. connections, callers over it wait on acquire.
+        max_inactive_timeout: seconds an idle connection (over min_size) is kept,
+            idle connections are expired by a background task.
+        acquire_timeout: seconds waiting for a free connection (TooManyConnections).
+        health_check: seconds a connection can be idle before being checked
+            with the test query on acquire (None disables the checks).
+
+    Any other argument is passed to the driver.
+
+    Every connection to an in-memory database (duckdb, sqlite ":memory:")
+    is a different database: such pools are limited to one connection.
+    """
+
+    _provider: str = "pool"
+
+    def __init__(
+        self,
+        driver: Union[str, type],
+        dsn: str = None,
+        loop: asyncio.AbstractEventLoop = None,
+        params: Optional[dict] = None,
+        **kwargs
+    ):
+        if isinstance(driver, str):
+            driver = load_driver(driver)
+        self._driver_class = driver
+        self._provider = driver._provider
+        self._syntax = driver._syntax
+        self._dsn_template = driver._dsn_template
+        self._min_size: int = kwargs.pop("min_size", 1)
+        self._max_clients: int = kwargs.pop("max_clients", 10)
+        self._max_inactive_timeout: float = kwargs.pop("max_inactive_timeout", 300)
+        self._acquire_timeout: Optional[float] = kwargs.pop("acquire_timeout", 60)
+        self._health_check: Optional[float] = kwargs.pop("health_check", 30)
+        self._driver_args: dict = kwargs
+        self._driver_dsn = dsn
+        self._driver_params = params
+        # idle connections: (driver, released at)
+        self._idle: deque = deque()
+        self._in_use: set = set()
+        self._reaper: Optional[asyncio.Task] = None
+        in_memory = self._in_memory()
+        if in_memory:
+            self._min_size = min(self._min_size, 1)
+            self._max_clients = 1
+        self._semaphore = asyncio.Semaphore(self._max_clients)
+        super(DriverPool, self).__init__(dsn=dsn, loop=loop, params=params, **kwargs)
+        if in_memory:
+            self._logger.warning(
+                f"DriverPool: {self._provider} in-memory databases are not shared "
+                "between connections, the pool is limited to one connection."
+            )
+
+    def __repr__(self) -> str:
+        return f"<DriverPool {self._provider} size={self.size} in_use={len(self._in_use)}>"
+
+    def _in_memory(self) -> bool:
+        if self._provider not in IN_MEMORY_DRIVERS:
+            return False
+        database = self._driver_dsn or (self._driver_params or {}).get("database")
+        return not database or database == ":memory:"
+
+    @property
+    def size(self) -> int:
+        return len(self._idle) + len(self._in_use)
+
+    def _pool_stats(self) -> dict:
+        return {
+            "size": self.size,
+            "in_use": len(self._in_use),
+            "idle": len(self._idle),
+            "min_size": self._min_size,
+            "max_clients": self._max_clients,
+        }
+
+    async def _open_(self) -> Any:
+        db = self._driver_class(
+            dsn=self._driver_dsn, loop=self._loop, params=self._driver_params, **self._driver_args
+        )
+        await db.connection()
+        self._metrics.connection_opened(db)
+        return db
+
+    async def _close_(self, db: Any) -> None:
+        self._metrics.connection_closed(db)
+        try:
+            await db.close()
+        except Exception as err:  # pylint: disable=W0703
+            self._metrics.failure(err)
+            self._logger.warning(f"{self._provider}: Error closing a pooled connection: {err}")
+
+    async def _healthy(self, db: Any) -> bool:
+        if not db.is_connected():
+            return False
+        if db._test_query is None:  # pylint: disable=W0212
+            return True
+        try:
+            _, error = await db.test_connection()
+        except Exception as err:  # pylint: disable=W0703
+            self._metrics.failure(err)
+            return False
+        return not error
+
+    async def _expire(self) -> None:
+        """Close the connections idle for more than max_inactive_timeout (over min_size)."""
+        limit = time.monotonic() - self._max_inactive_timeout
+        while len(self._idle) > self._min_size and self._idle[0][1] < limit:
+            db, _ = self._idle.popleft()
+            await self._close_(db)
+
+    async def _reap(self) -> None:
+        """Background task expiring the idle connections."""
+        interval = max(self._max_inactive_timeout / 2, 0.1)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self._expire()
+            except Exception as err:  # pylint: disable=W0703
+                self._metrics.failure(err)
+                self._logger.warning(f"{self._provider}: Error expiring idle connections: {err}")
+
+    async def connect(self) -> "DriverPool":
+        """
+        Open the first min_size connections of the pool.
+        """
+        self._logger.debug(f"DriverPool: Connecting to {self._provider}")
+        try:
+            for _ in range(self._min_size - self.size):
+                self._idle.append((await self._open_(), time.monotonic()))
+        except Exception as err:
+            await self.close()
+            raise DriverError(f"{self._provider}: Unable to open the pool: {err}") from err
+        self._pool = self
+        self._connected = True
+        self._initialized_on = time.time()
+        if self._reaper is None and self._max_inactive_timeout:
+            self._reaper = asyncio.get_running_loop().create_task(self._reap())
+        return self
+
+    async def acquire(self) -> PooledConnection:
+        """
+        Take a connection from the pool, waiting (up to acquire_timeout) when all are in use.
+        Returns the driver, as an async context manager releasing it on exit.
+        """
+        db = await self._acquire_()
+        self._connection = db
+        return PooledConnection(self, db)
+
+    async def _acquire_(self) -> Any:
+        with self._metrics.acquiring():
+            return await self._checkout()
+
+    async def _checkout(self) -> Any:
+        if not self._connected:
+            await self.connect()
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), self._acquire_timeout)
+        except asyncio.TimeoutError as err:
+            raise TooManyConnections(
+                f"{self._provider}: no free connection after {self._acquire_timeout} seconds"
+            ) from err
+        checking = None
+        try:
+            db = None
+            while self._idle:
+                # most recently used first: warm caches, the oldest ones expire.
+                candidate, released = self._idle.pop()
+                if self._health_check is not None and time.monotonic() - released >= self._health_check:
+                    checking = (candidate, released)
+                    healthy = await self._healthy(candidate)
+                    checking = None
+                    if not healthy:
+                        await self._close_(candidate)
+                        continue
+                db = candidate
+                break
+            if db is None:
+                db = await self._open_()
+        except BaseException as err:
+            # also on cancellation: the slot (and the connection being checked) return to the pool.
+            self._semaphore.release()
+            if checking is not None:
+                self._idle.append(checking)
+            if not isinstance(err, Exception):
+                raise
+            raise DriverError(f"{self._provider}: Unable to acquire a connection: {err}") from err
+        self._in_use.add(db)
+        return db
+
+    async def release(self, connection: Any = None, timeout: int = 10) -> None:  # pylint: disable=W0613
+        """
+        Return a connection to the pool.
+        """
+        db = connection or self._connection
+        if isinstance(db, PooledConnection):
+            db = db._driver  # pylint: disable=W0212
+        if db not in self._in_use:
+            return
+        self._in_use.discard(db)
+        if self._connection is db:
+            self._connection = None
+        try:
+            if self._connected and db.is_connected():
+                self._idle.append((db, time.monotonic()))
+                await self._expire()
+            else:
+                await self._close_(db)
+        finally:
+            self._metrics.release()
+            self._semaphore.release()
+
+    async def execute(self, sentence: Any, *args, **kwargs) -> Any:
+        """
+        Execute a sentence on a connection of the pool.
+        """
+        async with PooledConnection(self, await self._acquire_()) as conn:
+            return await conn.execute(sentence, *args, **kwargs)
+
+    async def query(self, sentence: Any, *args, **kwargs) -> Any:
+        """
+        Run a query on a connection of the pool.
+        """
+        async with PooledConnection(self, await self._acquire_()) as conn:
+            return await conn.query(sentence, *args, **kwargs)
+
+    async def test_connection(self, **kwargs):
+        async with PooledConnection(self, await self._acquire_()) as conn:
+            return await conn.test_connection(**kwargs)
+
+    async def close(self, timeout: int = 5) -> None:  # pylint: disable=W0613
+        """
+        Close the idle connections, the ones in use are closed when released.
+        """
+        self._connected = False
+        if self._reaper is not None:
+            self._reaper.cancel()
+            self._reaper = None
+        while self._idle:
+            db, _ = self._idle.pop()
+            await self._close_(db)
+        self._pool = None
+        self._logger.debug(f"DriverPool: {self._provider} closed.")
+
+    disconnect = close
+    wait_close = close
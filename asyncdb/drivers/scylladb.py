@@ -87,6 +87,8 @@ class scylladb(InitDriver, ModelBackend):
         self._driver: str = kwargs.pop("driver", "cassandra")
         self.heartbeat_interval: int = kwargs.pop("heartbeat_interval", 0)
         self._row_factory = kwargs.pop("row_factory", "dict_factory")
+        # concurrent statements on Model.create
+        self._insert_concurrency: int = kwargs.pop("insert_concurrency", 50)
         self._force_closing: bool = kwargs.pop("force_closing", False)
         super(scylladb, self).__init__(loop=loop, params=params, **kwargs)
         try:
@@ -900,23 +902,14 @@ class scylladb(InitDriver, ModelBackend):
         await asyncio.gather(*tasks)
 
     ## Model Logic:
-    async def _insert_(self, _model: Model, **kwargs):  # pylint: disable=W0613
+    def _insert_values_(self, _model: Model) -> tuple[list, dict, dict]:
         """
-        insert a row from model.
+        Returns the columns to be inserted, their values and
+        the primary key filter of a Model instance.
         """
-        try:
-            schema = ""
-            sc = _model.Meta.schema
-            if sc:
-                schema = f"{sc}."
-            table = f"{schema}{_model.Meta.name}"
-        except AttributeError:
-            table = _model.__name__
         cols = []
-        columns = []
         source = {}
         _filter = {}
-        n = 1
         fields = _model.columns()
         for name, field in fields.items():
             try:
@@ -926,7 +919,6 @@ class scylladb(InitDriver, ModelBackend):
             ## getting the value of column:
             value = self._get_value(field, val)
             column = field.name
-            columns.append(column)
             # validating required field
             try:
                 required = field.required()
@@ -967,9 +959,23 @@ class scylladb(InitDriver, ModelBackend):
                 value = value.value
             source[column] = value
             cols.append(column)
-            n += 1
             if pk := self._get_attribute(field, value, attr="primary_key"):
                 _filter[column] = pk
+        return cols, source, _filter
+
+    async def _insert_(self, _model: Model, **kwargs):  # pylint: disable=W0613
+        """
+        insert a row from model.
+        """
+        try:
+            schema = ""
+            sc = _model.Meta.schema
+            if sc:
+                schema = f"{sc}."
+            table = f"{schema}{_model.Meta.name}"
+        except AttributeError:
+            table = _model.__name__
+        cols, source, _filter = self._insert_values_(_model)
         try:
             values = ", ".join([f":{a}" for a in cols])  # pylint: disable=C0209
             cols = ",".join(cols)
@@ -992,6 +998,54 @@ class scylladb(InitDriver, ModelBackend):
         except Exception as err:
             raise DriverError(message=f"Error on Insert over table {_model.Meta.name}: {err!s}") from err
 
+    async def _insert_many_(self, _model: Model, records: list, returning: bool = True, upsert: bool = False) -> list:
+        """
+        Batched insert of Model instances, running the prepared INSERT
+        (and the SELECT refreshing the rows, when returning) concurrently.
+        An upsert overwrites the rows with the same primary key (no IF NOT EXISTS).
+        """
+        try:
+            schema = ""
+            sc = _model.Meta.schema
+            if sc:
+                schema = f"{sc}."
+            table = f"{schema}{_model.Meta.name}"
+        except AttributeError:
+            table = _model.__name__
+        rows = [(record, *self._insert_values_(record)) for record in records]
+        try:
+            for cols, group in self._group_rows(rows).items():
+                values = ", ".join([f":{a}" for a in cols])
+                insert = f"INSERT INTO {table}({','.join(cols)}) VALUES({values})"
+                insert += ";" if upsert else " IF NOT EXISTS;"
+                self._logger.debug(f"INSERT: {insert}")
+                stmt = self._connection.prepare(insert)
+                execute_concurrent(
+                    self._connection,
+                    ((stmt, source) for _, _, source, _ in group),
+                    concurrency=self._insert_concurrency,
+                    raise_on_first_error=True
+                )
+                keys = list(group[0][3])
+                if not returning or not keys:
+                    continue
+                condition = " AND ".join([f"{key} = :{key}" for key in keys])
+                select = self._connection.prepare(f"SELECT * FROM {table} WHERE {condition}")
+                results = execute_concurrent(
+                    self._connection,
+                    ((select, _filter) for _, _, _, _filter in group),
+                    concurrency=self._insert_concurrency,
+                    raise_on_first_error=True
+                )
+                for (record, *_), (_, result) in zip(group, results):
+                    if row := result.one():
+                        record.reset_values()
+                        for f, val in row.items():
+                            setattr(record, f, val)
+            return records
+        except Exception as err:
+            raise DriverError(message=f"Error on Insert over table {_model.Meta.name}: {err!s}") from err
+
     async def _delete_(self, _model: Model, _filter: dict = None, **kwargs):  # pylint: disable=W0613
         """
         delete a row from model.
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 import time
 import asyncio
+import sqlite3
 from typing import Any, Optional, Union
 from collections.abc import Sequence, Iterable
 import aiosqlite
@@ -80,15 +81,18 @@ class sqlite(SQLDriver, DBCursorBackend, ModelBackend):
         else:
             self._connection.row_factory = None
 
-    async def query(self, sentence: Any, **kwargs) -> Any:
+    async def query(self, sentence: Any, format: Optional[str] = None, **kwargs) -> Any:  # pylint: disable=W0622
         """
-        Getting a Query from Database
+        Getting a Query from Database (serialized by ``format``, when given).
         """
         error = None
         cursor = None
+        description = None
+        serializer, output = self._output_for(format)
         await self.valid_operation(sentence)
         try:
             cursor = await self._connection.execute(sentence, parameters=kwargs)
+            description = cursor.description
             self._result = await cursor.fetchall()
             if not self._result:
                 return (None, NoDataFound())
@@ -100,14 +104,20 @@ class sqlite(SQLDriver, DBCursorBackend, ModelBackend):
                 await cursor.close()
             except (ValueError, TypeError, RuntimeError) as err:
                 self._logger.exception(err)
-            return await self._serializer(self._result, error)
+            if output is not None:
+                return output(self._result, error)
+            if getattr(serializer, "columnar", False):
+                # columns of native (tuple) rows are named from the cursor description.
+                return await serializer(self._result, error, attributes=description)
+            return await serializer(self._result, error)
 
-    async def queryrow(self, sentence: Any = None) -> Iterable[Any]:
+    async def queryrow(self, sentence: Any = None, format: Optional[str] = None) -> Iterable[Any]:  # pylint: disable=W0622
         """
         Getting a single Row from Database
         """
         error = None
         cursor = None
+        serializer, output = self._output_for(format)
         await self.valid_operation(sentence)
         try:
             self._connection.row_factory = lambda c, r: dict(zip([col[0] for col in c.description], r))
@@ -123,7 +133,9 @@ class sqlite(SQLDriver, DBCursorBackend, ModelBackend):
                 await cursor.close()
             except (ValueError, TypeError, RuntimeError) as err:
                 self._logger.exception(err)
-            return await self._serializer(self._result, error)
+            if output is not None:
+                return output(self._result, error)
+            return await serializer(self._result, error)
 
     async def fetch_all(self, sentence: str, **kwargs) -> Sequence:
         """
@@ -172,6 +184,21 @@ class sqlite(SQLDriver, DBCursorBackend, ModelBackend):
 
     fetchmany = fetch_many
 
+    async def _fetch_batches(self, sentence: str, params: Iterable[Any], batch_size: int, arrow: bool = False):
+        await self.valid_operation(sentence)
+        cursor = None
+        try:
+            cursor = await self._connection.execute(sentence, params)
+            # keyed rows, so every serializer gets the column names.
+            cursor.row_factory = aiosqlite.Row
+            while rows := await cursor.fetchmany(batch_size):
+                yield rows
+        except aiosqlite.Error as err:
+            raise DriverError(f"SQLite Error on Stream: {err}") from err
+        finally:
+            if cursor is not None:
+                await cursor.close()
+
     async def fetch_one(self, sentence: str, **kwargs) -> Optional[dict]:
         """
         aliases for queryrow, but without error support
@@ -287,18 +314,14 @@ class sqlite(SQLDriver, DBCursorBackend, ModelBackend):
             raise RuntimeError(f"SQLite: invalid Object type {object!s}")
 
     ## ModelBackend Methods
-    async def _insert_(self, _model: Model, **kwargs):
+    def _insert_values_(self, _model: Model) -> tuple[list, list, dict]:
         """
-        insert a row from model.
+        Returns the columns to be inserted, their values and
+        the primary key filter of a Model instance.
         """
-        try:
-            table = f"{_model.Meta.name}"
-        except AttributeError:
-            table = _model.__name__
         cols = []
         source = []
         _filter = {}
-        n = 1
         fields = _model.columns()
         for name, field in fields.items():
             try:
@@ -327,12 +350,23 @@ class sqlite(SQLDriver, DBCursorBackend, ModelBackend):
                     raise ValueError(f"Field {name} is required and value is null over {_model.Meta.name}")
             source.append(value)
             cols.append(column)
-            n += 1
             if pk := self._get_attribute(field, value, attr="primary_key"):
                 _filter[column] = pk
+        return cols, source, _filter
+
+    async def _insert_(self, _model: Model, **kwargs):
+        """
+        insert a row from model.
+        """
+        try:
+            table = f"{_model.Meta.name}"
+        except AttributeError:
+            table = _model.__name__
+        cols, source, _filter = self._insert_values_(_model)
+        fields = _model.columns()
         try:
             columns = ",".join(cols)
-            values = ",".join(["?" for a in range(1, n)])
+            values = ",".join(["?" for a in source])
             insert = f"INSERT INTO {table}({columns}) VALUES({values})"
             self._logger.debug(f"INSERT: {insert}")
             cursor = await self._connection.execute(insert, parameters=source)
@@ -349,6 +383,77 @@ class sqlite(SQLDriver, DBCursorBackend, ModelBackend):
         except Exception as err:
             raise DriverError(message=f"Error on Insert over table {_model.Meta.name}: {err!s}") from err
 
+    async def _insert_many_(self, _model: Model, records: list, returning: bool = True, upsert: bool = False) -> list:
+        """
+        Batched insert of Model instances, committed once:
+        multi-row INSERT ... RETURNING (returning) or executemany.
+        An upsert updates the rows with the same primary key (ON CONFLICT).
+        """
+        if returning and sqlite3.sqlite_version_info < (3, 35):
+            # RETURNING requires SQLite 3.35
+            return await super()._insert_many_(_model, records, returning=returning, upsert=upsert)
+        try:
+            table = f"{_model.Meta.name}"
+        except AttributeError:
+            table = _model.__name__
+        keys = self._model_plan_(_model).primary_keys
+        if upsert and not keys:
+            raise ValueError(f"Upsert over {table} requires a primary key on the Model")
+        rows = [(record, *self._insert_values_(record)) for record in records]
+        try:
+            for cols, group in self._group_rows(rows).items():
+                columns = ",".join(cols)
+                placeholder = f"({','.join(['?'] * len(cols))})"
+                conflict = ""
+                if upsert:
+                    updated = [col for col in cols if col not in keys] or list(keys)
+                    conflict = f" ON CONFLICT({','.join(keys)}) DO UPDATE SET " + ",".join(
+                        f"{col} = excluded.{col}" for col in updated
+                    )
+                if not returning:
+                    insert = f"INSERT INTO {table}({columns}) VALUES{placeholder}{conflict}"
+                    await self._connection.executemany(insert, [source for _, _, source, _ in group])
+                    continue
+                if not keys or any(key not in cols for key in keys):
+                    # RETURNING rows come in any order, without a primary key to match them: row by row.
+                    insert = f"INSERT INTO {table}({columns}) VALUES{placeholder}{conflict} RETURNING *"
+                    for record, _, source, _ in group:
+                        cursor = await self._connection.execute(insert, source)
+                        cursor.row_factory = aiosqlite.Row
+                        self._hydrate_(record, await cursor.fetchone())
+                        await cursor.close()
+                    continue
+                positions = [cols.index(key) for key in keys]
+                # SQLITE_MAX_VARIABLE_NUMBER is 999 on old builds.
+                size = max(1, 999 // max(len(cols), 1))
+                for i in range(0, len(group), size):
+                    chunk = group[i:i + size]
+                    values = ",".join([placeholder] * len(chunk))
+                    insert = f"INSERT INTO {table}({columns}) VALUES {values}{conflict} RETURNING *"
+                    cursor = await self._connection.execute(
+                        insert, [value for _, _, source, _ in chunk for value in source]
+                    )
+                    cursor.row_factory = aiosqlite.Row
+                    result = await cursor.fetchall()
+                    await cursor.close()
+                    pairs = self._pair_rows(
+                        [(record, tuple(source[p] for p in positions)) for record, _, source, _ in chunk], keys, result
+                    )
+                    for record, row in pairs:
+                        self._hydrate_(record, row)
+            await self._connection.commit()
+            return records
+        except Exception as err:
+            await self._connection.rollback()
+            raise DriverError(message=f"Error on Insert over table {table}: {err!s}") from err
+
+    @staticmethod
+    def _hydrate_(_model: Model, row: Any) -> None:
+        if not row:
+            return
+        for f in row.keys():
+            setattr(_model, f, row[f])
+
     async def _delete_(self, _model: Model, **kwargs):
         """
         delete a row from model.
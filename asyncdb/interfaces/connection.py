@@ -2,12 +2,18 @@ from typing import Any, Optional, Union
 from collections.abc import Callable, Awaitable
 from abc import ABC
 import asyncio
+import contextvars
 from datetime import datetime
 from functools import partial
-from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from .abstract import AbstractDriver, DriverContextManager, EventLoopManager
 from ..exceptions import DriverError
 from ..utils.types import SafeDict
+from ..utils.executors import get_executor, concurrency_slot
+
+
+# (driver id, start time) of the last start_timing of the running task
+# (concurrent calls on the same driver).
+_timing: contextvars.ContextVar = contextvars.ContextVar("asyncdb_timing", default=None)
 
 
 class ConnectionBackend(AbstractDriver, DriverContextManager, EventLoopManager):
@@ -47,13 +53,21 @@ class ConnectionBackend(AbstractDriver, DriverContextManager, EventLoopManager):
 
     def start_timing(self):
         self._starttime = datetime.now()
+        _timing.set((id(self), self._starttime))
         return self._starttime
 
     def generated_at(self, started: Union[datetime, None] = None):
+        """generated_at.
+
+        Duration since ``started`` (the value returned by start_timing), or
+        since the last start_timing of the running task.
+        Per-call metrics are recorded by asyncdb.utils.tracing.
+        """
         if not started:
-            started = datetime.now()
+            timing = _timing.get()
+            started = timing[1] if timing is not None and timing[0] == id(self) else self._starttime
         try:
-            self._generated = started - self._starttime
+            self._generated = datetime.now() - started
         except TypeError:
             return None
         return self._generated
@@ -69,28 +83,28 @@ class ConnectionBackend(AbstractDriver, DriverContextManager, EventLoopManager):
     def dialect(cls):
         return cls._syntax
 
-    def get_executor(self, executor="thread", max_workers: int = 2) -> Any:
-        if executor == "thread":
-            return ThreadPoolExecutor(max_workers=max_workers)
-        elif executor == "process":
-            return ProcessPoolExecutor(max_workers=max_workers)
-        elif self._executor is not None:
-            return self._executor
-        else:
-            return None
+    def get_executor(self, executor="thread", max_workers: int = 2) -> Any:  # pylint: disable=W0613
+        """get_executor.
+
+        Returns the process-wide executor "thread", "process" (or any other name),
+        shared by every driver. Executors are sized on the registry
+        (asyncdb.utils.executors.configure_executor), max_workers is not used.
+        """
+        return get_executor(executor)
 
     async def _thread_func(self, fn: Union[Callable, Awaitable], *args, executor: Any = None, **kwargs):
         """_execute.
 
         Returns a future to be executed into a Thread Pool.
+        Calls are bounded by the concurrency limit of the driver.
         """
         loop = asyncio.get_event_loop()
         func = partial(fn, *args, **kwargs)
         if not executor:
-            executor = self._executor
+            executor = self._executor or get_executor("thread")
         try:
-            fut = loop.run_in_executor(executor, func)
-            return await fut
+            async with concurrency_slot(self._provider, executor):
+                return await loop.run_in_executor(executor, func)
         except Exception as e:
             self._logger.exception(e, stack_info=True)
             raise
@@ -1,9 +1,24 @@
-from typing import Any, Iterable, Optional, Sequence, Union
+from typing import Any, AsyncGenerator, Iterable, Optional, Sequence, Union
 from abc import ABC
+import contextlib
 import logging
-from importlib import import_module
 from ..meta.record import Record
 from ..exceptions import DriverError, EmptyStatement
+from ..utils.modules import load_driver
+from ..drivers.outputs import OutputFactory
+
+
+# Output formats built from Arrow data: backends with a native
+# Arrow batch fetch (ex: duckdb) can skip the row materialization.
+ARROW_FORMATS = ("arrow", "pandas", "polars")
+
+
+async def _prepend(first: Any, batches: AsyncGenerator) -> AsyncGenerator:
+    if first is None:
+        return
+    yield first
+    async for batch in batches:
+        yield batch
 
 
 class CursorBackend(ABC):
@@ -104,11 +119,8 @@ class DBCursorBackend(ABC):
         self._prepared: Any = None
         self._cursor: Optional[Any] = None
         try:
-            # dynamic loading of Cursor Class
-            cls = f"asyncdb.drivers.{self._provider}"
-            cursor = f"{self._provider}Cursor"
-            module = import_module(cls, package="drivers")
-            self.__cursor__ = getattr(module, cursor)
+            # dynamic loading of Cursor Class (cached after first use)
+            self.__cursor__ = load_driver(self._provider, "Cursor")
         except ModuleNotFoundError as e:
             logging.exception(f"Error Loading Cursor Class: {e}")
             self.__cursor__ = None
@@ -133,6 +145,126 @@ class DBCursorBackend(ABC):
             logging.exception(err)
             raise
 
+    ### Batched Streaming
+    async def _fetch_batches(
+        self, sentence: str, params: Iterable[Any], batch_size: int, arrow: bool = False
+    ) -> AsyncGenerator:
+        """_fetch_batches.
+
+        Yields the result of sentence in batches of (at most) batch_size rows,
+        using the native batch fetch of the backend.
+        When arrow is True, backends can yield Arrow RecordBatches instead of rows.
+        """
+        raise NotImplementedError(f"{self._provider}: No support for batched streaming.")
+        yield  # pragma: no cover
+
+    async def stream(
+        self,
+        sentence: Union[str, Any],
+        params: Union[Iterable[Any], None] = None,
+        batch_size: int = 1000,
+        format: str = "native",  # pylint: disable=W0622
+        **kwargs
+    ) -> AsyncGenerator:
+        """stream.
+
+        Server-side streaming of a query in batches of batch_size rows,
+        every batch goes through the output serializer (native, arrow, pandas,
+        polars, ...) once.
+
+        Usage:
+            async for batch in driver.stream(sql, batch_size=10000, format='arrow'):
+                ...
+
+        When stopping early, wrap it on ``contextlib.aclosing()``
+        to release the server-side cursor right away.
+        """
+        if not sentence:
+            raise EmptyStatement(f"{__name__!s} Error: Cannot use an empty Sentence.")
+        if params is None:
+            params = []
+        serializer = OutputFactory(self, frmt=format, **kwargs)
+        columnar = getattr(serializer, "columnar", False)
+        async with contextlib.aclosing(
+            self._fetch_batches(sentence, params, batch_size, arrow=format in ARROW_FORMATS)
+        ) as batches:
+            async for batch in batches:
+                if columnar and self._attributes:
+                    result, error = await serializer(batch, None, attributes=self._attributes)
+                else:
+                    result, error = await serializer(batch, None)
+                if error:
+                    raise DriverError(f"{self._provider}: Error on Stream: {error}")
+                yield result
+
+    async def stream_encoded(
+        self,
+        sentence: Union[str, Any],
+        params: Union[Iterable[Any], None] = None,
+        batch_size: int = 1000,
+        format: str = "ndjson",  # pylint: disable=W0622
+        **kwargs
+    ) -> AsyncGenerator:
+        """stream_encoded.
+
+        Server-side streaming of a query encoded by a streaming format
+        (json, ndjson, ...): yields chunks of bytes, ex: the body of an HTTP
+        response, without materializing the result.
+
+        Usage:
+            async for chunk in driver.stream_encoded(sql, format='ndjson', batch_size=5000):
+                await response.write(chunk)
+        """
+        serializer = self._streaming_format(sentence, format, **kwargs)
+        async with contextlib.aclosing(self._batches_for(serializer, sentence, params, batch_size)) as batches:
+            # the first batch sets the column metadata of the statement.
+            first = await anext(batches, None)
+            async with contextlib.aclosing(
+                serializer.encode(_prepend(first, batches), attributes=self._attributes)
+            ) as chunks:
+                async for chunk in chunks:
+                    yield chunk
+
+    async def export(
+        self,
+        sentence: Union[str, Any],
+        destination: Any,
+        params: Union[Iterable[Any], None] = None,
+        batch_size: int = 1000,
+        format: str = "csv",  # pylint: disable=W0622
+        **kwargs
+    ) -> int:
+        """export.
+
+        Server-side streaming of a query into a destination (a file path, a
+        file-like object or an async sink) through a streaming format (csv,
+        tsv, json, ndjson, parquet, ipc, ...), batch by batch. Format options
+        (ex: delimiter, compression) are passed as keyword arguments.
+        Returns the bytes written.
+
+        Usage:
+            await driver.export(sql, "/tmp/sales.csv", format="csv", quoting="all")
+            await driver.export(sql, "/tmp/sales.parquet", format="parquet", compression="zstd")
+        """
+        serializer = self._streaming_format(sentence, format, **kwargs)
+        async with contextlib.aclosing(self._batches_for(serializer, sentence, params, batch_size)) as batches:
+            first = await anext(batches, None)
+            return await serializer.write(_prepend(first, batches), destination, attributes=self._attributes)
+
+    def _batches_for(self, serializer: Any, sentence: Any, params: Any, batch_size: int) -> AsyncGenerator:
+        # columnar formats (parquet, ipc) take the native Arrow batches of the backend.
+        return self._fetch_batches(
+            sentence, params or [], batch_size, arrow=getattr(serializer, "columnar", False)
+        )
+
+    def _streaming_format(self, sentence: Any, format: str, **kwargs) -> Any:  # pylint: disable=W0622
+        if not sentence:
+            raise EmptyStatement(f"{__name__!s} Error: Cannot use an empty Sentence.")
+        serializer = OutputFactory(self, frmt=format, **kwargs)
+        if not getattr(serializer, "streaming", False):
+            raise DriverError(f"{self._provider}: {format} is not a streaming format")
+        return serializer
+
     ### Cursor Iterator Context
     def __aiter__(self):
         return self
@@ -1,6 +1,10 @@
 from enum import Enum
 from typing import Any, List
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from decimal import Decimal
+import datetime
+import itertools
 import uuid
 import inspect
 import types
@@ -8,10 +12,69 @@ from datamodel.exceptions import ValidationError
 from ..exceptions import DriverError
 from ..models import Model, Field, is_missing, is_dataclass
 from ..utils.types import Entity
+from ..utils.lru import LRUCache
 
 
 null_values = {"null", "NULL"}
 not_null_values = {"!null", "!NULL"}
+null_markers = null_values | not_null_values
+
+# scalar types compiled as "column = $n" when not a null marker.
+_plain_types = {
+    str, int, float, bool, Decimal, uuid.UUID, datetime.date, datetime.datetime, datetime.time
+}
+
+# operator -> SQL template for parameterized conditions.
+_param_operators = {
+    "$in": "{key} = ANY({arg})",
+    "$nin": "{key} <> ALL({arg})",
+    "$ne": "{key} <> {arg}",
+    "$gt": "{key} > {arg}",
+    "$lt": "{key} < {arg}",
+    "$gte": "{key} >= {arg}",
+    "$lte": "{key} <= {arg}",
+    "$like": "{key} LIKE {arg}",
+    "$ilike": "{key} ILIKE {arg}",
+    "$is": "{key} IS NOT DISTINCT FROM {arg}",
+}
+
+# compiled WHERE templates, by filter shape and first placeholder.
+_where_templates = LRUCache(maxsize=512)
+
+
+class ModelPlan:
+    """ModelPlan.
+
+    Metadata of a Model class precompiled for the drivers: table name,
+    per-column flags (required, db_default, default factory, primary key)
+    and a ``statements`` cache for the SQL templates built by a driver.
+    Built once per Model and rebuilt when its Meta (schema, name) changes.
+    """
+
+    __slots__ = ("signature", "table", "fields", "names", "primary_keys", "statements")
+
+    def __init__(self, model: Any, signature: tuple):
+        self.signature = signature
+        schema, name = signature[0], signature[1]
+        if name:
+            self.table = f"{schema}.{name}" if schema else name
+        else:
+            self.table = model.__name__
+        fields = []
+        for column, field in model.get_columns().items():
+            try:
+                required = field.required()
+            except AttributeError:
+                required = False
+            default = field.default if callable(field.default) else None
+            fields.append(
+                (column, field, required, "db_default" in field.metadata, default, field.primary_key is True)
+            )
+        # (name, field, required, db_default, default factory, primary key)
+        self.fields: tuple = tuple(fields)
+        self.names: tuple = tuple(f[0] for f in fields)
+        self.primary_keys: tuple = tuple(f[0] for f in fields if f[5])
+        self.statements: dict = {}
 
 
 class ModelBackend(ABC):
@@ -23,27 +86,67 @@ class ModelBackend(ABC):
         super().__init__()
 
     # ## Class-based Methods.
-    async def _create_(self, _model: Model, rows: list):
+    async def _create_(self, _model: Model, rows: list, returning: bool = True, upsert: bool = False):
         """
         Create all records based on a dataset and return result.
+
+        When returning is False, the created records are not refreshed
+        with the values generated by the database. With upsert, the rows
+        already stored (same primary key) are updated instead.
         """
         try:
             table = f"{_model.Meta.name}"
         except AttributeError:
             table = _model.__name__
-        results = []
+        records = []
         for row in rows:
             try:
                 record = _model(**row)
             except (ValueError, ValidationError) as e:
                 raise ValueError(f"Invalid Row for Model {_model}: {e}") from e
             if record:
-                try:
-                    result = await record.insert()
-                    results.append(result)
-                except Exception as e:
-                    raise DriverError(f"Error on Creation {table}: {e}") from e
-        return results
+                records.append(record)
+        if not records:
+            return []
+        try:
+            return await self._insert_many_(_model, records, returning=returning, upsert=upsert)
+        except (ValueError, DriverError):
+            raise
+        except Exception as e:
+            raise DriverError(f"Error on Creation {table}: {e}") from e
+
+    async def _insert_many_(self, _model: Model, records: list, returning: bool = True, upsert: bool = False) -> list:
+        """
+        Insert (or upsert) a list of Model instances.
+
+        Drivers with batched inserts override it, by default
+        every record is inserted (or saved) on its own.
+        """
+        if upsert:
+            return [await record.save() for record in records]
+        return [await record.insert() for record in records]
+
+    @staticmethod
+    def _group_rows(rows: list) -> dict:
+        """
+        Group (record, columns, values) rows by their column list,
+        every group can be inserted with a single statement.
+        """
+        groups: dict = {}
+        for row in rows:
+            groups.setdefault(tuple(row[1]), []).append(row)
+        return groups
+
+    @staticmethod
+    def _pair_rows(records: list, keys: tuple, rows: list) -> list:
+        """
+        Pair the rows returned by a multi-row INSERT with their records,
+        records being (record, primary key values) pairs and keys the
+        primary key columns: rows may come back in any order. Keys are
+        compared as text (ex: an UUID given as a string).
+        """
+        found = {tuple(str(row[key]) for key in keys): row for row in rows}
+        return [(record, found.get(tuple(str(v) for v in values))) for record, values in records]
 
     @abstractmethod
     async def _remove_(self, _model: Model, **kwargs):
@@ -112,6 +215,20 @@ class ModelBackend(ABC):
         """
 
     ## Aux Methods:
+    def _model_plan_(self, _model: Model) -> ModelPlan:
+        """
+        Returns the (cached) ModelPlan of a Model class or instance.
+        """
+        cls = _model if isinstance(_model, type) else type(_model)
+        meta = cls.Meta
+        signature = (getattr(meta, "schema", None), getattr(meta, "name", None))
+        # stored on the class itself (not inherited by subclasses).
+        plan = cls.__dict__.get("__model_plan__")
+        if plan is None or plan.signature != signature:
+            plan = ModelPlan(cls, signature)
+            setattr(cls, "__model_plan__", plan)
+        return plan
+
     def _get_value(self, field: Field, value: Any) -> Any:
         datatype = field.type
         new_val = None
@@ -266,6 +383,162 @@ class ModelBackend(ABC):
             condition = f"{key}={val}"
         return condition
 
+    ## Parameterized WHERE:
+    def _where_params(self, fields: dict[Field], where: dict, start: int = 1) -> tuple[str, list]:
+        """
+        Build a WHERE clause with positional placeholders ($1, $2, ...).
+        Same mini-DSL and semantics of _where, but values are returned as
+        arguments instead of being interpolated as literals.
+
+        The SQL only depends on the "shape" of the filter (columns, operators
+        and kind of values), compiled templates are cached by shape, so
+        filters with different values share the same (prepared) statement.
+
+        Returns (condition, args), args numbered from ``start``.
+        """
+        if not fields or not where or not isinstance(where, dict):
+            return "", []
+        if all(type(v) in _plain_types and v not in null_markers for v in where.values()):
+            # fast path: "column = value" conditions only.
+            key = (tuple(where), start)
+            condition = _where_templates.get(key)
+            if condition is None:
+                condition = "\nWHERE " + " AND ".join(f"{k}=${n}" for n, k in enumerate(where, start=start))
+                _where_templates.put(key, condition)
+            return condition, [self._param_value(fields[k].type, v) for k, v in where.items()]
+        strict = not (
+            any(k.startswith("$") for k in where.keys()) or any(isinstance(v, (dict, list)) for v in where.values())
+        )
+        args = []
+        shape = self._where_shape(fields, where, args, strict=strict)
+        key = (shape, start)
+        condition = _where_templates.get(key)
+        if condition is None:
+            expr = self._render_where(shape, itertools.count(start))
+            condition = f"\nWHERE {expr}" if expr else ""
+            _where_templates.put(key, condition)
+        return condition, args
+
+    def _where_shape(self, fields: dict, where: Any, args: list, strict: bool = False) -> tuple:
+        """Walk a filter, collecting its arguments and returning its (hashable) shape."""
+        if not where:
+            return ("empty",)
+        if isinstance(where, str):
+            return ("sql", where.strip())
+        if isinstance(where, list):
+            return ("and", tuple(self._where_shape(fields, w, args) for w in where))
+        if isinstance(where, dict):
+            ors = ands = nots = None
+            if "$or" in where:
+                ors = tuple(self._where_shape(fields, w, args) for w in where["$or"])
+            if "$and" in where:
+                ands = tuple(self._where_shape(fields, w, args) for w in where["$and"])
+            if "$not" in where:
+                nots = self._where_shape(fields, where["$not"], args)
+            leaves = []
+            for k, v in where.items():
+                if k.startswith("$"):
+                    continue
+                if k in fields:
+                    leaves.append(self._leaf_shape(k, fields[k], v, args))
+                elif strict:
+                    raise KeyError(k)
+            return ("dict", ors, ands, nots, tuple(leaves))
+        return ("empty",)
+
+    def _leaf_shape(self, key: str, field: Field, value: Any, args: list) -> tuple:
+        datatype = field.type
+        if isinstance(value, dict):
+            ops = []
+            for op, val in value.items():
+                if op == "$is" and (val is None or val in null_values):
+                    ops.append(("$is", "null"))
+                    continue
+                if op == "$is" and val in not_null_values:
+                    ops.append(("$is", "notnull"))
+                    continue
+                if op in ("$in", "$nin"):
+                    args.append([self._param_value(datatype, v) for v in val])
+                else:
+                    args.append(self._param_value(datatype, val))
+                ops.append((op if op in _param_operators else "$eq", None))
+            return ("ops", key, tuple(ops))
+        if isinstance(value, (list, tuple, set)):
+            args.append([self._param_value(datatype, v) for v in value if v is not None])
+            return ("any", key, None in value)
+        if value is None or value in null_values:
+            return ("null", key)
+        if value in not_null_values:
+            return ("notnull", key)
+        args.append(self._param_value(datatype, value))
+        return ("eq", key)
+
+    def _render_where(self, shape: tuple, counter: Iterator[int]) -> str:
+        """Render the SQL of a filter shape, numbering placeholders from counter."""
+        kind = shape[0]
+        if kind == "sql":
+            return f"({shape[1]})" if shape[1] else ""
+        if kind == "and":
+            inner = [self._render_where(s, counter) for s in shape[1]]
+            return " AND ".join(c for c in inner if c)
+        if kind != "dict":
+            return ""
+        _, ors, ands, nots, leaves = shape
+        parts = []
+        if ors is not None:
+            inner = [c for c in (self._render_where(s, counter) for s in ors) if c]
+            if inner:
+                parts.append("(" + " OR ".join(inner) + ")")
+        if ands is not None:
+            inner = [c for c in (self._render_where(s, counter) for s in ands) if c]
+            if inner:
+                parts.append("(" + " AND ".join(inner) + ")")
+        if nots is not None:
+            if not_part := self._render_where(nots, counter):
+                parts.append(f"(NOT {not_part})")
+        for leaf in leaves:
+            parts.append(self._render_leaf(leaf, counter))
+        return " AND ".join(parts)
+
+    def _render_leaf(self, leaf: tuple, counter: Iterator[int]) -> str:
+        kind, key = leaf[0], leaf[1]
+        if kind == "null":
+            return f"{key} is NULL"
+        if kind == "notnull":
+            return f"{key} is NOT NULL"
+        if kind == "eq":
+            return f"{key}=${next(counter)}"
+        if kind == "any":
+            null_vals = f" OR {key} is NULL" if leaf[2] else ""
+            return f"({key} = ANY(${next(counter)}){null_vals})"
+        parts = []
+        for op, val in leaf[2]:
+            if val == "null":
+                parts.append(f"{key} IS NULL")
+            elif val == "notnull":
+                parts.append(f"{key} IS NOT NULL")
+            elif op == "$eq":
+                parts.append(f"{key}=${next(counter)}")
+            else:
+                parts.append(_param_operators[op].format(key=key, arg=f"${next(counter)}"))
+        return "(" + " AND ".join(parts) + ")"
+
+    def _param_value(self, datatype: Any, value: Any) -> Any:
+        """Coerce a filter value to the python type of its column (ex: "1" -> 1 for int)."""
+        if isinstance(value, Enum):
+            return value.value
+        try:
+            if isinstance(value, str):
+                if datatype in (int, float, Decimal, uuid.UUID):
+                    return datatype(value)
+                if datatype in (datetime.date, datetime.datetime, datetime.time):
+                    return datatype.fromisoformat(value)
+            elif datatype is str and isinstance(value, (int, float, Decimal, uuid.UUID)):
+                return str(value)
+        except ValueError:
+            pass
+        return value
+
     def _format_value(self, value):
         if isinstance(value, str) and value is not None:
             return f"'{value}'"
@@ -1,11 +1,24 @@
 from typing import Optional, Union, Any
-from collections.abc import Callable, Awaitable
+from collections.abc import AsyncIterator, Callable, Awaitable, Iterable
 from abc import abstractmethod
 import asyncio
 from functools import partial
-from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 import logging
 from .abstract import AbstractDriver, PoolContextManager, EventLoopManager
+from ..utils.executors import get_executor, concurrency_slot
+from ..exceptions import DriverError
+from ..utils.metrics import PoolMetrics
+from ..utils.tracing import RESULT_ERROR_METHODS
+
+
+def _statement(statement: Any) -> tuple:
+    """(sentence, args, kwargs) of a statement: a sentence or a (sentence, args) pair."""
+    if isinstance(statement, (tuple, list)):
+        sentence, params = statement
+        if isinstance(params, dict):
+            return sentence, (), params
+        return sentence, tuple(params or ()), {}
+    return statement, (), {}
 
 
 class PoolBackend(AbstractDriver, PoolContextManager, EventLoopManager):
@@ -33,6 +46,11 @@ class PoolBackend(AbstractDriver, PoolContextManager, EventLoopManager):
         self._logger = logging.getLogger(name=__name__)
         # Executor:
         self._executor = None
+        # Metrics:
+        self._pool_name: str = kwargs.get("pool_name", None)
+        self._metrics = PoolMetrics()
+        # Tracer of the acquired connections (asyncdb.utils.tracing.Tracer)
+        self._tracer = kwargs.get("tracer", None)
 
     async def connect(self) -> "PoolBackend":
         """connect.
@@ -68,6 +86,141 @@ class PoolBackend(AbstractDriver, PoolContextManager, EventLoopManager):
     def log(self):
         return self._logger
 
+    def _pool_stats(self) -> dict:
+        """_pool_stats.
+
+        Size, connections in use and idle, min_size and max_clients of the pool
+        (None when unknown), overridden by every pool.
+        """
+        return {
+            "size": None,
+            "in_use": self._metrics.acquired - self._metrics.released,
+            "idle": None,
+            "min_size": getattr(self, "_min_size", None),
+            "max_clients": getattr(self, "_max_clients", None),
+        }
+
+    def metrics(self) -> dict:
+        """metrics.
+
+        Pool metrics: size, in_use, idle, waiters, acquire latency histogram,
+        connection age and failures by exception class.
+        See asyncdb.utils.metrics for the Prometheus and OpenTelemetry exporters.
+        """
+        stats = {
+            "provider": self._provider,
+            "name": self._pool_name or self._provider,
+            "connected": self._connected,
+            "waiters": self._metrics.waiting,
+        }
+        try:
+            stats.update(self._pool_stats())
+        except Exception as err:  # pylint: disable=W0703
+            # the pool is closed (or not yet connected)
+            self._logger.debug(f"Pool Stats Error: {err}")
+        stats.update(self._metrics.as_dict())
+        return stats
+
+    async def _run_statement(self, statement: Any, method: str, timeout: Optional[float]) -> Any:
+        sentence, args, kwargs = _statement(statement)
+        db = await self.acquire()
+        try:
+            return await asyncio.wait_for(getattr(db, method)(sentence, *args, **kwargs), timeout)
+        except asyncio.TimeoutError as err:
+            raise DriverError(f"{self._provider}: Query Timeout after {timeout} seconds: {sentence}") from err
+        finally:
+            # shielded: the connection returns to the pool even when the task is cancelled.
+            await asyncio.shield(self.release(db))
+
+    async def iter_queries(
+        self,
+        statements: Iterable,
+        concurrency: int = 10,
+        timeout: Optional[float] = None,
+        method: str = "query",
+        ordered: bool = False,
+        return_exceptions: bool = True
+    ) -> AsyncIterator[tuple]:
+        """iter_queries.
+
+        Runs the statements on up to ``concurrency`` connections of the pool,
+        yields (index, result) as they complete (in order of the statements when ``ordered``).
+
+        A statement is a sentence or a (sentence, args) pair, args being the positional
+        arguments of the driver method (or a dict of keyword arguments); ``method`` is
+        the driver method called ("query", "queryrow", "execute", "fetch_all", ...).
+        ``timeout`` (seconds) applies to every statement.
+        Failures are yielded as results (as [None, error] for the methods returning
+        [result, error]) or, without ``return_exceptions``, raised after cancelling the others.
+        Every connection is released, even when the iteration is stopped.
+        """
+        if concurrency < 1:
+            raise ValueError(f"{self._provider}: concurrency must be at least 1")
+        statements = iter(enumerate(statements))
+        pending: dict = {}
+        done: dict = {}
+        following = 0
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(pending) < concurrency:
+                    try:
+                        idx, statement = next(statements)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    task = asyncio.create_task(self._run_statement(statement, method, timeout))
+                    pending[task] = idx
+                if not pending:
+                    break
+                finished, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in finished:
+                    idx = pending.pop(task)
+                    if (error := task.exception()) is None:
+                        result = task.result()
+                    elif not return_exceptions:
+                        raise error
+                    elif method in RESULT_ERROR_METHODS:
+                        result = [None, error]
+                    else:
+                        result = error
+                    if not ordered:
+                        yield idx, result
+                        continue
+                    done[idx] = result
+                    while following in done:
+                        yield following, done.pop(following)
+                        following += 1
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def map_queries(
+        self,
+        statements: Iterable,
+        concurrency: int = 10,
+        timeout: Optional[float] = None,
+        method: str = "query",
+        return_exceptions: bool = True
+    ) -> list:
+        """map_queries.
+
+        Runs the statements concurrently over the pool (see iter_queries),
+        returns their results in the order of the statements.
+        """
+        results: dict = {}
+        async for idx, result in self.iter_queries(
+            statements,
+            concurrency=concurrency,
+            timeout=timeout,
+            method=method,
+            return_exceptions=return_exceptions
+        ):
+            results[idx] = result
+        return [results[idx] for idx in range(len(results))]
+
     def pool(self):
         return self._pool
 
@@ -93,28 +246,28 @@ class PoolBackend(AbstractDriver, PoolContextManager, EventLoopManager):
     def dialect(cls):
         return cls._syntax
 
-    def get_executor(self, executor="thread", max_workers: int = 2) -> Any:
-        if executor == "thread":
-            return ThreadPoolExecutor(max_workers=max_workers)
-        elif executor == "process":
-            return ProcessPoolExecutor(max_workers=max_workers)
-        elif self._executor is not None:
-            return self._executor
-        else:
-            return None
+    def get_executor(self, executor="thread", max_workers: int = 2) -> Any:  # pylint: disable=W0613
+        """get_executor.
+
+        Returns the process-wide executor "thread", "process" (or any other name),
+        shared by every driver. Executors are sized on the registry
+        (asyncdb.utils.executors.configure_executor), max_workers is not used.
+        """
+        return get_executor(executor)
 
     async def _thread_func(self, fn: Union[Callable, Awaitable], *args, executor: Any = None, **kwargs):
         """_execute.
 
         Returns a future to be executed into a Thread Pool.
+        Calls are bounded by the concurrency limit of the driver.
         """
         loop = asyncio.get_event_loop()
         func = partial(fn, *args, **kwargs)
         if not executor:
-            executor = self._executor
+            executor = self._executor or get_executor("thread")
         try:
-            fut = loop.run_in_executor(executor, func)
-            return await fut
+            async with concurrency_slot(self._provider, executor):
+                return await loop.run_in_executor(executor, func)
         except Exception as e:
             self._logger.exception(e, stack_info=True)
             raise
@@ -21,7 +21,7 @@ from asyncdb.exceptions import (
     ModelError,
     StatementError
 )
-from asyncdb.utils.modules import module_exists
+from asyncdb.utils.modules import load_driver
 
 DB_TYPES[int64] = "bigint"
 
@@ -62,9 +62,8 @@ class Model(BaseModel):
             pass
         elif self.Meta.driver:
             driver = self.Meta.driver
-            provider = f"asyncdb.drivers.{driver}"
             try:
-                obj = module_exists(driver, provider)
+                obj = load_driver(driver)
             except Exception as err:
                 raise ModelError(f"{err}") from err
             if self.Meta.dsn is not None:
@@ -216,13 +215,21 @@ class Model(BaseModel):
 
     ### Class-based methods for Dataclasses.
     @classmethod
-    async def create(cls, records: list):
+    async def create(cls, records: list, returning: bool = True, upsert: bool = False):
+        """create.
+
+        Insert a list of records (dicts) in batches,
+        returning the created Models (refreshed from database when returning is True).
+        With upsert, records with the primary key of a stored row update it.
+        """
         if not cls.Meta.connection:
             raise ConnectionMissing(f"Missing Connection for Model: {cls}")
         # working always with native format:
         cls.Meta.connection.output_format("native")
         try:
-            result = await cls.Meta.connection._create_(_model=cls, rows=records)
+            result = await cls.Meta.connection._create_(
+                _model=cls, rows=records, returning=returning, upsert=upsert
+            )
             if result:
                 return result
         except ValidationError:
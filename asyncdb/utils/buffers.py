@@ -0,0 +1,110 @@
+"""
+Bounded Buffers.
+
+Queue of byte chunks bounded both by number of chunks and by buffered bytes,
+used to apply backpressure on producers (ex: COPY callbacks) when the
+consumer is slower than the network.
+"""
+import asyncio
+from collections import deque
+from typing import Optional
+
+
+class ChunkQueue:
+    """ChunkQueue.
+
+    Asyncio queue of bytes chunks, ``put`` suspends the producer while the
+    queue holds ``max_chunks`` chunks or ``max_bytes`` bytes (0 means unbounded).
+    A single chunk bigger than ``max_bytes`` is always accepted on an empty queue.
+
+    ``close()`` marks the end of the stream: ``get`` returns None once drained.
+    """
+
+    def __init__(self, max_chunks: int = 0, max_bytes: int = 0):
+        self.max_chunks: int = max_chunks or 0
+        self.max_bytes: int = max_bytes or 0
+        self._chunks: deque = deque()
+        self._bytes: int = 0
+        self._closed: bool = False
+        self._discard: bool = False
+        self._cond = asyncio.Condition()
+        # metrics
+        self.high_water_chunks: int = 0
+        self.high_water_bytes: int = 0
+        self.total_chunks: int = 0
+        self.total_bytes: int = 0
+        self.producer_waits: int = 0
+
+    def _full(self, size: int) -> bool:
+        if not self._chunks:
+            return False
+        if self.max_chunks and len(self._chunks) >= self.max_chunks:
+            return True
+        return bool(self.max_bytes and self._bytes + size > self.max_bytes)
+
+    def qsize(self) -> int:
+        return len(self._chunks)
+
+    @property
+    def buffered_bytes(self) -> int:
+        return self._bytes
+
+    async def put(self, chunk: bytes) -> None:
+        size = len(chunk)
+        async with self._cond:
+            if self._discard:
+                return
+            if self._full(size):
+                self.producer_waits += 1
+                await self._cond.wait_for(lambda: self._discard or not self._full(size))
+                if self._discard:
+                    return
+            self._chunks.append(chunk)
+            self._bytes += size
+            self.total_chunks += 1
+            self.total_bytes += size
+            self.high_water_chunks = max(self.high_water_chunks, len(self._chunks))
+            self.high_water_bytes = max(self.high_water_bytes, self._bytes)
+            self._cond.notify_all()
+
+    async def get(self) -> Optional[bytes]:
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._chunks or self._closed)
+            if not self._chunks:
+                return None
+            chunk = self._chunks.popleft()
+            self._bytes -= len(chunk)
+            self._cond.notify_all()
+            return chunk
+
+    async def close(self) -> None:
+        """close.
+
+        No more chunks will be produced.
+        """
+        async with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    async def discard(self) -> None:
+        """discard.
+
+        Drop the pending chunks and every chunk produced from now on,
+        releasing a suspended producer.
+        """
+        async with self._cond:
+            self._discard = True
+            self._chunks.clear()
+            self._bytes = 0
+            self._cond.notify_all()
+
+    def stats(self) -> dict:
+        return {
+            "max_chunks": self.max_chunks,
+            "max_bytes": self.max_bytes,
+            "high_water_chunks": self.high_water_chunks,
+            "high_water_bytes": self.high_water_bytes,
+            "total_chunks": self.total_chunks,
+            "total_bytes": self.total_bytes,
+            "producer_waits": self.producer_waits,
+        }
@@ -0,0 +1,362 @@
+"""
+Query Result Cache.
+
+Opt-in cache of driver results (query, queryrow, fetch_all, fetch_one):
+an in-process LRU tier with TTL, an optional shared tier backed by one of
+the cache drivers (redis, memcache, hazel), tag invalidation and
+single-flight of concurrent identical misses.
+
+Usage:
+    cache = QueryCache(maxsize=1024, ttl=30)
+    db = AsyncDB("pg", params=params, cache=cache)
+    result, error = await db.query(sql, cache_tags=("sales",))
+    await cache.invalidate("sales")
+"""
+import asyncio
+import base64
+import functools
+import hashlib
+import io
+import logging
+import math
+import pickle
+import time
+import uuid
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any, Optional
+from .lru import LRUCache
+
+
+CACHED_METHODS = ("query", "queryrow", "fetch_all", "fetch_one")
+# methods returning [result, error].
+RESULT_ERROR_METHODS = {"query", "queryrow"}
+
+# expiration argument of set() on every shared cache driver.
+SHARED_TTL_ARGS = {
+    "redis": "ex",
+    "memcache": "timeout",
+}
+
+_MISSING = object()
+# result of a cancelled loader: the waiters retry.
+_RETRY = object()
+
+
+class _RowPickler(pickle.Pickler):
+    """Pickler storing rows without pickle support (ex: asyncpg.Record) as dicts."""
+
+    def __init__(self, file, protocol: int = pickle.HIGHEST_PROTOCOL):
+        super().__init__(file, protocol)
+        self._protocol = protocol
+
+    def reducer_override(self, obj):
+        if isinstance(obj, (type, dict)) or not callable(getattr(obj, "keys", None)):
+            return NotImplemented
+        try:
+            return obj.__reduce_ex__(self._protocol)
+        except TypeError:
+            return dict, ([(k, obj[k]) for k in obj.keys()],)
+
+
+def dumps(value: Any) -> str:
+    """Serialize a value for the shared tier (text-safe)."""
+    try:
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    except (TypeError, pickle.PicklingError):
+        file = io.BytesIO()
+        _RowPickler(file).dump(value)
+        data = file.getvalue()
+    return base64.b64encode(data).decode("ascii")
+
+
+def loads(payload: Any) -> Any:
+    if isinstance(payload, str):
+        payload = payload.encode("ascii")
+    return pickle.loads(base64.b64decode(payload))
+
+
+def is_cacheable(result: Any) -> bool:
+    """Results in [result, error] form are cached only without error."""
+    if isinstance(result, (list, tuple)) and len(result) == 2:
+        return not result[1]
+    return True
+
+
+def _always(result: Any) -> bool:
+    return True
+
+
+class QueryCache:
+    """QueryCache.
+
+    Result cache shared by any number of drivers.
+
+    Args:
+        maxsize: max. entries on the in-process tier (0 disables it).
+        ttl: seconds an entry is valid on the in-process tier.
+        shared: a connected cache driver (redis, memcache or hazel) used as
+            second tier, shared between processes.
+        shared_ttl: seconds an entry is valid on the shared tier (default: ttl).
+        namespace: prefix of every key on the shared tier.
+
+    Entries of the in-process tier are evicted as soon as a tag is invalidated;
+    on the shared tier every entry keeps the version of its tags, and stops
+    being valid when ``invalidate`` renews them. In-process tiers of other
+    processes are only refreshed after their ``ttl``.
+
+    Cached results are shared between callers, and must not be mutated.
+    Values from the shared tier are unpickled: rows without pickle support
+    (ex: asyncpg.Record) are returned as dicts.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 60,
+        shared: Any = None,
+        shared_ttl: Optional[float] = None,
+        namespace: str = "asyncdb"
+    ):
+        self.ttl: float = ttl
+        self.shared = shared
+        self.shared_ttl: float = shared_ttl or ttl
+        self.namespace: str = namespace
+        self._logger = logging.getLogger(name=__name__)
+        self._local = LRUCache(maxsize=maxsize, on_evict=self._forget)
+        self._tags: dict[str, set] = {}
+        self._inflight: dict[str, asyncio.Future] = {}
+        # metrics
+        self.hits: int = 0
+        self.shared_hits: int = 0
+        self.misses: int = 0
+        self.coalesced: int = 0
+
+    def bind(self, driver: Any, methods: Iterable[str] = CACHED_METHODS) -> Any:
+        """bind.
+
+        Wrap the read methods of a driver instance, the wrapped methods accept:
+            cache (bool): False bypass the cache for this call.
+            cache_ttl (float): ttl of the entry (default: the cache ttl).
+            cache_tags (tuple): tags of the entry, for ``invalidate``.
+        """
+        for name in methods:
+            method = getattr(driver, name, None)
+            if method is not None and asyncio.iscoroutinefunction(method):
+                setattr(driver, name, self._wrap(driver, name, method))
+        return driver
+
+    def _wrap(self, driver: Any, name: str, method: Callable) -> Callable:
+        cacheable = is_cacheable if name in RESULT_ERROR_METHODS else _always
+
+        @functools.wraps(method)
+        async def cached(
+            sentence: Any = None,
+            *args,
+            cache: bool = True,
+            cache_ttl: Optional[float] = None,
+            cache_tags: Iterable[str] = (),
+            **kwargs
+        ):
+            if not cache:
+                return await method(sentence, *args, **kwargs)
+            key = self.make_key(driver, name, sentence, args, kwargs)
+            return await self.fetch(
+                key,
+                lambda: method(sentence, *args, **kwargs),
+                ttl=cache_ttl,
+                tags=cache_tags,
+                cacheable=cacheable
+            )
+
+        return cached
+
+    def make_key(self, driver: Any, method: str, sentence: Any, args: tuple = (), kwargs: dict = None) -> str:
+        """make_key.
+
+        Key of a driver call: driver, DSN, method, output format, sentence and arguments.
+        """
+        dsn = getattr(driver, "_dsn", None) or getattr(getattr(driver, "_pool", None), "_dsn", None)
+        serializer = getattr(driver, "_serializer", None)
+        # unwrap the serializer of a traced driver.
+        serializer = type(getattr(serializer, "__wrapped__", serializer)).__qualname__
+        raw = repr(
+            (
+                getattr(driver, "_provider", None),
+                dsn,
+                method,
+                serializer,
+                sentence,
+                args,
+                sorted(kwargs.items()) if kwargs else ()
+            )
+        )
+        return f"{self.namespace}:{hashlib.sha1(raw.encode('utf-8')).hexdigest()}"
+
+    async def fetch(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable],
+        ttl: Optional[float] = None,
+        tags: Iterable[str] = (),
+        cacheable: Callable[[Any], bool] = is_cacheable
+    ) -> Any:
+        """fetch.
+
+        Returns the cached value of key, or awaits ``loader()`` and caches its result.
+        Concurrent misses of the same key wait for a single loader call; if that
+        call is cancelled, one of the waiters calls its own loader.
+        """
+        while True:
+            value = self._get_local(key)
+            if value is not _MISSING:
+                self.hits += 1
+                return value
+            if (future := self._inflight.get(key)) is None:
+                break
+            value = await asyncio.shield(future)
+            if value is not _RETRY:
+                self.coalesced += 1
+                return value
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            tags = tuple(tags)
+            value = await self._get_shared(key, ttl)
+            if value is _MISSING:
+                self.misses += 1
+                value = await loader()
+                if cacheable(value):
+                    self._set_local(key, value, ttl, tags)
+                    await self._set_shared(key, value, ttl, tags)
+            else:
+                self.shared_hits += 1
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            # wake up the waiters, the first one becomes the loader.
+            future.set_result(_RETRY)
+            raise
+        except Exception as err:
+            future.set_exception(err)
+            # retrieved: nobody may be waiting for it.
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    ## in-process tier:
+    def _get_local(self, key: str) -> Any:
+        entry = self._local.get(key, _MISSING)
+        if entry is _MISSING:
+            return _MISSING
+        expires, value, _ = entry
+        if expires < time.monotonic():
+            self._drop(key)
+            return _MISSING
+        return value
+
+    def _set_local(self, key: str, value: Any, ttl: Optional[float], tags: tuple) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0 or self._local.maxsize <= 0:
+            return
+        self._local.put(key, (time.monotonic() + ttl, value, tags))
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+
+    def _forget(self, key: str, entry: tuple) -> None:
+        for tag in entry[2]:
+            if (keys := self._tags.get(tag)) is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    def _drop(self, key: str) -> None:
+        if (entry := self._local.pop(key)) is not None:
+            self._forget(key, entry)
+
+    ## shared tier:
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.namespace}:tag:{tag}"
+
+    async def _tag_versions(self, tags: Iterable[str], create: bool = False) -> dict:
+        versions = {}
+        for tag in tags:
+            version = await self.shared.get(self._tag_key(tag))
+            if version is None and create:
+                version = uuid.uuid4().hex
+                await self.shared.set(self._tag_key(tag), version)
+            versions[tag] = version
+        return versions
+
+    def _ttl_args(self, ttl: float) -> dict:
+        if (arg := SHARED_TTL_ARGS.get(getattr(self.shared, "_provider", None))) is not None:
+            return {arg: max(1, math.ceil(ttl))}
+        return {}
+
+    async def _get_shared(self, key: str, ttl: Optional[float]) -> Any:
+        if self.shared is None:
+            return _MISSING
+        try:
+            payload = await self.shared.get(key)
+            if payload is None:
+                return _MISSING
+            expires, value, versions = loads(payload)
+            now = time.time()
+            if expires < now:
+                return _MISSING
+            if versions and await self._tag_versions(versions) != versions:
+                # a tag was invalidated.
+                return _MISSING
+        except Exception as err:  # pylint: disable=W0703
+            # the shared tier is optional: a failure is a miss.
+            self._logger.warning(f"QueryCache: error reading {key}: {err}")
+            return _MISSING
+        self._set_local(key, value, min(expires - now, self.ttl if ttl is None else ttl), tuple(versions))
+        return value
+
+    async def _set_shared(self, key: str, value: Any, ttl: Optional[float], tags: tuple) -> None:
+        if self.shared is None:
+            return
+        ttl = self.shared_ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+        try:
+            versions = await self._tag_versions(tags, create=True) if tags else {}
+            payload = dumps((time.time() + ttl, value, versions))
+            await self.shared.set(key, payload, **self._ttl_args(ttl))
+        except Exception as err:  # pylint: disable=W0703
+            self._logger.warning(f"QueryCache: error writing {key}: {err}")
+
+    ## invalidation:
+    async def invalidate(self, *tags: str) -> None:
+        """invalidate.
+
+        Evict every entry cached with any of the tags (on both tiers).
+        """
+        for tag in tags:
+            for key in list(self._tags.get(tag, ())):
+                self._drop(key)
+            if self.shared is not None:
+                await self.shared.set(self._tag_key(tag), uuid.uuid4().hex)
+
+    async def delete(self, key: str) -> None:
+        self._drop(key)
+        if self.shared is not None:
+            await self.shared.delete(key)
+
+    def clear(self) -> None:
+        """Empty the in-process tier."""
+        self._local.clear()
+        self._tags.clear()
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._local),
+            "maxsize": self._local.maxsize,
+            "hits": self.hits,
+            "shared_hits": self.shared_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self._local.evictions,
+            "inflight": len(self._inflight),
+        }
@@ -0,0 +1,247 @@
+"""
+Shared Executors.
+
+Process-wide registry of named, size-bounded executors shared by the
+drivers running blocking calls in threads (or processes), with queue
+depth/saturation metrics and per-driver concurrency caps, so a busy
+backend cannot take every worker of the pool.
+"""
+import os
+import asyncio
+import threading
+import weakref
+import contextlib
+from functools import partial
+from collections.abc import Callable
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Optional
+
+
+DEFAULT_WORKERS: int = min(32, (os.cpu_count() or 1) + 4)
+
+_registry: dict[str, "SharedExecutor"] = {}
+_sizes: dict[str, int] = {}
+_limits: dict[str, int] = {}
+_waiting: dict[str, int] = {}
+# asyncio.Semaphore by event loop and driver.
+_semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+class SharedExecutor(Executor):
+    """SharedExecutor.
+
+    Thread (or process) pool shared by every driver using the same name.
+    ``shutdown`` is a no-op: the pool outlives the drivers, use
+    ``shutdown_executors()`` to stop them.
+
+    For process pools, ``active`` is not tracked (``queued`` counts the
+    pending calls).
+    """
+
+    def __init__(self, name: str, max_workers: int = DEFAULT_WORKERS, kind: str = "thread"):
+        self.name: str = name
+        self.kind: str = kind
+        self.max_workers: int = max_workers
+        if kind == "process":
+            self._executor = ProcessPoolExecutor(max_workers=max_workers)
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"asyncdb-{name}")
+        self._lock = threading.Lock()
+        # metrics
+        self.submitted: int = 0
+        self.completed: int = 0
+        self.active: int = 0
+        self.high_water_active: int = 0
+        self.high_water_queued: int = 0
+
+    def _run(self, fn: Callable, *args, **kwargs):
+        with self._lock:
+            self.active += 1
+            self.high_water_active = max(self.high_water_active, self.active)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    def _done(self, future: Future) -> None:  # pylint: disable=W0613
+        with self._lock:
+            self.completed += 1
+
+    def submit(self, fn: Callable, /, *args, **kwargs) -> Future:  # pylint: disable=W0221
+        if self.kind == "thread":
+            fn = partial(self._run, fn)
+        with self._lock:
+            self.submitted += 1
+            self.high_water_queued = max(self.high_water_queued, self.queued)
+        future = self._executor.submit(fn, *args, **kwargs)
+        future.add_done_callback(self._done)
+        return future
+
+    @property
+    def pending(self) -> int:
+        return self.submitted - self.completed
+
+    @property
+    def queued(self) -> int:
+        return max(0, self.pending - self.active)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        pass
+
+    def close(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+    def stats(self) -> dict:
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "max_workers": self.max_workers,
+            "active": self.active,
+            "queued": self.queued,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "high_water_active": self.high_water_active,
+            "high_water_queued": self.high_water_queued,
+            "saturation": round(min(self.pending, self.max_workers) / self.max_workers, 3),
+        }
+
+
+def configure_executor(name: str, max_workers: int) -> None:
+    """configure_executor.
+
+    Size of a named executor, applies when it is created (on first use).
+    """
+    _sizes[name] = max_workers
+
+
+def get_executor(name: str = "thread", kind: Optional[str] = None) -> SharedExecutor:
+    """get_executor.
+
+    Returns the process-wide executor registered as name, created on first use.
+    ``kind`` is "thread" or "process" (default: "process" only for the name "process").
+    """
+    try:
+        return _registry[name]
+    except KeyError:
+        pass
+    with _lock:
+        if name not in _registry:
+            kind = kind or ("process" if name == "process" else "thread")
+            default = (os.cpu_count() or 1) if kind == "process" else DEFAULT_WORKERS
+            _registry[name] = SharedExecutor(name, _sizes.get(name, default), kind=kind)
+        return _registry[name]
+
+
+def set_concurrency_limit(driver: str, limit: Optional[int]) -> None:
+    """set_concurrency_limit.
+
+    Max. concurrent blocking calls of a driver (by provider name),
+    None removes the limit. Without it, a driver can use half the workers of a shared executor.
+    """
+    if limit is None:
+        _limits.pop(driver, None)
+    else:
+        _limits[driver] = limit
+    for semaphores in _semaphores.values():
+        semaphores.pop(driver, None)
+
+
+def concurrency_slot(driver: str, executor: Optional[Executor] = None):
+    """concurrency_slot.
+
+    Async context manager holding one of the concurrent calls allowed to a driver.
+    """
+    limit = _limits.get(driver)
+    if limit is None and isinstance(executor, SharedExecutor):
+        limit = max(1, executor.max_workers // 2)
+    if not limit:
+        return contextlib.nullcontext()
+    semaphores = _semaphores.setdefault(asyncio.get_running_loop(), {})
+    if (semaphore := semaphores.get(driver)) is None:
+        semaphore = semaphores[driver] = asyncio.Semaphore(limit)
+    return _Slot(driver, semaphore)
+
+
+class _Slot:
+    __slots__ = ("driver", "semaphore")
+
+    def __init__(self, driver: str, semaphore: asyncio.Semaphore):
+        self.driver = driver
+        self.semaphore = semaphore
+
+    async def __aenter__(self):
+        if self.semaphore.locked():
+            _waiting[self.driver] = _waiting.get(self.driver, 0) + 1
+            try:
+                await self.semaphore.acquire()
+            finally:
+                _waiting[self.driver] -= 1
+        else:
+            await self.semaphore.acquire()
+
+    async def __aexit__(self, *exc):
+        self.semaphore.release()
+
+
+async def run_blocking(
+    fn: Callable,
+    *args,
+    executor: Optional[Executor] = None,
+    driver: Optional[str] = None,
+    timeout: Optional[float] = None,
+    interrupt: Optional[Callable] = None,
+    **kwargs
+):
+    """run_blocking.
+
+    Runs fn(*args, **kwargs) on executor (default: the shared "thread" executor),
+    holding a concurrency slot of driver.
+
+    When timeout expires (raises asyncio.TimeoutError) or the task is cancelled,
+    ``interrupt()`` is called (ex: DuckDB ``connection.interrupt``) and the call
+    waits for the worker to stop, so the connection is free when it raises.
+    """
+    if executor is None:
+        executor = get_executor("thread")
+    loop = asyncio.get_running_loop()
+    slot = concurrency_slot(driver, executor) if driver else contextlib.nullcontext()
+    async with slot:
+        future = loop.run_in_executor(executor, partial(fn, *args, **kwargs))
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            if interrupt is None:
+                # the worker cannot be stopped, its result is discarded.
+                future.add_done_callback(_discard)
+                raise
+            interrupt()
+            with contextlib.suppress(BaseException):
+                await future
+            raise
+
+
+def _discard(future: asyncio.Future) -> None:
+    if not future.cancelled():
+        future.exception()
+
+
+def executor_stats() -> dict:
+    """executor_stats.
+
+    Metrics of every shared executor and the calls waiting for a driver slot.
+    """
+    return {
+        "executors": {name: executor.stats() for name, executor in _registry.items()},
+        "limits": dict(_limits),
+        "waiting": {driver: n for driver, n in _waiting.items() if n},
+    }
+
+
+def shutdown_executors(wait: bool = True) -> None:
+    with _lock:
+        executors = list(_registry.values())
+        _registry.clear()
+    for executor in executors:
+        executor.close(wait=wait)
@@ -0,0 +1,67 @@
+"""
+LRU Cache.
+
+Size-bounded mapping evicting the least recently used entries,
+with hit/miss/eviction counters.
+"""
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any, Optional
+
+
+class LRUCache:
+    """LRUCache.
+
+    Least-recently-used cache of at most ``maxsize`` entries (0 disables caching).
+    ``on_evict(key, value)`` is called for every entry evicted by size.
+    """
+
+    def __init__(self, maxsize: int = 128, on_evict: Optional[Callable] = None):
+        self.maxsize: int = maxsize
+        self._data: OrderedDict = OrderedDict()
+        self._on_evict = on_evict
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        if self.maxsize <= 0:
+            return
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            old_key, old_value = self._data.popitem(last=False)
+            self.evictions += 1
+            if self._on_evict is not None:
+                self._on_evict(old_key, old_value)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        return self._data.pop(key, default)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
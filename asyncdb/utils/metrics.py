@@ -0,0 +1,302 @@
+"""
+Pool Metrics.
+
+Acquire latency histogram, waiters, failures (by exception class) and
+connection age of the pools, exportable as a dict, as a Prometheus
+collector or as OpenTelemetry observable instruments.
+HdrHistogram keeps the query latencies of asyncdb.utils.tracing.
+
+Usage:
+    pool.metrics()
+    REGISTRY.register(prometheus_collector(pool))
+    otel_observe(meter, pool)
+"""
+import bisect
+import contextlib
+import math
+import time
+import weakref
+from collections import Counter
+from collections.abc import Iterable
+from typing import Any
+
+
+# acquire latency buckets (seconds).
+ACQUIRE_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, math.inf
+)
+
+
+class Histogram:
+    """Histogram.
+
+    Fixed-bucket histogram (Prometheus-like, ``le`` upper bounds).
+    """
+
+    __slots__ = ("buckets", "counts", "count", "sum")
+
+    def __init__(self, buckets: Iterable[float] = ACQUIRE_BUCKETS):
+        self.buckets: tuple = tuple(buckets)
+        self.counts: list = [0] * len(self.buckets)
+        self.count: int = 0
+        self.sum: float = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> list:
+        total = 0
+        result = []
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-quantile (0 without observations)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        for bound, total in self.cumulative():
+            if total >= rank:
+                return bound
+        return math.inf
+
+    def as_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "avg": self.sum / self.count if self.count else 0.0,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "buckets": {str(bound): total for bound, total in self.cumulative()},
+        }
+
+
+class HdrHistogram:
+    """HdrHistogram.
+
+    Log-linear (HDR-style) histogram of durations: values are recorded in
+    microseconds, on sparse buckets with a relative error under
+    ``2 ** -significant_bits`` (default: < 1%), at any magnitude.
+    """
+
+    __slots__ = ("_bits", "_buckets", "count", "sum", "min", "max")
+
+    def __init__(self, significant_bits: int = 7):
+        self._bits: int = significant_bits + 1
+        # lower bound (microseconds) -> count
+        self._buckets: dict = {}
+        self.count: int = 0
+        self.sum: float = 0.0
+        self.min: float = math.inf
+        self.max: float = 0.0
+
+    def record(self, seconds: float) -> None:
+        value = max(0, int(seconds * 1_000_000))
+        shift = max(0, value.bit_length() - self._bits)
+        lower = (value >> shift) << shift
+        self._buckets[lower] = self._buckets.get(lower, 0) + 1
+        self.count += 1
+        self.sum += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def quantile(self, q: float) -> float:
+        """Value (seconds) at the q-quantile, 0 without observations."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        total = 0
+        for lower in sorted(self._buckets):
+            total += self._buckets[lower]
+            if total >= rank:
+                width = 1 << max(0, lower.bit_length() - self._bits)
+                # middle of the bucket, bounded by the observed values.
+                return min(self.max, max(self.min, (lower + width / 2) / 1_000_000))
+        return self.max
+
+    def as_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min if self.count else 0.0,
+            "max": self.max,
+            "avg": self.sum / self.count if self.count else 0.0,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+            "p999": self.quantile(0.999),
+        }
+
+
+class PoolMetrics:
+    """PoolMetrics.
+
+    Counters of a pool, updated by its acquire/release methods.
+    """
+
+    def __init__(self, buckets: Iterable[float] = ACQUIRE_BUCKETS):
+        self.acquire_latency = Histogram(buckets)
+        self.acquired: int = 0
+        self.released: int = 0
+        self.waiting: int = 0
+        self.max_waiting: int = 0
+        self.opened: int = 0
+        self.closed: int = 0
+        self.failures: Counter = Counter()
+        # open time of the live connections.
+        self._born = weakref.WeakKeyDictionary()
+
+    @contextlib.contextmanager
+    def acquiring(self):
+        """Measures an acquire: waiters, latency and failures."""
+        started = time.perf_counter()
+        self.waiting += 1
+        self.max_waiting = max(self.max_waiting, self.waiting)
+        try:
+            yield
+        except Exception as err:
+            self.failures[type(err).__name__] += 1
+            raise
+        else:
+            self.acquired += 1
+            self.acquire_latency.observe(time.perf_counter() - started)
+        finally:
+            self.waiting -= 1
+
+    def release(self) -> None:
+        self.released += 1
+
+    def failure(self, err: BaseException) -> None:
+        self.failures[type(err).__name__] += 1
+
+    def connection_opened(self, connection: Any) -> None:
+        self.opened += 1
+        try:
+            self._born[connection] = time.monotonic()
+        except TypeError:
+            # not weak-referenceable: counted, without age.
+            pass
+
+    def connection_closed(self, connection: Any) -> None:
+        self.closed += 1
+        self._born.pop(connection, None)
+
+    def connection_age(self) -> dict:
+        now = time.monotonic()
+        ages = [now - born for born in self._born.values()]
+        if not ages:
+            return {"min": 0.0, "max": 0.0, "avg": 0.0}
+        return {"min": min(ages), "max": max(ages), "avg": sum(ages) / len(ages)}
+
+    def as_dict(self) -> dict:
+        return {
+            "acquired": self.acquired,
+            "released": self.released,
+            "waiting": self.waiting,
+            "max_waiting": self.max_waiting,
+            "opened": self.opened,
+            "closed": self.closed,
+            "failures": dict(self.failures),
+            "acquire_latency": self.acquire_latency.as_dict(),
+            "connection_age": self.connection_age(),
+        }
+
+
+GAUGES = ("size", "in_use", "idle", "waiters", "min_size", "max_clients")
+
+
+def prometheus_collector(*pools, prefix: str = "asyncdb_pool"):
+    """prometheus_collector.
+
+    Returns a collector of the pools metrics, to be registered on a
+    prometheus_client registry (``REGISTRY.register(collector)``).
+    """
+    # optional dependency
+    from prometheus_client.core import (  # pylint: disable=C0415
+        CounterMetricFamily,
+        GaugeMetricFamily,
+        HistogramMetricFamily,
+    )
+
+    class PoolCollector:
+        def collect(self):
+            labels = ["provider", "pool"]
+            gauges = {name: GaugeMetricFamily(f"{prefix}_{name}", f"Pool {name}", labels=labels) for name in GAUGES}
+            age = GaugeMetricFamily(f"{prefix}_connection_age_max_seconds", "Oldest connection age", labels=labels)
+            acquired = CounterMetricFamily(f"{prefix}_acquired", "Connections acquired", labels=labels)
+            failures = CounterMetricFamily(
+                f"{prefix}_failures", "Pool failures", labels=labels + ["exception"]
+            )
+            latency = HistogramMetricFamily(
+                f"{prefix}_acquire_seconds", "Acquire latency", labels=labels
+            )
+            for pool in pools:
+                stats = pool.metrics()
+                values = [stats["provider"], stats["name"]]
+                for name, gauge in gauges.items():
+                    if stats.get(name) is not None:
+                        gauge.add_metric(values, stats[name])
+                age.add_metric(values, stats["connection_age"]["max"])
+                acquired.add_metric(values, stats["acquired"])
+                for exc, count in stats["failures"].items():
+                    failures.add_metric(values + [exc], count)
+                histogram = pool._metrics.acquire_latency  # pylint: disable=W0212
+                latency.add_metric(
+                    values,
+                    [("+Inf" if math.isinf(bound) else str(bound), total) for bound, total in histogram.cumulative()],
+                    histogram.sum,
+                )
+            yield from gauges.values()
+            yield from (age, acquired, failures, latency)
+
+    return PoolCollector()
+
+
+def otel_observe(meter: Any, *pools, prefix: str = "asyncdb.pool") -> list:
+    """otel_observe.
+
+    Registers observable instruments of the pools on an OpenTelemetry meter,
+    returns the instruments.
+    """
+    # optional dependency
+    from opentelemetry.metrics import Observation  # pylint: disable=C0415
+
+    def _gauge(name: str):
+        def callback(options):  # pylint: disable=W0613
+            for pool in pools:
+                stats = pool.metrics()
+                if (value := stats.get(name)) is not None:
+                    yield Observation(value, {"provider": stats["provider"], "pool": stats["name"]})
+        return callback
+
+    def _counter(getter):
+        def callback(options):  # pylint: disable=W0613
+            for pool in pools:
+                stats = pool.metrics()
+                yield Observation(getter(stats), {"provider": stats["provider"], "pool": stats["name"]})
+        return callback
+
+    instruments = [
+        meter.create_observable_gauge(f"{prefix}.{name}", callbacks=[_gauge(name)]) for name in GAUGES
+    ]
+    instruments.extend([
+        meter.create_observable_counter(
+            f"{prefix}.acquired", callbacks=[_counter(lambda stats: stats["acquired"])]
+        ),
+        meter.create_observable_counter(
+            f"{prefix}.acquire.duration", unit="s",
+            callbacks=[_counter(lambda stats: stats["acquire_latency"]["sum"])]
+        ),
+        meter.create_observable_counter(
+            f"{prefix}.failures", callbacks=[_counter(lambda stats: sum(stats["failures"].values()))]
+        ),
+        meter.create_observable_gauge(
+            f"{prefix}.connection.age", unit="s", callbacks=[_counter(lambda stats: stats["connection_age"]["max"])]
+        ),
+    ])
+    return instruments
@@ -1,4 +1,6 @@
+import sys
 import logging
+from typing import Any
 from importlib import import_module
 
 
@@ -17,3 +19,48 @@ def module_exists(module_name, classpath):
         except ImportError as e:
             logging.exception(f"No Driver for provider {module_name} was found: {e}")
             raise ImportError(f"No Provider {module_name} Found") from e
+
+
+### Driver Registry
+# Resolved driver classes (``pg``, ``pgPool``, ``sqliteCursor``, ...),
+# populated on first use, so importing asyncdb never imports a driver module.
+_drivers: dict[str, Any] = {}
+
+
+def register_driver(name: str, obj: Any) -> None:
+    """register_driver.
+
+    Register (or override) the class returned for a driver name.
+    """
+    _drivers[name] = obj
+
+
+def load_driver(driver: str, suffix: str = "") -> Any:
+    """load_driver.
+
+    Returns the class ``{driver}{suffix}`` from ``asyncdb.drivers.{driver}``,
+    importing the driver module only the first time it is requested.
+    """
+    name = f"{driver}{suffix}"
+    try:
+        return _drivers[name]
+    except KeyError:
+        pass
+    obj = module_exists(name, f"asyncdb.drivers.{driver}")
+    _drivers[name] = obj
+    return obj
+
+
+def lazy_isinstance(obj: Any, classpath: str) -> bool:
+    """lazy_isinstance.
+
+    isinstance() check against a class given by its dotted path
+    (ex: "pandas.DataFrame") that never imports the module:
+    if the module was never imported, obj cannot be one of its instances.
+    """
+    module_name, _, clsname = classpath.rpartition(".")
+    module = sys.modules.get(module_name)
+    if module is None:
+        return False
+    cls = getattr(module, clsname, None)
+    return cls is not None and isinstance(obj, cls)
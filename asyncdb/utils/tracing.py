@@ -0,0 +1,371 @@
+"""
+Query Tracing.
+
+Instrumentation of the driver calls (query, queryrow, execute, fetch_*):
+every call is a QuerySpan (normalized statement, rows, bytes, database
+and serializer time, error) passed to the hooks of a Tracer, which keeps
+HDR-style latency histograms, logs the slow queries and (optionally)
+emits OpenTelemetry spans.
+
+Usage:
+    tracer = Tracer(slow_query=0.5, otel=True)
+    db = AsyncDB("pg", params=params, tracer=tracer)
+    # or, for every driver created afterwards:
+    set_tracer(tracer)
+    ...
+    tracer.stats()
+"""
+import asyncio
+import contextvars
+import functools
+import logging
+import re
+import time
+from collections.abc import Callable, Iterable
+from typing import Any, Optional
+from .metrics import HdrHistogram
+
+
+TRACED_METHODS = (
+    "query",
+    "queryrow",
+    "execute",
+    "execute_many",
+    "executemany",
+    "fetch_all",
+    "fetch_one",
+    "fetch_many",
+    "fetchval",
+    "fetchrow",
+)
+# methods returning [result, error].
+RESULT_ERROR_METHODS = {"query", "queryrow", "execute", "execute_many", "executemany"}
+
+# span of the running call (serializer time is added to it).
+_current: contextvars.ContextVar = contextvars.ContextVar("asyncdb_span", default=None)
+_default: Optional["Tracer"] = None
+
+_literals = re.compile(
+    r"'(?:[^']|'')*'"  # strings
+    r"|\b\d+(?:\.\d+)?(?:[eE][-+]?\d+)?\b"  # numbers
+    r"|\$\d+|%s|%\(\w+\)s|:\w+"  # placeholders
+)
+_in_lists = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_spaces = re.compile(r"\s+")
+
+
+@functools.lru_cache(maxsize=2048)
+def _normalize(sentence: str) -> str:
+    sentence = _literals.sub("?", sentence)
+    sentence = _in_lists.sub("(?)", sentence)
+    return _spaces.sub(" ", sentence).strip()
+
+
+def normalize(sentence: Any, max_length: int = 2048) -> str:
+    """normalize.
+
+    Statement without literals nor placeholders (replaced by ``?``), whitespace collapsed.
+    """
+    if sentence is None:
+        return ""
+    if not isinstance(sentence, str):
+        sentence = str(sentence)
+    if len(sentence) > max_length:
+        sentence = sentence[:max_length]
+    return _normalize(sentence)
+
+
+def result_size(result: Any) -> tuple:
+    """result_size.
+
+    (rows, bytes) of a result, None when unknown (bytes are only known for
+    serialized or columnar results).
+    """
+    if result is None:
+        return 0, None
+    if isinstance(result, (str, bytes)):
+        return None, len(result)
+    if isinstance(result, (list, tuple)):
+        return len(result), None
+    if (rows := getattr(result, "num_rows", None)) is not None:
+        # arrow
+        return rows, getattr(result, "nbytes", None)
+    if callable(estimated := getattr(result, "estimated_size", None)):
+        # polars
+        return len(result), estimated()
+    if callable(memory := getattr(result, "memory_usage", None)):
+        # pandas
+        try:
+            return len(result), int(memory(index=True).sum())
+        except (TypeError, ValueError, AttributeError):
+            return len(result), None
+    if callable(getattr(result, "keys", None)):
+        # a single row
+        return 1, None
+    return None, None
+
+
+class QuerySpan:
+    """QuerySpan.
+
+    One call of a driver method.
+    """
+
+    __slots__ = (
+        "provider",
+        "method",
+        "statement",
+        "started",
+        "duration",
+        "serialize_time",
+        "rows",
+        "bytes",
+        "error",
+    )
+
+    def __init__(self, provider: str, method: str, statement: str):
+        self.provider: str = provider
+        self.method: str = method
+        self.statement: str = statement
+        self.started: float = time.perf_counter()
+        self.duration: float = 0.0
+        self.serialize_time: float = 0.0
+        self.rows: Optional[int] = None
+        self.bytes: Optional[int] = None
+        self.error: Optional[str] = None
+
+    @property
+    def db_time(self) -> float:
+        return max(0.0, self.duration - self.serialize_time)
+
+    def as_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__} | {"db_time": self.db_time}
+
+    def __repr__(self) -> str:
+        return f"<QuerySpan {self.provider}.{self.method} {self.duration:.6f}s rows={self.rows}>"
+
+
+class _Stats:
+    __slots__ = ("calls", "errors", "rows", "bytes", "latency", "serialize")
+
+    def __init__(self):
+        self.calls: int = 0
+        self.errors: int = 0
+        self.rows: int = 0
+        self.bytes: int = 0
+        self.latency = HdrHistogram()
+        self.serialize = HdrHistogram()
+
+    def as_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "rows": self.rows,
+            "bytes": self.bytes,
+            "latency": self.latency.as_dict(),
+            "serialize": self.serialize.as_dict(),
+        }
+
+
+class _TimedSerializer:
+    """Serializer of a traced driver, adding its time to the running span."""
+
+    __slots__ = ("__wrapped__",)
+
+    def __init__(self, serializer: Callable):
+        self.__wrapped__ = serializer
+
+    async def __call__(self, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return await self.__wrapped__(*args, **kwargs)
+        finally:
+            if (span := _current.get()) is not None:
+                span.serialize_time += time.perf_counter() - started
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.__wrapped__, name)
+
+
+class _TimedOutput(_TimedSerializer):
+    """Fast-path output (identity or synchronous format) of a traced driver."""
+
+    __slots__ = ()
+
+    def __call__(self, *args, **kwargs):  # pylint: disable=W0236
+        started = time.perf_counter()
+        try:
+            return self.__wrapped__(*args, **kwargs)
+        finally:
+            if (span := _current.get()) is not None:
+                span.serialize_time += time.perf_counter() - started
+
+
+class Tracer:
+    """Tracer.
+
+    Records a QuerySpan for every traced call of the bound drivers.
+
+    Args:
+        slow_query: seconds over which a call is logged as a slow query (None disables it).
+        otel: an OpenTelemetry tracer, or True for ``trace.get_tracer("asyncdb")``.
+        hooks: callables receiving every finished QuerySpan.
+        histograms: keep the latency histograms of every provider and method.
+        logger: logger of the slow queries.
+    """
+
+    def __init__(
+        self,
+        slow_query: Optional[float] = None,
+        otel: Any = None,
+        hooks: Iterable[Callable] = (),
+        histograms: bool = True,
+        logger: Optional[logging.Logger] = None
+    ):
+        self.slow_query: Optional[float] = slow_query
+        self.histograms: bool = histograms
+        self._hooks: list = list(hooks)
+        self._stats: dict[tuple, _Stats] = {}
+        self._logger = logger or logging.getLogger(name=__name__)
+        if otel is True:
+            # optional dependency
+            from opentelemetry import trace  # pylint: disable=C0415
+
+            otel = trace.get_tracer("asyncdb")
+        self._otel = otel or None
+
+    def add_hook(self, hook: Callable) -> None:
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook: Callable) -> None:
+        self._hooks.remove(hook)
+
+    def bind(self, driver: Any, methods: Iterable[str] = TRACED_METHODS) -> Any:
+        """bind.
+
+        Trace the methods of a driver instance (and time its serializer).
+        """
+        for name in methods:
+            method = getattr(driver, name, None)
+            if method is not None and asyncio.iscoroutinefunction(method):
+                setattr(driver, name, self._wrap(driver, name, method))
+        self._timed(driver)
+        output_format = driver.output_format
+
+        @functools.wraps(output_format)
+        def traced_format(*args, **kwargs):
+            result = output_format(*args, **kwargs)
+            self._timed(driver)
+            return result
+
+        driver.output_format = traced_format
+        driver._tracer = self  # pylint: disable=W0212
+        return driver
+
+    def _timed(self, driver: Any) -> None:
+        serializer = getattr(driver, "_serializer", None)
+        if serializer is not None and not isinstance(serializer, _TimedSerializer):
+            driver._serializer = _TimedSerializer(serializer)  # pylint: disable=W0212
+        output = getattr(driver, "_output_sync", None)
+        if output is not None and not isinstance(output, _TimedOutput):
+            driver._output_sync = _TimedOutput(output)  # pylint: disable=W0212
+
+    def timed(self, serializer: Callable, output: Optional[Callable] = None) -> tuple:
+        """(serializer, fast path) adding their time to the running span."""
+        return _TimedSerializer(serializer), _TimedOutput(output) if output is not None else None
+
+    def _wrap(self, driver: Any, name: str, method: Callable) -> Callable:
+        has_error = name in RESULT_ERROR_METHODS
+
+        @functools.wraps(method)
+        async def traced(sentence: Any = None, *args, **kwargs):
+            span = QuerySpan(driver._provider, name, normalize(sentence))  # pylint: disable=W0212
+            token = _current.set(span)
+            otel_span = self._otel.start_span(f"{span.provider}.{name}") if self._otel else None
+            try:
+                result = await method(sentence, *args, **kwargs)
+            except BaseException as err:
+                span.error = f"{type(err).__name__}: {err}"
+                raise
+            else:
+                value = result
+                if has_error and isinstance(result, (list, tuple)) and len(result) == 2:
+                    value, error = result
+                    if error:
+                        span.error = str(error)
+                if name.startswith("execute") and isinstance(value, str):
+                    # command status (ex: "INSERT 0 5")
+                    tail = value.rsplit(" ", 1)[-1]
+                    span.rows = int(tail) if tail.isdigit() else None
+                else:
+                    span.rows, span.bytes = result_size(value)
+                return result
+            finally:
+                span.duration = time.perf_counter() - span.started
+                _current.reset(token)
+                if otel_span is not None:
+                    self._otel_finish(otel_span, span)
+                self.finish(span)
+
+        return traced
+
+    def _otel_finish(self, otel_span: Any, span: QuerySpan) -> None:
+        otel_span.set_attribute("db.system", span.provider)
+        otel_span.set_attribute("db.operation", span.method)
+        otel_span.set_attribute("db.statement", span.statement)
+        otel_span.set_attribute("asyncdb.serialize_time", span.serialize_time)
+        if span.rows is not None:
+            otel_span.set_attribute("asyncdb.rows", span.rows)
+        if span.error:
+            # optional dependency
+            from opentelemetry.trace import Status, StatusCode  # pylint: disable=C0415
+
+            otel_span.set_status(Status(StatusCode.ERROR, span.error))
+        otel_span.end()
+
+    def finish(self, span: QuerySpan) -> None:
+        """finish.
+
+        Records a finished span: histograms, slow query log and hooks.
+        """
+        if self.histograms:
+            key = (span.provider, span.method)
+            if (stats := self._stats.get(key)) is None:
+                stats = self._stats[key] = _Stats()
+            stats.calls += 1
+            stats.latency.record(span.duration)
+            stats.serialize.record(span.serialize_time)
+            if span.error:
+                stats.errors += 1
+            stats.rows += span.rows or 0
+            stats.bytes += span.bytes or 0
+        if self.slow_query is not None and span.duration >= self.slow_query:
+            self._logger.warning(
+                f"Slow query on {span.provider}.{span.method} ({span.duration:.3f}s, "
+                f"db: {span.db_time:.3f}s, serializer: {span.serialize_time:.3f}s): {span.statement}"
+            )
+        for hook in self._hooks:
+            try:
+                hook(span)
+            except Exception as err:  # pylint: disable=W0703
+                self._logger.error(f"Tracer: error on hook {hook!r}: {err}")
+
+    def stats(self) -> dict:
+        """Calls, errors, rows, bytes and latency histograms by provider and method."""
+        return {f"{provider}.{method}": stats.as_dict() for (provider, method), stats in self._stats.items()}
+
+    def reset(self) -> None:
+        self._stats.clear()
+
+
+def set_tracer(tracer: Optional[Tracer]) -> None:
+    """set_tracer.
+
+    Default tracer of the drivers created afterwards (None disables it).
+    """
+    global _default  # pylint: disable=W0603
+    _default = tracer
+
+
+def get_tracer() -> Optional[Tracer]:
+    return _default
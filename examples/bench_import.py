@@ -0,0 +1,76 @@
+"""
+Import-time benchmark.
+
+Measures the cold-start cost of importing asyncdb and loading a single
+driver, each run in a fresh interpreter, and reports which heavy
+optional dependencies were pulled in along the way.
+
+usage: python examples/bench_import.py [driver ...] [--runs N]
+"""
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+
+HEAVY_MODULES = (
+    "pandas",
+    "pyarrow",
+    "polars",
+    "google.cloud.bigquery",
+)
+
+SNIPPET = """
+import sys, time, json
+started = time.perf_counter()
+from asyncdb import AsyncDB
+{load}
+elapsed = time.perf_counter() - started
+print(json.dumps({{
+    "elapsed": elapsed,
+    "loaded": [m for m in {heavy!r} if m in sys.modules]
+}}))
+"""
+
+
+def measure(driver: str = None, runs: int = 5) -> dict:
+    load = f"AsyncDB({driver!r})" if driver else ""
+    code = SNIPPET.format(load=load, heavy=HEAVY_MODULES)
+    timings = []
+    loaded = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            check=True,
+            capture_output=True,
+            text=True
+        )
+        data = json.loads(out.stdout.strip().splitlines()[-1])
+        timings.append(data["elapsed"])
+        loaded = data["loaded"]
+    return {
+        "median": statistics.median(timings),
+        "best": min(timings),
+        "loaded": loaded
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="asyncdb import-time benchmark")
+    parser.add_argument("drivers", nargs="*", default=["pg"])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    targets = [None] + args.drivers
+    for driver in targets:
+        name = driver or "asyncdb"
+        result = measure(driver, runs=args.runs)
+        heavy = ", ".join(result["loaded"]) or "none"
+        print(
+            f"{name:>12}: median {result['median'] * 1000:8.1f} ms, "
+            f"best {result['best'] * 1000:8.1f} ms, heavy modules: {heavy}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Small-query throughput benchmark.
+
+Measures the per-call cost of the output formats: the serializer alone
+(fast path vs. awaiting the serializer coroutine), and single-row queries
+on an in-memory database.
+
+usage: python examples/bench_queries.py [format ...] [--driver sqlite] [--calls N]
+"""
+import time
+import asyncio
+import argparse
+from asyncdb import AsyncDB
+
+
+ROW = {"id": 1, "name": "Widget", "price": 9.99}
+
+
+async def serializer(db, calls: int) -> tuple:
+    result = [ROW]
+    started = time.perf_counter()
+    for _ in range(calls):
+        await db._serializer(result, None)  # pylint: disable=W0212
+    slow = time.perf_counter() - started
+    fast = None
+    if (output := getattr(db, "_output_sync", None)) is not None:
+        started = time.perf_counter()
+        for _ in range(calls):
+            output(result, None)
+        fast = time.perf_counter() - started
+    return slow, fast
+
+
+async def lookups(db, calls: int) -> float:
+    sentence = "SELECT 1 AS id, 'Widget' AS name, 9.99 AS price"
+    started = time.perf_counter()
+    for _ in range(calls):
+        await db.query(sentence)
+    return time.perf_counter() - started
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="asyncdb small-query benchmark")
+    parser.add_argument("formats", nargs="*", default=["native", "iterable", "record", "json"])
+    parser.add_argument("--driver", default="sqlite")
+    parser.add_argument("--calls", type=int, default=20000)
+    args = parser.parse_args()
+    params = {"database": ":memory:"}
+    async with await AsyncDB(args.driver, params=params).connection() as db:
+        # rows as dicts, for every format.
+        db.row_format("iterable")
+        for frmt in args.formats:
+            db.output_format(frmt)
+            slow, fast = await serializer(db, args.calls)
+            elapsed = await lookups(db, args.calls)
+            fast_path = f"{fast / args.calls * 1e9:8.0f} ns" if fast is not None else "     n/a"
+            print(
+                f"{frmt:>10}: serializer {slow / args.calls * 1e9:8.0f} ns, fast path {fast_path}, "
+                f"query {args.calls / elapsed:10.0f} calls/s"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
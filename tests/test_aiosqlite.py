@@ -2,6 +2,7 @@ import asyncio
 import pytest
 import polars as pl
 from asyncdb import AsyncDB
+from asyncdb.models import Model, Column
 from asyncdb.meta.record import Record
 from asyncdb.meta.recordset import Recordset
 import aiosqlite
@@ -247,5 +248,83 @@ async def test_formats(event_loop):
         await db.close()
 
 
+async def test_stream(event_loop):
+    db = AsyncDB(DRIVER, params=PARAMS, loop=event_loop)
+    try:
+        async with await db.connection() as conn:
+            sql = (
+                "WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c WHERE x < 2500) "
+                "SELECT x AS id, 'item' AS name FROM c"
+            )
+            sizes = [len(batch) async for batch in conn.stream(sql, batch_size=1000)]
+            pytest.assume(sizes == [1000, 1000, 500])
+            async for batch in conn.stream(sql, batch_size=1000, format='polars'):
+                pytest.assume(type(batch) == pl.DataFrame)
+                pytest.assume(batch.columns == ['id', 'name'])
+    finally:
+        await db.close()
+
+
+async def test_call_format(event_loop):
+    db = AsyncDB(DRIVER, params=PARAMS, loop=event_loop)
+    async with await db.connection() as conn:
+        conn.row_format('iterable')
+        sql = "SELECT 1 AS id, 'Widget' AS name"
+        frames, texts, rows = await asyncio.gather(
+            conn.query(sql, format='polars'),
+            conn.query(sql, format='json'),
+            conn.query(sql),
+        )
+        pytest.assume(isinstance(frames[0], pl.DataFrame))
+        pytest.assume(texts[0] == '[{"id":1,"name":"Widget"}]')
+        pytest.assume(rows[0] == [{"id": 1, "name": "Widget"}])
+        # the output format of the driver is unchanged.
+        pytest.assume(conn._serializer == conn.output)
+
+
 def pytest_sessionfinish(session, exitstatus):
     asyncio.get_event_loop().close()
+
+
+class City(Model):
+    code: str = Column(primary_key=True)
+    name: str
+    population: int
+
+    class Meta:
+        name: str = 'cities'
+
+
+class Visit(Model):
+    id: int = Column(primary_key=True, db_default=True)
+    city: str
+
+    class Meta:
+        name: str = 'visits'
+
+
+async def test_model_create(event_loop):
+    db = AsyncDB(DRIVER, params=PARAMS, loop=event_loop)
+    try:
+        async with await db.connection() as conn:
+            await conn.execute("CREATE TABLE cities (code TEXT PRIMARY KEY, name TEXT, population INTEGER)")
+            await conn.execute("CREATE TABLE visits (id INTEGER PRIMARY KEY AUTOINCREMENT, city TEXT)")
+            City.Meta.set_connection(conn)
+            Visit.Meta.set_connection(conn)
+            data = [{"code": f"C{i:02}", "name": f"City {i}", "population": i} for i in range(10)]
+            created = await City.create(data)
+            # rows are matched to their records by primary key.
+            pytest.assume([(c.code, c.name) for c in created] == [(d["code"], d["name"]) for d in data])
+            data = [
+                {"code": "C01", "name": "First", "population": 100},
+                {"code": "C99", "name": "Last", "population": 99},
+            ]
+            created = await City.create(data, upsert=True)
+            pytest.assume([(c.code, c.population) for c in created] == [("C01", 100), ("C99", 99)])
+            result, error = await conn.query("SELECT count(*) AS n FROM cities")
+            pytest.assume(not error and result[0][0] == 11)
+            # keys generated by the database: one row at a time.
+            visits = await Visit.create([{"city": "C01"}, {"city": "C02"}, {"city": "C03"}])
+            pytest.assume([(v.id, v.city) for v in visits] == [(1, "C01"), (2, "C02"), (3, "C03")])
+    finally:
+        await db.close()
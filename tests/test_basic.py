@@ -1,5 +1,13 @@
 import asyncio
+import time
 import pytest
+from asyncdb.utils.executors import (
+    get_executor,
+    concurrency_slot,
+    set_concurrency_limit,
+    executor_stats
+)
+from asyncdb import AsyncDB
 from .conftest import (
     conn,
     pooler
@@ -54,5 +62,66 @@ async def test_connection(conn, event_loop):
         pytest.assume(dict(result[0]) == {'?column?': 1})
 
 
+async def test_shared_executor(event_loop):
+    executor = get_executor("thread")
+    assert executor is get_executor("thread")
+    executor.shutdown()  # shared: a driver cannot stop it
+    active = []
+
+    def blocking():
+        active.append(1)
+        peak = len(active)
+        time.sleep(0.02)
+        active.pop()
+        return peak
+
+    async def call():
+        async with concurrency_slot("test", executor):
+            return await event_loop.run_in_executor(executor, blocking)
+
+    set_concurrency_limit("test", 2)
+    try:
+        submitted = executor.submitted
+        peaks = await asyncio.gather(*[call() for _ in range(8)])
+        assert max(peaks) <= 2
+        stats = executor_stats()["executors"]["thread"]
+        assert stats["submitted"] - submitted == 8
+        assert stats["active"] == 0 and stats["queued"] == 0
+    finally:
+        set_concurrency_limit("test", None)
+
+
+async def test_output_fast_path(event_loop):
+    db = AsyncDB("duckdb", params={"database": ":memory:"}, loop=event_loop)
+    async with await db.connection() as conn:
+        # native: the result is returned as is.
+        pytest.assume(conn._output_sync is not None)
+        result, error = await conn.query("SELECT 1 AS one")
+        pytest.assume(result == [(1,)] and error is None)
+        conn.output_format("record")
+        pytest.assume(conn._output_sync == conn._serializer.convert)
+        conn.output_format("pandas")
+        pytest.assume(conn._output_sync is None)
+
+
+async def test_timing_by_task(event_loop):
+    db = AsyncDB("duckdb", params={"database": ":memory:"}, loop=event_loop)
+
+    async def timed(delay: float):
+        db.start_timing()
+        await asyncio.sleep(delay)
+        return db.generated_at().total_seconds()
+
+    slow, fast = await asyncio.gather(timed(0.2), timed(0.05))
+    pytest.assume(slow > 0.15 and fast < 0.15)
+    other = AsyncDB("duckdb", params={"database": ":memory:"}, loop=event_loop)
+    other.start_timing()
+    # the last start_timing of this task belongs to another driver.
+    started = db.start_timing()
+    other.start_timing()
+    pytest.assume(db.generated_at() is not None)
+    pytest.assume(db.generated_at(started) is not None)
+
+
 def pytest_sessionfinish(session, exitstatus):
     asyncio.get_event_loop().close()
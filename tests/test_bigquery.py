@@ -102,5 +102,25 @@ async def test_bigquery_operations(event_loop):
     # Test closing connection
     assert not bq.is_connected(), "Closing connection failed"
 
+
+async def test_stream(conn):
+    query = """
+        SELECT word, word_count
+        FROM `bigquery-public-data.samples.shakespeare`
+        LIMIT 2500
+    """
+    # concurrent queries run on the executor
+    results = await asyncio.gather(*[conn.query(query, factory='tuple') for _ in range(4)])
+    for result, error in results:
+        pytest.assume(not error)
+        pytest.assume(len(result) == 2500)
+    sizes = [len(page) async for page in conn.stream(query, batch_size=1000)]
+    pytest.assume(sum(sizes) == 2500)
+    rows = 0
+    async for batch in conn.stream(query, batch_size=1000, format='arrow'):
+        pytest.assume(batch.column_names == ['word', 'word_count'])
+        rows += batch.num_rows
+    pytest.assume(rows == 2500)
+
 def pytest_sessionfinish(session, exitstatus):
     asyncio.get_event_loop().close()
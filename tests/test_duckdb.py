@@ -1,7 +1,14 @@
 import asyncio
+import contextlib
+import json
 import pytest
 import polars as pl
-from asyncdb import AsyncDB
+import pyarrow as pa
+import pyarrow.parquet as pq
+from asyncdb import AsyncDB, AsyncPool
+from asyncdb.drivers.outputs.output import OutputFactory
+from asyncdb.exceptions import DriverError, TooManyConnections
+from asyncdb.utils.tracing import Tracer
 from asyncdb.meta.record import Record
 from asyncdb.meta.recordset import Recordset
 
@@ -102,10 +109,17 @@ async def test_formats(event_loop):
 
             # Polars
             conn.output_format('polars')
-            result, error = await conn.query("SELECT * FROM products")
-            # pytest.assume(not error)
-            # pytest.assume(type(result) == pl.DataFrame)
-            # pytest.assume(result['name'][0] == 'Widget')
+            result, error = await conn.query("SELECT * FROM products ORDER BY id")
+            pytest.assume(not error)
+            pytest.assume(type(result) == pl.DataFrame)
+            pytest.assume(result['name'][0] == 'Widget')
+
+            # per-call formats are shared by every driver: they keep no result.
+            for frmt in ('arrow', 'polars', 'pandas'):
+                result, error = await conn.query("SELECT * FROM products ORDER BY id", format=frmt)
+                pytest.assume(not error and len(result) == 2)
+                serializer, _ = OutputFactory.shared(conn, frmt)
+                pytest.assume(not hasattr(serializer, "_result"))
 
             # Pandas
             # conn.output_format('pandas')
@@ -123,5 +137,286 @@ async def test_formats(event_loop):
     finally:
         await db.close()
 
+
+async def test_stream(event_loop):
+    db = AsyncDB(DRIVER, params=PARAMS, loop=event_loop)
+    try:
+        async with await db.connection() as conn:
+            sql = (
+                "WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c WHERE x < 2500) "
+                "SELECT x AS id, 'item' AS name FROM c"
+            )
+            sizes = [len(batch) async for batch in conn.stream(sql, batch_size=1000)]
+            pytest.assume(sizes == [1000, 1000, 500])
+            async for batch in conn.stream(sql, batch_size=1000, format='polars'):
+                pytest.assume(type(batch) == pl.DataFrame)
+                pytest.assume(batch.columns == ['id', 'name'])
+            # the stream runs on its own cursor: other calls run between batches.
+            sizes = []
+            async for batch in conn.stream(sql, batch_size=1000):
+                row, error = await conn.queryrow("SELECT 1 AS one")
+                pytest.assume(not error and row[0] == 1)
+                sizes.append(len(batch))
+            pytest.assume(sizes == [1000, 1000, 500])
+            # a stream left before its end (without aclose) does not block the connection.
+            async for batch in conn.stream(sql, batch_size=1000):
+                break
+            row = await asyncio.wait_for(conn.fetch_one("SELECT 1 AS one"), 1)
+            pytest.assume(row[0] == 1)
+            await conn.execute("CREATE TABLE streamed AS SELECT * FROM range(5)")
+            rows = [row async for batch in conn.stream("SELECT * FROM streamed", batch_size=2) for row in batch]
+            pytest.assume(len(rows) == 5)
+            # an empty result is not an error.
+            result, error = await conn.query("SELECT * FROM range(10) WHERE range > 20")
+            pytest.assume(not error)
+            pytest.assume(not result)
+    finally:
+        await db.close()
+
+
+async def test_offload_timeout(event_loop):
+    db = AsyncDB(DRIVER, params=PARAMS, loop=event_loop)
+    slow = "SELECT sum(a.range * b.range) FROM range(100000) a, range(100000) b"
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    try:
+        async with await db.connection() as conn:
+            task = asyncio.create_task(ticker())
+            # interrupted after timeout, the loop keeps running meanwhile
+            result, error = await conn.query(slow, timeout=0.3)
+            task.cancel()
+            pytest.assume(result is None)
+            pytest.assume("interrupted" in str(error))
+            pytest.assume(ticks > 10)
+            # a cancelled query is interrupted too
+            query = asyncio.create_task(conn.query(slow))
+            await asyncio.sleep(0.1)
+            query.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await query
+            result, error = await conn.query("SELECT 1")
+            pytest.assume(not error)
+            pytest.assume(result[0][0] == 1)
+    finally:
+        await db.close()
+
+
+async def test_pool(event_loop, tmp_path):
+    pool = AsyncPool(
+        DRIVER, params={"database": str(tmp_path / "pool.duckdb")}, loop=event_loop, max_clients=2, acquire_timeout=0.2
+    )
+    await pool.connect()
+    try:
+        await pool.execute("CREATE TABLE items AS SELECT * FROM range(10)")
+
+        async def count():
+            async with await pool.acquire() as conn:
+                result, error = await conn.query("SELECT count(*) FROM items")
+                await asyncio.sleep(0.05)
+                return result[0][0]
+
+        pytest.assume(await asyncio.gather(*[count() for _ in range(6)]) == [10] * 6)
+        pytest.assume(pool.size == 2)
+        held = [await pool.acquire() for _ in range(2)]
+        with pytest.raises(TooManyConnections):
+            await pool.acquire()
+        for conn in held:
+            await pool.release(conn)
+        result, error = await pool.test_connection()
+        pytest.assume(not error)
+    finally:
+        await pool.close()
+    pytest.assume(pool.size == 0)
+
+
+async def test_pool_idle(event_loop, tmp_path):
+    # an in-memory database is private to its connection: one connection.
+    pool = AsyncPool(DRIVER, params=PARAMS, loop=event_loop, max_clients=4)
+    await pool.connect()
+    try:
+        await pool.execute("CREATE TABLE items AS SELECT * FROM range(10)")
+        result, error = await pool.query("SELECT count(*) FROM items")
+        pytest.assume(not error and result[0][0] == 10)
+        pytest.assume(pool._pool_stats()["max_clients"] == 1)
+    finally:
+        await pool.close()
+    # idle connections over min_size expire without any release.
+    pool = AsyncPool(
+        DRIVER, params={"database": str(tmp_path / "idle.duckdb")}, loop=event_loop,
+        min_size=1, max_clients=3, max_inactive_timeout=0.2
+    )
+    await pool.connect()
+    try:
+        held = [await pool.acquire() for _ in range(3)]
+        for conn in held:
+            await pool.release(conn)
+        pytest.assume(pool.size == 3)
+        await asyncio.sleep(0.5)
+        pytest.assume(pool.size == 1)
+    finally:
+        await pool.close()
+
+
+async def test_pool_cancel(event_loop, tmp_path):
+    # a task cancelled while acquiring gives its slot (and the connection checked) back.
+    pool = AsyncPool(
+        DRIVER, params={"database": str(tmp_path / "cancel.duckdb")}, loop=event_loop,
+        min_size=0, max_clients=2, acquire_timeout=0.2, health_check=0
+    )
+    await pool.connect()
+    opening, checking = pool._open_, pool._healthy
+
+    async def slow_open():
+        await asyncio.sleep(0.2)
+        return await opening()
+
+    async def slow_check(db):
+        await asyncio.sleep(0.2)
+        return await checking(db)
+
+    async def cancelled_acquire():
+        task = asyncio.create_task(pool.acquire())
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    try:
+        pool._open_ = slow_open
+        await cancelled_acquire()
+        pool._open_ = opening
+        held = [await pool.acquire() for _ in range(2)]
+        for conn in held:
+            await pool.release(conn)
+        pytest.assume(pool.size == 2)
+        pool._healthy = slow_check
+        await cancelled_acquire()
+        pool._healthy = checking
+        pytest.assume(pool.size == 2)
+        # the pending statements of a stopped (or failed) iteration are cancelled while acquiring.
+        await pool.execute("CREATE TABLE items AS SELECT * FROM range(10)")
+        delays = []
+
+        async def uneven_check(db):
+            await asyncio.sleep(delays.pop(0) if delays else 0)
+            return await checking(db)
+
+        pool._healthy = uneven_check
+        delays[:] = [0.05, 0.5]
+        async with contextlib.aclosing(pool.iter_queries(["SELECT 1", "SELECT 2"], concurrency=2)) as rows:
+            async for idx, result in rows:
+                break
+        delays[:] = [0, 0.5]
+        with pytest.raises(DriverError):
+            async for idx, result in pool.iter_queries(
+                ["SELECT missing", "SELECT 2"], concurrency=2, method="fetch_all", return_exceptions=False
+            ):
+                pass
+        pool._healthy = checking
+        pytest.assume(pool.size == 2)
+        held = [await pool.acquire() for _ in range(2)]
+        for conn in held:
+            await pool.release(conn)
+        results = await pool.map_queries(["SELECT count(*) FROM items"] * 3)
+        pytest.assume([result[0][0] for result, _ in results] == [10] * 3)
+        stats = pool.metrics()
+        pytest.assume(stats["in_use"] == 0 and stats["acquired"] == stats["released"])
+    finally:
+        await pool.close()
+
+
+async def test_pool_metrics(event_loop, tmp_path):
+    pool = AsyncPool(
+        DRIVER, params={"database": str(tmp_path / "metrics.duckdb")}, loop=event_loop,
+        max_clients=1, acquire_timeout=0.1, pool_name="analytics"
+    )
+    await pool.connect()
+    try:
+        conn = await pool.acquire()
+        stats = pool.metrics()
+        pytest.assume(stats["name"] == "analytics")
+        pytest.assume(stats["in_use"] == 1 and stats["idle"] == 0)
+        with pytest.raises(TooManyConnections):
+            await pool.acquire()
+        await pool.release(conn)
+        stats = pool.metrics()
+        pytest.assume(stats["in_use"] == 0 and stats["idle"] == 1)
+        pytest.assume(stats["acquired"] == 1 and stats["released"] == 1)
+        pytest.assume(stats["failures"] == {"TooManyConnections": 1})
+        pytest.assume(stats["acquire_latency"]["count"] == 1)
+        pytest.assume(stats["opened"] == 1 and stats["connection_age"]["max"] > 0)
+    finally:
+        await pool.close()
+
+
+async def test_tracing(event_loop, caplog):
+    spans = []
+    tracer = Tracer(slow_query=0, hooks=[spans.append])
+    db = AsyncDB(DRIVER, params=PARAMS, loop=event_loop, tracer=tracer)
+    async with await db.connection() as conn:
+        result, error = await conn.query("SELECT * FROM range(5) WHERE range > 1")
+        pytest.assume(not error)
+        result, error = await conn.query("SELECT * FROM missing_table")
+        pytest.assume(error)
+    span = spans[0]
+    pytest.assume(span.statement == "SELECT * FROM range(?) WHERE range > ?")
+    pytest.assume(span.rows == 3)
+    pytest.assume(0 < span.serialize_time <= span.duration)
+    pytest.assume(spans[1].error is not None)
+    stats = tracer.stats()["duckdb.query"]
+    pytest.assume(stats["calls"] == 2 and stats["errors"] == 1)
+    pytest.assume(stats["latency"]["p50"] > 0)
+    pytest.assume("Slow query on duckdb.query" in caplog.text)
+
+
+async def test_stream_encoded(event_loop):
+    db = AsyncDB(DRIVER, params=PARAMS, loop=event_loop)
+    sql = "SELECT range AS id, 'item' AS name FROM range(2500)"
+    async with await db.connection() as conn:
+        chunks = [chunk async for chunk in conn.stream_encoded(sql, batch_size=1000, format='json')]
+        pytest.assume(len(chunks) == 5)  # "[", 3 batches, "]"
+        rows = json.loads(b"".join(chunks))
+        pytest.assume(len(rows) == 2500 and rows[0] == {"id": 0, "name": "item"})
+        chunks = [chunk async for chunk in conn.stream_encoded(sql, batch_size=1000, format='ndjson')]
+        lines = b"".join(chunks).splitlines()
+        pytest.assume(len(lines) == 2500 and json.loads(lines[-1])["id"] == 2499)
+
+
+async def test_csv_export(event_loop, tmp_path):
+    db = AsyncDB(DRIVER, params=PARAMS, loop=event_loop)
+    sql = "SELECT range AS id, 'a, b' AS name, NULL AS missing FROM range(2500)"
+    async with await db.connection() as conn:
+        result, error = await conn.query("SELECT 1 AS id, 'a, b' AS name", format='csv')
+        pytest.assume(not error)
+        pytest.assume(result == 'column_0,column_1\n1,"a, b"\n')
+        path = tmp_path / "export.tsv"
+        written = await conn.export(sql, path, batch_size=1000, format='tsv')
+        lines = path.read_text().splitlines()
+        pytest.assume(written == path.stat().st_size)
+        pytest.assume(lines[0] == "id\tname\tmissing" and lines[1] == "0\ta, b\t")
+        pytest.assume(len(lines) == 2501)
+
+
+async def test_parquet_export(event_loop, tmp_path):
+    db = AsyncDB(DRIVER, params=PARAMS, loop=event_loop)
+    sql = "SELECT range AS id, 'item' AS name FROM range(2500)"
+    async with await db.connection() as conn:
+        path = tmp_path / "export.parquet"
+        await conn.export(sql, path, batch_size=1000, format='parquet', row_group_size=2000, compression='zstd')
+        metadata = pq.ParquetFile(path).metadata
+        pytest.assume(metadata.num_rows == 2500)
+        pytest.assume([metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)] == [2000, 500])
+        result, error = await conn.query(sql, format='ipc')
+        pytest.assume(not error)
+        table = pa.ipc.open_file(result).read_all()
+        pytest.assume(table.num_rows == 2500 and table.column_names == ['id', 'name'])
+
+
 def pytest_sessionfinish(session, exitstatus):
     asyncio.get_event_loop().close()
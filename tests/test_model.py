@@ -150,5 +150,94 @@ async def test_airport_model(db):
             pytest.assume(isinstance(airport, Model))
             pytest.assume(hasattr(airport, 'iata'))
 
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("db")
+async def test_bulk_create(db):
+    async with await db.connection() as conn:
+        Airport.Meta.set_connection(conn)
+        data = [
+            {"iata": f"{i:03x}", "airport": f"Airport {i}", "city": "City", "country": "Country"}
+            for i in range(2500)
+        ]
+        created = await Airport.create(data[:1500])
+        assert len(created) == 1500
+        assert created[-1].iata == "5db"
+        created = await Airport.create(data[1500:], returning=False)
+        assert len(created) == 1000
+        airports = await Airport.filter(country='Country')
+        assert len(airports) == 2500
+
+
+@pytest.mark.usefixtures("db")
+async def test_bulk_upsert(db):
+    async with await db.connection() as conn:
+        Airport.Meta.set_connection(conn)
+        await Airport.create([
+            {"iata": "MAD", "airport": "Barajas", "city": "Madrid", "country": "Spain"},
+            {"iata": "BCN", "airport": "El Prat", "city": "Barcelona", "country": "Spain"},
+        ])
+        data = [
+            {"iata": "ORY", "airport": "Orly", "city": "Paris", "country": "France"},
+            {"iata": "MAD", "airport": "Adolfo Suarez", "city": "Madrid", "country": "Spain"},
+        ]
+        created = await Airport.create(data, upsert=True)
+        assert [a.airport for a in created] == ["Orly", "Adolfo Suarez"]
+        madrid = await Airport.get(iata="MAD")
+        assert madrid.airport == "Adolfo Suarez"
+        assert len(await Airport.filter(country='Spain')) == 2
+        await Airport.create([{**data[0], "city": "Orly"}], returning=False, upsert=True)
+        assert (await Airport.get(iata="ORY")).city == "Orly"
+
+
+@pytest.mark.usefixtures("db")
+async def test_filter_params(db):
+    async with await db.connection() as conn:
+        Airport.Meta.set_connection(conn)
+        await Airport.create([
+            {"iata": "MAD", "airport": "Barajas", "city": "Madrid", "country": "Spain"},
+            {"iata": "BCN", "airport": "El Prat", "city": "Barcelona", "country": "Spain"},
+            {"iata": "ORY", "airport": "Orly", "city": "Paris", "country": "France"},
+        ])
+        spain = await Airport.filter(country='Spain')
+        assert len(spain) == 2
+        stats = conn.statement_cache_stats()
+        france = await Airport.filter(country='France')
+        assert [a.iata for a in france] == ['ORY']
+        # same filter shape, same prepared statement
+        assert conn.statement_cache_stats()["hits"] == stats["hits"] + 1
+        # values are never interpolated
+        assert await Airport.filter(country="Spain' OR '1'='1") == []
+        airports = await Airport.filter(
+            where={"$or": [{"city": {"$in": ["Madrid", "Paris"]}}, {"iata": {"$like": "B%"}}]}
+        )
+        assert sorted(a.iata for a in airports) == ['BCN', 'MAD', 'ORY']
+        airports = await Airport.filter(where={"country": "Spain", "iata": {"$nin": ["MAD"]}})
+        assert [a.iata for a in airports] == ['BCN']
+
+
+@pytest.mark.usefixtures("db")
+async def test_model_plan(db):
+    async with await db.connection() as conn:
+        Airport.Meta.set_connection(conn)
+        airport = Airport(iata="LIS", airport="Humberto Delgado", city="Lisbon", country="Portugal")
+        await airport.insert()
+        plan = conn._model_plan_(airport)
+        assert plan is conn._model_plan_(Airport)
+        assert plan.table == "airports"
+        assert plan.primary_keys == ("iata",)
+        airport.city = "Lisboa"
+        await airport.update()
+        assert (await Airport.get(iata="LIS")).city == "Lisboa"
+        await airport.delete()
+        assert await Airport.filter(iata="LIS") == []
+        # rebuilt when Meta changes
+        schema = Airport.Meta.schema
+        Airport.Meta.schema = "public"
+        try:
+            assert conn._model_plan_(Airport).table == "public.airports"
+        finally:
+            Airport.Meta.schema = schema
+
+
 def pytest_sessionfinish(session, exitstatus):
     asyncio.get_event_loop().close()